@@ -16,9 +16,13 @@ from dotenv import load_dotenv
 
 from fantasy_tools import TOOL_FUNCTIONS, TOOLS
 from modules.agent_orchestrator import AgentOrchestrator
+from modules.data_store import DataStore
 from modules.logger import AgentLogger
 from modules.prefetch_registry import PrefetchRegistry
 from modules.system_prompt_builder import SystemPromptBuilder
+from modules.tool_executor import ToolExecutor
+from modules.yahoo_auth import start_token_refresh
+from modules.yahoo_scheduler import get_yahoo_scheduler
 
 # Load environment variables
 load_dotenv()
@@ -99,10 +103,13 @@ ANALYSIS PRINCIPLES:
 - Balance hot streaks vs established value
 - Check recommendation history for context and make new high-conviction picks if the opportunity is there
 
+DATA HANDLES:
+Roster, schedule, player and droppable results come with a "handle" (e.g., schedule#1, players#2). Pass handles to assess_droppable_players and find_streaming_matches instead of re-sending the data; a list of handles (e.g., ["players#1", "players#2"]) combines player lists.
+
 TASK:
 1. Check recommendation_history for context on recent picks
 2. Assess which roster players are droppable using assess_droppable_players tool (returns list of droppable Player models)
-3. Find optimal streaming matches using find_streaming_matches tool with droppable players, available players, and schedule
+3. Find optimal streaming matches using find_streaming_matches tool with droppable players, available players, schedule, and roster (games started reflect daily lineup limits; its plan chains moves across the window within the 4 weekly acquisitions)
 4. Think through a streaming strategy step by step and come up with a plan for streaming players to maximize games played
 5. Format your plan into a simple HTML email with the following structure:
   - STREAMING STRATEGY: Must provide exact dates that will maximize total games played
@@ -115,12 +122,16 @@ TASK:
     return builder.build(prefetch_data)
 
 
-def prefetch_static_data(registry: PrefetchRegistry) -> dict[str, Any]:
+def prefetch_static_data(
+    registry: PrefetchRegistry, data_store: DataStore | None = None
+) -> dict[str, Any]:
     """
     Pre-fetch data using the configured registry.
 
     Args:
         registry: Configured PrefetchRegistry
+        data_store: If given, results of handle-producing tools are stored and
+            embedded as handle payloads
 
     Returns:
         Dictionary mapping data_key -> tool result
@@ -134,6 +145,14 @@ def prefetch_static_data(registry: PrefetchRegistry) -> dict[str, Any]:
     try:
         data = registry.execute_all()
 
+        # Store producer results so the agent can pass them by handle
+        if data_store is not None:
+            for tool_name in registry.get_tool_names():
+                data_key = registry.get_metadata(tool_name)["data_key"]
+                kind = ToolExecutor.HANDLE_KINDS.get(tool_name)
+                if kind and data_key in data:
+                    data[data_key] = data_store.publish(kind, data[data_key])
+
         # Serialize Pydantic models
         from pydantic import BaseModel
 
@@ -158,6 +177,7 @@ def run_agent(
     prefetch_data: dict[str, Any] | None = None,
     verbose: bool = True,
     dry_run: bool = False,
+    data_store: DataStore | None = None,
 ) -> str:
     """
     Run the fantasy hockey agent with the given prompt.
@@ -168,6 +188,7 @@ def run_agent(
         prefetch_data: Optional pre-fetched data to embed in system prompt
         verbose: Print conversation details
         dry_run: If True, skip sending emails and saving recommendations
+        data_store: Per-run store holding prefetched and tool results by handle
 
     Returns:
         Final response from Claude
@@ -194,6 +215,7 @@ def run_agent(
         model=MODEL,
         dry_run=dry_run,
         verbose=verbose,
+        data_store=data_store,
     )
 
     return orchestrator.run()
@@ -223,14 +245,20 @@ def main():
         logger.error("Please add it to your .env file")
         return
 
+    # Refresh the Yahoo token in the background while the rest of startup runs
+    start_token_refresh()
+
     # Setup prefetch registry
     prefetch_registry = setup_prefetch_registry()
 
+    # Run-scoped store for results passed by handle
+    data_store = DataStore()
+
     # Pre-fetch static data unless skipped
     prefetch_data = None
     if not args.skip_prefetch:
         try:
-            prefetch_data = prefetch_static_data(prefetch_registry)
+            prefetch_data = prefetch_static_data(prefetch_registry, data_store)
             logger.info("Pre-fetch successful - data will be cached in system prompt")
         except Exception as e:
             logger.warning(f"Pre-fetch failed: {e}")
@@ -247,11 +275,13 @@ def main():
         prefetch_data=prefetch_data,
         verbose=True,
         dry_run=args.dry_run,
+        data_store=data_store,
     )
 
     logger.info("Analysis complete!")
     logger.info(result)
 
+    get_yahoo_scheduler().log_metrics()
     AgentLogger.print_usage_summary()
 
 
@@ -1,21 +1,31 @@
 """Shared data models for Fantasy Hockey tools."""
 
 from models.game import Game
+from models.game_matrix import GameMatrix
 from models.league import LeagueContext
 from models.player import Player, PlayerQuality
-from models.roster import Roster, RosterCounts
+from models.roster import LeagueSnapshot, Roster, RosterCounts
 from models.schedule import Schedule, TeamSchedule
-from models.streaming import StreamingOpportunity, StreamingRecommendation
+from models.streaming import (
+    StreamingMove,
+    StreamingOpportunity,
+    StreamingPlan,
+    StreamingRecommendation,
+)
 
 __all__ = [
     "Game",
+    "GameMatrix",
     "LeagueContext",
+    "LeagueSnapshot",
     "Player",
     "PlayerQuality",
     "Roster",
     "RosterCounts",
     "Schedule",
+    "StreamingMove",
     "StreamingOpportunity",
+    "StreamingPlan",
     "StreamingRecommendation",
     "TeamSchedule",
 ]
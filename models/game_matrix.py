@@ -0,0 +1,135 @@
+"""Columnar team x day game matrix built from a Schedule."""
+
+from array import array
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from modules.team_utils import NHL_TEAMS
+
+if TYPE_CHECKING:
+    from models.schedule import Schedule
+
+
+class GameMatrix:
+    """
+    Team x day view of a schedule for array-based game counting.
+
+    Every NHL team has a row of one byte per day in the schedule window, even
+    without games in it: ``played`` marks days with a game and ``home`` marks
+    home games. Prefix counts and
+    per-week/per-day aggregates are computed once at construction, so game
+    counts over any day range are O(1) lookups instead of loops over Game
+    objects.
+
+    Rows are bytearrays, so whole-row operations (sum, bytes.count, slicing)
+    run at C speed without an external array library.
+    """
+
+    def __init__(self, schedule: "Schedule"):
+        """
+        Build the matrix from a schedule.
+
+        Args:
+            schedule: Schedule model to index
+        """
+        start = datetime.strptime(schedule.start_date, "%Y-%m-%d")
+        end = datetime.strptime(schedule.end_date, "%Y-%m-%d")
+        num_days = (end - start).days + 1
+
+        self.dates: list[str] = [
+            (start + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(num_days)
+        ]
+        self.date_index: dict[str, int] = {date: i for i, date in enumerate(self.dates)}
+
+        self.teams: list[str] = sorted(NHL_TEAMS.keys() | {team.abbr for team in schedule.teams})
+        self.team_index: dict[str, int] = {abbr: i for i, abbr in enumerate(self.teams)}
+
+        self.played: list[bytearray] = [bytearray(num_days) for _ in self.teams]
+        self.home: list[bytearray] = [bytearray(num_days) for _ in self.teams]
+
+        for team in schedule.teams:
+            row = self.team_index[team.abbr]
+            for game in team.games:
+                day = self.date_index.get(game.date)
+                if day is None:
+                    continue
+                self.played[row][day] = 1
+                if game.is_home:
+                    self.home[row][day] = 1
+
+        self.week_of_day: list[int] = self._week_of_day(schedule, start)
+        self.num_weeks: int = max(self.week_of_day, default=-1) + 1
+
+        # cumulative[row][d] = games on days [0, d)
+        self.cumulative: list[array] = []
+        for played_row in self.played:
+            prefix = array("i", [0]) * (num_days + 1)
+            for day, played in enumerate(played_row):
+                prefix[day + 1] = prefix[day] + played
+            self.cumulative.append(prefix)
+
+        self.games_per_team: list[int] = [prefix[-1] for prefix in self.cumulative]
+        self.games_per_team_by_week: list[list[int]] = [
+            self._games_by_week(played_row) for played_row in self.played
+        ]
+        # Each game counts twice here, once for each team playing in it
+        self.teams_playing_per_day: list[int] = [
+            sum(played_row[day] for played_row in self.played) for day in range(num_days)
+        ]
+
+        # Off-nights: at most half the league plays, so pickups rarely hit the bench
+        half_league = len(self.teams) / 2
+        self.off_nights: bytearray = bytearray(
+            1 if 0 < count <= half_league else 0 for count in self.teams_playing_per_day
+        )
+
+    def _week_of_day(self, schedule: "Schedule", start: datetime) -> list[int]:
+        """Map each day to its 0-indexed fantasy week."""
+        if schedule.week_info:
+            week_of_day = [0] * len(self.dates)
+            for week_idx, week in enumerate(schedule.week_info):
+                for day, date in enumerate(self.dates):
+                    if week.start <= date <= week.end:
+                        week_of_day[day] = week_idx
+            return week_of_day
+
+        # Fall back to Monday-Sunday weeks counted from the start date
+        return [(start.weekday() + day) // 7 for day in range(len(self.dates))]
+
+    def _games_by_week(self, played_row: bytearray) -> list[int]:
+        """Count games per fantasy week for a single team row."""
+        counts = [0] * self.num_weeks
+        for day, played in enumerate(played_row):
+            counts[self.week_of_day[day]] += played
+        return counts
+
+    def row(self, team_abbr: str) -> int | None:
+        """Get the matrix row for a team, or None if the abbreviation is unknown."""
+        return self.team_index.get(team_abbr)
+
+    def games_between(self, team_abbr: str, first_day: int, last_day: int) -> int:
+        """
+        Count a team's games between two day indexes.
+
+        Args:
+            team_abbr: Team abbreviation
+            first_day: First day index (inclusive)
+            last_day: Last day index (inclusive)
+
+        Returns:
+            Number of games (0 if team is unknown or range is empty)
+        """
+        row = self.team_index.get(team_abbr)
+        first_day = max(first_day, 0)
+        last_day = min(last_day, len(self.dates) - 1)
+        if row is None or last_day < first_day:
+            return 0
+        prefix = self.cumulative[row]
+        return prefix[last_day + 1] - prefix[first_day]
+
+    def off_night_games(self, team_abbr: str) -> int:
+        """Count a team's games that fall on off-nights."""
+        row = self.team_index.get(team_abbr)
+        if row is None:
+            return 0
+        return sum(p & o for p, o in zip(self.played[row], self.off_nights, strict=True))
@@ -1,9 +1,9 @@
 """Player data models."""
 
 from enum import Enum
-from typing import ClassVar
+from typing import Any, ClassVar
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 
 class PlayerPosition(str, Enum):
@@ -18,6 +18,54 @@ class PlayerPosition(str, Enum):
     UTILITY = "U"  # Utility slot (any skater)
 
 
+# One bit per position, so eligibility checks are single bitwise ANDs
+POSITION_BITS: dict[PlayerPosition, int] = {
+    position: 1 << i for i, position in enumerate(PlayerPosition)
+}
+
+FORWARD_MASK = (
+    POSITION_BITS[PlayerPosition.CENTER]
+    | POSITION_BITS[PlayerPosition.LEFT_WING]
+    | POSITION_BITS[PlayerPosition.RIGHT_WING]
+    | POSITION_BITS[PlayerPosition.FORWARD]
+)
+SKATER_MASK = (
+    FORWARD_MASK | POSITION_BITS[PlayerPosition.DEFENSE] | POSITION_BITS[PlayerPosition.UTILITY]
+)
+GOALIE_MASK = POSITION_BITS[PlayerPosition.GOALIE]
+
+# Lineup slots (F, D, U, G) each position can fill, as position bits
+_FORWARD_SLOTS = POSITION_BITS[PlayerPosition.FORWARD] | POSITION_BITS[PlayerPosition.UTILITY]
+_DEFENSE_SLOTS = POSITION_BITS[PlayerPosition.DEFENSE] | POSITION_BITS[PlayerPosition.UTILITY]
+SLOT_BITS_BY_POSITION: dict[PlayerPosition, int] = {
+    PlayerPosition.CENTER: _FORWARD_SLOTS,
+    PlayerPosition.LEFT_WING: _FORWARD_SLOTS,
+    PlayerPosition.RIGHT_WING: _FORWARD_SLOTS,
+    PlayerPosition.FORWARD: _FORWARD_SLOTS,
+    PlayerPosition.DEFENSE: _DEFENSE_SLOTS,
+    PlayerPosition.UTILITY: POSITION_BITS[PlayerPosition.UTILITY],
+    PlayerPosition.GOALIE: POSITION_BITS[PlayerPosition.GOALIE],
+}
+
+
+def streaming_class_mask(position: PlayerPosition | None) -> int:
+    """
+    Get the streaming compatibility class of a position as a bitmask.
+
+    Goalies only stream for goalies and skaters for skaters, so two positions
+    are compatible when their class masks share a bit.
+
+    Examples:
+        >>> streaming_class_mask(PlayerPosition.CENTER) == SKATER_MASK
+        True
+        >>> streaming_class_mask(None)
+        0
+    """
+    if not position:
+        return 0
+    return GOALIE_MASK if position == PlayerPosition.GOALIE else SKATER_MASK
+
+
 class PlayerStatus(str, Enum):
     """Player injury/availability status."""
 
@@ -115,6 +163,12 @@ class Player(BaseModel):
         description="Quality assessment (populated when needed for drop decisions)",
     )
 
+    # Bitmasks derived from position fields (see POSITION_BITS)
+    _position_bit: int = PrivateAttr(default=0)
+    _position_mask: int = PrivateAttr(default=0)
+    _slot_mask: int = PrivateAttr(default=0)
+    _streaming_mask: int = PrivateAttr(default=0)
+
     @field_validator("quality_assessment", mode="before")
     @classmethod
     def validate_quality_assessment(cls, value):
@@ -145,6 +199,40 @@ class Player(BaseModel):
             }
         }
 
+    def model_post_init(self, context: Any, /) -> None:
+        """Precompute position bitmasks for fast eligibility checks."""
+        positions = set(self.eligible_positions)
+        if self.position:
+            positions.add(self.position)
+
+        self._position_bit = POSITION_BITS[self.position] if self.position else 0
+        self._position_mask = 0
+        self._slot_mask = 0
+        for position in positions:
+            self._position_mask |= POSITION_BITS[position]
+            self._slot_mask |= SLOT_BITS_BY_POSITION[position]
+        self._streaming_mask = streaming_class_mask(self.position)
+
+    @property
+    def position_bit(self) -> int:
+        """Bit of the primary position (0 if unknown)."""
+        return self._position_bit
+
+    @property
+    def position_mask(self) -> int:
+        """Bits of the primary and all eligible positions."""
+        return self._position_mask
+
+    @property
+    def slot_mask(self) -> int:
+        """Bits of the lineup slots (F, D, U, G) the player can fill."""
+        return self._slot_mask
+
+    @property
+    def streaming_mask(self) -> int:
+        """Streaming compatibility class bits (goalie or skater, 0 if unknown)."""
+        return self._streaming_mask
+
     def is_goalie(self) -> bool:
         """Check if player is a goalie."""
         return self.position == PlayerPosition.GOALIE
@@ -6,7 +6,14 @@ from typing import ClassVar
 from pydantic import BaseModel, Field
 
 from models.league import LeagueContext
-from models.player import Player, PlayerPosition
+from models.player import (
+    FORWARD_MASK,
+    GOALIE_MASK,
+    POSITION_BITS,
+    Player,
+    PlayerPosition,
+    RosterSlot,
+)
 
 
 class RosterCounts(BaseModel):
@@ -42,6 +49,21 @@ class RosterCounts(BaseModel):
             }
         }
 
+    @classmethod
+    def from_players(cls, players: list[Player]) -> "RosterCounts":
+        """Count a roster's players by position and status."""
+        defense_bit = POSITION_BITS[PlayerPosition.DEFENSE]
+
+        return cls(
+            total=len(players),
+            forwards=len([p for p in players if p.position_bit & FORWARD_MASK]),
+            defense=len([p for p in players if p.position_bit & defense_bit]),
+            goalies=len([p for p in players if p.position_bit & GOALIE_MASK]),
+            active=len([p for p in players if p.is_active()]),
+            bench=len([p for p in players if p.selected_position == RosterSlot.BENCH]),
+            injured_reserve=len([p for p in players if p.is_on_ir()]),
+        )
+
 
 class Roster(BaseModel):
     """Complete roster information for a fantasy team."""
@@ -50,6 +72,10 @@ class Roster(BaseModel):
         default=None,
         description="Fantasy team ID",
     )
+    team_name: str | None = Field(
+        default=None,
+        description="Fantasy team name",
+    )
     league_context: LeagueContext | None = Field(
         default=None,
         description="League information",
@@ -117,17 +143,12 @@ class Roster(BaseModel):
         Returns:
             List of players with that position
         """
-        return [p for p in self.players if p.position == position]
+        position_bit = POSITION_BITS[position]
+        return [p for p in self.players if p.position_bit & position_bit]
 
     def get_forwards(self) -> list[Player]:
         """Get all forward players (C, LW, RW, F)."""
-        forward_positions = [
-            PlayerPosition.CENTER,
-            PlayerPosition.LEFT_WING,
-            PlayerPosition.RIGHT_WING,
-            PlayerPosition.FORWARD,
-        ]
-        return [p for p in self.players if p.position in forward_positions]
+        return [p for p in self.players if p.position_bit & FORWARD_MASK]
 
     def get_defensemen(self) -> list[Player]:
         """Get all defensemen."""
@@ -152,3 +173,47 @@ class Roster(BaseModel):
             if player.name.lower() == name_lower:
                 return player
         return None
+
+
+class LeagueSnapshot(BaseModel):
+    """Every team's roster in a league, fetched together."""
+
+    league_context: LeagueContext | None = Field(
+        default=None,
+        description="League information",
+    )
+    retrieved_at: str = Field(
+        default_factory=lambda: datetime.now().isoformat(),
+        description="Timestamp when the snapshot was retrieved",
+    )
+    user_team_id: str | None = Field(
+        default=None,
+        description="Team ID owned by the authenticated Yahoo user",
+    )
+    rosters: list[Roster] = Field(
+        description="Rosters of all teams in the league",
+        default_factory=list,
+    )
+
+    def get_roster(self, team_id: str | int | None = None) -> Roster | None:
+        """
+        Get a team's roster.
+
+        Args:
+            team_id: Fantasy team ID (defaults to the user's team, or the first team)
+
+        Returns:
+            Roster if the team is in the snapshot, None otherwise
+        """
+        team_id = str(team_id) if team_id is not None else self.user_team_id
+        if team_id is None:
+            return self.rosters[0] if self.rosters else None
+        for roster in self.rosters:
+            if roster.team_id == team_id:
+                return roster
+        return None
+
+    def get_opponent_rosters(self, team_id: str | int | None = None) -> list[Roster]:
+        """Get every roster except a team's own (defaults to the user's team)."""
+        own = self.get_roster(team_id)
+        return [roster for roster in self.rosters if roster is not own]
@@ -1,11 +1,13 @@
 """Schedule data models."""
 
+from bisect import bisect_left, bisect_right
 from datetime import datetime
-from typing import ClassVar
+from typing import Any, ClassVar
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 from models.game import Game
+from models.game_matrix import GameMatrix
 
 
 class WeekInfo(BaseModel):
@@ -33,7 +35,12 @@ class WeekInfo(BaseModel):
 
 
 class TeamSchedule(BaseModel):
-    """Schedule for a single NHL team."""
+    """
+    Schedule for a single NHL team.
+
+    Games are indexed by date once at construction, so date range queries are
+    answered with binary search instead of scanning every game.
+    """
 
     abbr: str = Field(
         description="Team abbreviation (e.g., 'TOR', 'EDM')",
@@ -54,6 +61,9 @@ class TeamSchedule(BaseModel):
         default_factory=list,
     )
 
+    _sorted_games: list[Game] = PrivateAttr(default_factory=list)
+    _sorted_dates: list[str] = PrivateAttr(default_factory=list)
+
     class Config:
         populate_by_name = True
         json_schema_extra: ClassVar = {
@@ -68,18 +78,35 @@ class TeamSchedule(BaseModel):
             }
         }
 
-    def games_in_period(self, start_date: str, end_date: str) -> list[Game]:
+    def model_post_init(self, context: Any, /) -> None:
+        """Build the date index used by range queries."""
+        self._sorted_games = sorted(self.games, key=lambda g: g.date)
+        self._sorted_dates = [game.date for game in self._sorted_games]
+
+    def _period_bounds(self, start_date: str | None, end_date: str | None) -> tuple[int, int]:
+        """Get index bounds into the sorted games for an inclusive date range."""
+        lo = bisect_left(self._sorted_dates, start_date) if start_date else 0
+        hi = bisect_right(self._sorted_dates, end_date) if end_date else len(self._sorted_dates)
+        return lo, max(lo, hi)
+
+    def games_in_period(self, start_date: str | None, end_date: str | None) -> list[Game]:
         """
         Get games within a specific date range.
 
         Args:
-            start_date: Start date in YYYY-MM-DD format (inclusive)
-            end_date: End date in YYYY-MM-DD format (inclusive)
+            start_date: Start date in YYYY-MM-DD format (inclusive, None for no lower bound)
+            end_date: End date in YYYY-MM-DD format (inclusive, None for no upper bound)
 
         Returns:
-            List of games in the date range
+            List of games in the date range, sorted by date
         """
-        return [game for game in self.games if start_date <= game.date <= end_date]
+        lo, hi = self._period_bounds(start_date, end_date)
+        return self._sorted_games[lo:hi]
+
+    def games_count_in_period(self, start_date: str | None, end_date: str | None) -> int:
+        """Count games within a specific date range without building a list."""
+        lo, hi = self._period_bounds(start_date, end_date)
+        return hi - lo
 
     def games_after_date(self, date: str) -> list[Game]:
         """
@@ -89,17 +116,21 @@ class TeamSchedule(BaseModel):
             date: Date in YYYY-MM-DD format (exclusive)
 
         Returns:
-            List of games after the date
+            List of games after the date, sorted by date
         """
-        return [game for game in self.games if game.date > date]
+        return self._sorted_games[bisect_right(self._sorted_dates, date) :]
 
     def games_count_after_date(self, date: str) -> int:
         """Count how many games are after a specific date."""
-        return len(self.games_after_date(date))
+        return len(self._sorted_dates) - bisect_right(self._sorted_dates, date)
 
 
 class Schedule(BaseModel):
-    """Complete schedule data for all NHL teams over a period."""
+    """
+    Complete schedule data for all NHL teams over a period.
+
+    Teams are indexed by abbreviation once at construction for O(1) lookup.
+    """
 
     weeks: int = Field(
         description="Number of fantasy weeks covered",
@@ -121,6 +152,13 @@ class Schedule(BaseModel):
         description="Schedule for each NHL team",
         default_factory=list,
     )
+    missing_dates: list[str] = Field(
+        description="Dates whose games could not be fetched (unknown, not game-free)",
+        default_factory=list,
+    )
+
+    _team_index: dict[str, int] = PrivateAttr(default_factory=dict)
+    _game_matrix: GameMatrix | None = PrivateAttr(default=None)
 
     @field_validator("start_date", "end_date")
     @classmethod
@@ -149,6 +187,12 @@ class Schedule(BaseModel):
             }
         }
 
+    def model_post_init(self, context: Any, /) -> None:
+        """Build the team abbreviation index."""
+        self._team_index = {}
+        for i, team in enumerate(self.teams):
+            self._team_index.setdefault(team.abbr, i)
+
     def get_team_schedule(self, team_abbr: str) -> TeamSchedule | None:
         """
         Get schedule for a specific team.
@@ -159,10 +203,49 @@ class Schedule(BaseModel):
         Returns:
             TeamSchedule if found, None otherwise
         """
-        for team in self.teams:
-            if team.abbr == team_abbr:
-                return team
-        return None
+        index = self._team_index.get(team_abbr)
+        return self.teams[index] if index is not None else None
+
+    def game_matrix(self) -> GameMatrix:
+        """
+        Get the columnar team x day game matrix for this schedule.
+
+        Built on first use and cached for the lifetime of the model.
+
+        Returns:
+            GameMatrix with per-team game rows and cached aggregates
+        """
+        if self._game_matrix is None:
+            self._game_matrix = GameMatrix(self)
+        return self._game_matrix
+
+    def compact_summary(self) -> dict[str, Any]:
+        """
+        Get a compact JSON-compatible view of the schedule.
+
+        Keeps each team's game counts and game dates but drops per-game
+        details, which is enough for the agent to reason about the window.
+
+        Returns:
+            Dictionary with the window, per-team totals, weekly counts and dates,
+            and the dates that could not be fetched (if any)
+        """
+        summary = {
+            "weeks": self.weeks,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "teams": {
+                team.abbr: {
+                    "total": team.total_games,
+                    "by_week": team.games_by_week,
+                    "dates": [game.date for game in team.games_in_period(None, None)],
+                }
+                for team in self.teams_sorted_by_games()
+            },
+        }
+        if self.missing_dates:
+            summary["missing_dates"] = self.missing_dates
+        return summary
 
     def teams_sorted_by_games(self) -> list[TeamSchedule]:
         """Get teams sorted by total games (descending)."""
@@ -44,6 +44,16 @@ class StreamingOpportunity(BaseModel):
         default=None,
         description="Date of pickup player's next game (YYYY-MM-DD format)",
     )
+    games_started_before: int | None = Field(
+        default=None,
+        description="Roster games started over the window without this move (needs roster)",
+        ge=0,
+    )
+    games_started_after: int | None = Field(
+        default=None,
+        description="Roster games started over the window after this move (needs roster)",
+        ge=0,
+    )
     reasoning: str = Field(
         description="Human-readable explanation of the streaming opportunity",
     )
@@ -85,6 +95,78 @@ class StreamingOpportunity(BaseModel):
         }
 
 
+class StreamingMove(BaseModel):
+    """A single drop/pickup within a multi-move streaming plan."""
+
+    drop_player: Player = Field(
+        description="Player to drop (a roster player or an earlier pickup)",
+    )
+    pickup_player: Player = Field(
+        description="Player to pick up from free agents",
+    )
+    drop_date: str = Field(
+        description="Date to drop player, after that day's games (YYYY-MM-DD format)",
+        pattern=r"^\d{4}-\d{2}-\d{2}$",
+    )
+    pickup_date: str = Field(
+        description="First date the pickup player's games count (YYYY-MM-DD format)",
+        pattern=r"^\d{4}-\d{2}-\d{2}$",
+    )
+    week: int = Field(
+        description="Fantasy week (1-indexed) the acquisition counts against",
+        ge=1,
+    )
+    pickup_games: int = Field(
+        description="Games the pickup player plays before being dropped or the window ends",
+        ge=0,
+    )
+
+
+class StreamingPlan(BaseModel):
+    """Chain of streaming moves that maximizes games under weekly acquisition limits."""
+
+    moves: list[StreamingMove] = Field(
+        description="Moves in the order they should be made",
+        default_factory=list,
+    )
+    total_games: int = Field(
+        description="Total games from the planned roster spots",
+        ge=0,
+    )
+    baseline_games: int = Field(
+        description="Games if every droppable player is kept",
+        ge=0,
+    )
+    improvement: int = Field(
+        description="Extra games gained vs keeping every droppable player",
+        ge=0,
+    )
+    acquisitions_per_week: list[int] = Field(
+        description="Acquisitions the plan uses in each fantasy week",
+        default_factory=list,
+    )
+    max_acquisitions_per_week: int = Field(
+        description="Weekly acquisition limit the plan was built under",
+        ge=0,
+    )
+    summary: str = Field(
+        description="Human-readable summary of the plan",
+    )
+
+    class Config:
+        json_schema_extra: ClassVar = {
+            "example": {
+                "moves": [],
+                "total_games": 31,
+                "baseline_games": 24,
+                "improvement": 7,
+                "acquisitions_per_week": [3, 2],
+                "max_acquisitions_per_week": 4,
+                "summary": "5 moves for +7 games (31 vs 24 if kept). Acquisitions per week: 3, 2 (limit 4).",
+            }
+        }
+
+
 class StreamingRecommendation(BaseModel):
     """Complete streaming analysis with multiple opportunities."""
 
@@ -107,6 +189,20 @@ class StreamingRecommendation(BaseModel):
     summary: str = Field(
         description="Human-readable summary of analysis",
     )
+    timing_cache_hits: int = Field(
+        default=0,
+        description="Team-pair timing lookups served from the run's cache",
+        ge=0,
+    )
+    timing_cache_misses: int = Field(
+        default=0,
+        description="Team-pair timing lookups that had to be computed",
+        ge=0,
+    )
+    plan: StreamingPlan | None = Field(
+        default=None,
+        description="Best multi-move plan under the weekly acquisition limit",
+    )
 
     class Config:
         json_schema_extra: ClassVar = {
@@ -115,6 +211,8 @@ class StreamingRecommendation(BaseModel):
                 "total_opportunities": 5,
                 "droppable_players_analyzed": 4,
                 "pickup_candidates_analyzed": 100,
+                "timing_cache_hits": 180,
+                "timing_cache_misses": 24,
                 "summary": "Found 5 streaming opportunities to maximize games played. Best opportunity: Drop Frank Vatrano on 2024-10-15 (after 3 games), pick up Alex Lafreniere (4 games remaining) = 7 total games vs 4 if kept.",
             }
         }
@@ -2,11 +2,14 @@
 
 import json
 import logging
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from anthropic import Anthropic
 
+from modules.data_store import DataStore
 from modules.logger import AgentLogger
 from modules.message_handler import MessageHandler
 from modules.rate_limiter import RateLimiter
@@ -14,6 +17,9 @@ from modules.tool_executor import ToolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Maximum side-effect-free tools run in parallel within one turn (1 = sequential)
+AGENT_TOOL_WORKERS = int(os.getenv("AGENT_TOOL_WORKERS", "4"))
+
 
 class AgentOrchestrator:
     """
@@ -23,7 +29,7 @@ class AgentOrchestrator:
     - Make API calls to Claude
     - Handle rate limiting
     - Process assistant responses
-    - Execute tools
+    - Execute tools (side-effect-free tools of a turn in parallel)
     - Manage conversation flow
     """
 
@@ -37,6 +43,8 @@ class AgentOrchestrator:
         model: str = "claude-sonnet-4-20250514",
         dry_run: bool = False,
         verbose: bool = True,
+        data_store: DataStore | None = None,
+        max_tool_workers: int = AGENT_TOOL_WORKERS,
     ):
         """
         Initialize orchestrator.
@@ -50,6 +58,9 @@ class AgentOrchestrator:
             model: Model to use
             dry_run: If True, skip side-effect tools
             verbose: If True, log detailed info
+            data_store: Per-run store holding results passed by handle
+            max_tool_workers: Maximum tools run in parallel within a turn
+                (1 runs every tool sequentially)
         """
         self.client = client
         self.system_blocks = system_blocks
@@ -57,10 +68,11 @@ class AgentOrchestrator:
         self.model = model
         self.dry_run = dry_run
         self.verbose = verbose
+        self.max_tool_workers = max(1, max_tool_workers)
 
         self.rate_limiter = RateLimiter()
         self.message_handler = MessageHandler(initial_prompt)
-        self.tool_executor = ToolExecutor(tool_functions, dry_run)
+        self.tool_executor = ToolExecutor(tool_functions, dry_run, data_store)
 
         self.api_call_count = 0
 
@@ -157,21 +169,57 @@ class AgentOrchestrator:
 
         return "Agent completed without final response."
 
+    def _execute_batch(self, blocks: list[Any]) -> list[tuple[dict, float]]:
+        """
+        Execute side-effect-free tool blocks, in parallel when there are several.
+
+        Args:
+            blocks: tool_use blocks
+
+        Returns:
+            (tool result, execution time in ms) per block, in block order
+        """
+        workers = min(self.max_tool_workers, len(blocks))
+        if workers <= 1:
+            return [self.tool_executor.execute(block.name, block.input) for block in blocks]
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tool") as executor:
+            return list(
+                executor.map(
+                    lambda block: self.tool_executor.execute(block.name, block.input), blocks
+                )
+            )
+
     def _process_tool_blocks(self, tool_blocks: list[Any]) -> list[dict[str, Any]]:
         """
         Process tool use blocks and return tool results.
 
+        Side-effect-free tools run in parallel. Side-effect tools (email,
+        saving recommendations) run alone, after every tool requested before
+        them has finished, so they keep their sequential semantics. Results
+        are returned in block order.
+
         Args:
             tool_blocks: List of tool_use blocks
 
         Returns:
             List of tool result dictionaries
         """
-        tool_results = []
+        turn_start = time.time()
+        outcomes: list[tuple[dict, float]] = []
+        batch: list[Any] = []
 
         for block in tool_blocks:
-            tool_result, execution_time_ms = self.tool_executor.execute(block.name, block.input)
+            if block.name in ToolExecutor.SIDE_EFFECT_TOOLS:
+                outcomes.extend(self._execute_batch(batch))
+                batch = []
+                outcomes.append(self.tool_executor.execute(block.name, block.input))
+            else:
+                batch.append(block)
+        outcomes.extend(self._execute_batch(batch))
 
+        tool_results = []
+        for block, (tool_result, execution_time_ms) in zip(tool_blocks, outcomes, strict=True):
             AgentLogger.log_token_usage(
                 step=f"tool_{block.name}",
                 input_tokens=0,
@@ -187,4 +235,12 @@ class AgentOrchestrator:
                 }
             )
 
+        if self.verbose and len(tool_blocks) > 1:
+            turn_time_ms = (time.time() - turn_start) * 1000
+            total_time_ms = sum(execution_time_ms for _, execution_time_ms in outcomes)
+            logger.info(
+                f"Ran {len(tool_blocks)} tools in {turn_time_ms:.2f}ms "
+                f"({total_time_ms:.2f}ms of tool time)"
+            )
+
         return tool_results
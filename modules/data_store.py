@@ -0,0 +1,135 @@
+"""Per-run object store so tools can pass large results by handle."""
+
+import re
+import threading
+from typing import Any
+
+from pydantic import BaseModel
+
+from models.schedule import Schedule
+
+HANDLE_PATTERN = re.compile(r"^[a-z_]+#\d+$")
+
+
+def is_handle(value: Any) -> bool:
+    """
+    Check whether a value is a data handle string.
+
+    Examples:
+        >>> is_handle("schedule#1")
+        True
+        >>> is_handle("TOR")
+        False
+    """
+    return isinstance(value, str) and bool(HANDLE_PATTERN.match(value))
+
+
+class DataStore:
+    """
+    Per-run store of tool results addressable by short handles.
+
+    Responsibilities:
+    - Store producer tool results and hand out handles like 'schedule#1'
+    - Resolve handles (or lists of handles) in tool inputs back to objects
+    - Build the compact payload returned to the agent for a stored result
+    """
+
+    def __init__(self):
+        """Initialize empty store."""
+        self._objects: dict[str, Any] = {}
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def put(self, kind: str, obj: Any) -> str:
+        """
+        Store an object and return its handle.
+
+        Args:
+            kind: Handle prefix (e.g., 'schedule', 'roster')
+            obj: Object to store
+
+        Returns:
+            Handle string such as 'schedule#1'
+        """
+        with self._lock:
+            self._counters[kind] = self._counters.get(kind, 0) + 1
+            handle = f"{kind}#{self._counters[kind]}"
+            self._objects[handle] = obj
+        return handle
+
+    def get(self, handle: str) -> Any:
+        """
+        Get a stored object by handle.
+
+        Raises:
+            ValueError: If the handle is unknown
+        """
+        if handle not in self._objects:
+            raise ValueError(f"Unknown data handle: {handle}")
+        return self._objects[handle]
+
+    def resolve(self, value: Any) -> Any:
+        """
+        Resolve a handle, or a list of handles, to stored objects.
+
+        A list made up only of handles is resolved to the concatenation of the
+        stored lists, so results of several producer calls can be combined.
+        Any other value is returned unchanged.
+
+        Args:
+            value: Tool input value
+
+        Returns:
+            Stored object(s) or the original value
+        """
+        if is_handle(value):
+            return self.get(value)
+
+        if isinstance(value, list) and value and all(is_handle(item) for item in value):
+            combined = []
+            for item in value:
+                stored = self.get(item)
+                if isinstance(stored, list):
+                    combined.extend(stored)
+                else:
+                    combined.append(stored)
+            return combined
+
+        return value
+
+    def publish(self, kind: str, obj: Any) -> dict[str, Any]:
+        """
+        Store a result and build the payload returned to the agent.
+
+        Schedules are summarized (the full model stays in the store); other
+        results are returned in full next to their handle. Results carrying an
+        `incomplete` note (partial fetches) pass it on to the agent.
+
+        Args:
+            kind: Handle prefix
+            obj: Tool result (Pydantic model, list of models, or JSON data)
+
+        Returns:
+            Dictionary with 'handle' plus 'summary' or 'data', and 'incomplete'
+            if the result is partial
+        """
+        handle = self.put(kind, obj)
+
+        if isinstance(obj, Schedule):
+            return {"handle": handle, "summary": obj.compact_summary()}
+
+        if isinstance(obj, BaseModel):
+            data = obj.model_dump(mode="json")
+        elif isinstance(obj, list):
+            data = [
+                item.model_dump(mode="json") if isinstance(item, BaseModel) else item
+                for item in obj
+            ]
+        else:
+            data = obj
+
+        payload = {"handle": handle, "data": data}
+        incomplete = getattr(obj, "incomplete", None)
+        if incomplete:
+            payload["incomplete"] = incomplete
+        return payload
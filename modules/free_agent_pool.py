@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Run-scoped, incrementally filled snapshot of the league's free agent pool.
+
+Yahoo can't filter free agents by NHL team, so lookups scan the ranked FA
+list. The pool pulls ranked pages from a streaming source only until a lookup
+is satisfied (e.g., every requested team has N players), indexes them by team
+and by position with each index pre-sorted by fantasy points, and resumes the
+stream where it stopped when a later lookup needs more. Optionally the
+snapshot is written to data/ and reused by runs started within the TTL, which
+then don't touch Yahoo for anything it already covers.
+
+Usage:
+    from modules.free_agent_pool import get_free_agent_pool
+
+    pool = get_free_agent_pool()
+    pool.fetch_until(stream_pages, lambda: pool.count(team="TOR") >= 5, max_fetch=200)
+    top_tor = pool.get_players(team="TOR", limit=5)
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from bisect import insort
+from collections.abc import Callable, Generator
+from pathlib import Path
+
+from models.player import POSITION_BITS, Player, PlayerPosition
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_PATH = Path(__file__).parent.parent / "data" / "free_agent_pool.json"
+
+# Persist the snapshot to disk so reruns within the TTL skip Yahoo entirely
+FREE_AGENT_POOL_PERSIST = os.getenv("FREE_AGENT_POOL_PERSIST", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+# Persisted snapshots older than this are re-fetched
+FREE_AGENT_POOL_TTL_MINUTES = float(os.getenv("FREE_AGENT_POOL_TTL_MINUTES", "60"))
+
+# Streaming source: (start, end) rank offsets -> (next_start, players, is_last) per
+# page, where is_last marks a short page (the end of the free agent list)
+PageSource = Callable[[int, int], Generator[tuple[int, list[Player], bool]]]
+
+
+class FreeAgentPool:
+    """
+    Free agent snapshot indexed by team and position.
+
+    Responsibilities:
+    - Pull ranked pages from a streaming source until a lookup is satisfied
+    - Index players by team (Yahoo abbreviation) and by eligible position
+    - Keep every index sorted by fantasy points (ties keep Yahoo rank order)
+    - Save to and load from a JSON snapshot with a fetch timestamp
+    """
+
+    def __init__(
+        self,
+        players: list[Player] | None = None,
+        fetched_at: float | None = None,
+        next_start: int = 0,
+        exhausted: bool = False,
+        snapshot_path: Path | str | None = None,
+        league_id: str | None = None,
+    ):
+        """
+        Initialize pool and build indexes.
+
+        Args:
+            players: Free agent Player models already fetched, in Yahoo rank order
+            fetched_at: Unix time the snapshot was started (defaults to now)
+            next_start: Rank offset of the next page to fetch
+            exhausted: True if the end of the free agent list was reached
+            snapshot_path: If set, the snapshot is saved here after each fetch
+            league_id: League the pool belongs to (stored in the snapshot)
+        """
+        self.fetched_at = fetched_at if fetched_at is not None else time.time()
+        self.next_start = next_start
+        self.exhausted = exhausted
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.league_id = league_id
+
+        self.players: list[Player] = []
+        self._by_team: dict[str, list[Player]] = {}
+        self._by_position: dict[PlayerPosition, list[Player]] = {}
+        self._lock = threading.RLock()
+        self._add(players or [])
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def _add(self, players: list[Player]) -> None:
+        """Insert players (in rank order) into every index, keeping point order."""
+
+        def key(p: Player) -> float:
+            return -p.fantasy_points
+
+        for player in players:
+            insort(self.players, player, key=key)
+            if player.nhl_team:
+                insort(self._by_team.setdefault(player.nhl_team, []), player, key=key)
+            positions = set(player.eligible_positions)
+            if player.position:
+                positions.add(player.position)
+            for position in positions:
+                insort(self._by_position.setdefault(position, []), player, key=key)
+
+    def fetch_until(
+        self, source: PageSource, satisfied: Callable[[], bool], max_fetch: int
+    ) -> None:
+        """
+        Stream pages into the pool until a condition holds.
+
+        Stops as soon as `satisfied()` is true, the free agent list ends, or
+        `max_fetch` ranked players have been scanned. The source is closed on
+        stop, so it issues no further requests.
+
+        Args:
+            source: Streaming page source
+            satisfied: Condition checked before the first and after every page
+            max_fetch: Maximum rank offset to scan up to
+        """
+        with self._lock:
+            if satisfied() or self.exhausted or self.next_start >= max_fetch:
+                return
+
+            pages = source(self.next_start, max_fetch)
+            fetched_before = len(self.players)
+            try:
+                for next_start, players, is_last in pages:
+                    self._add(players)
+                    self.next_start = next_start
+                    self.exhausted = is_last
+                    if is_last or satisfied():
+                        break
+            finally:
+                pages.close()
+
+            logger.info(
+                f"Free agent pool: +{len(self.players) - fetched_before} players "
+                f"({len(self.players)} total, scanned to rank {self.next_start})"
+            )
+            if self.snapshot_path:
+                self.save(self.snapshot_path)
+
+    def count(self, team: str | None = None, position: PlayerPosition | None = None) -> int:
+        """Count fetched free agents matching a team and/or position."""
+        return len(self.get_players(team=team, position=position))
+
+    def get_players(
+        self,
+        team: str | None = None,
+        position: PlayerPosition | None = None,
+        limit: int | None = None,
+    ) -> list[Player]:
+        """
+        Get fetched free agents sorted by fantasy points (descending).
+
+        Args:
+            team: Yahoo team abbreviation to filter by (e.g., 'TB')
+            position: Eligible position to filter by
+            limit: Maximum number of players to return
+
+        Returns:
+            Matching players, best first
+        """
+        if team is not None:
+            players = self._by_team.get(team, [])
+            if position is not None:
+                bit = POSITION_BITS[position]
+                players = [p for p in players if p.position_mask & bit]
+        elif position is not None:
+            players = self._by_position.get(position, [])
+        else:
+            players = self.players
+
+        return players[:limit] if limit is not None else list(players)
+
+    def save(self, path: Path | str = DEFAULT_POOL_PATH) -> None:
+        """
+        Write the snapshot to a JSON file.
+
+        Args:
+            path: Snapshot file path
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        snapshot = {
+            "league_id": self.league_id,
+            "fetched_at": self.fetched_at,
+            "next_start": self.next_start,
+            "exhausted": self.exhausted,
+            "players": [p.model_dump(mode="json") for p in self.players],
+        }
+        path.write_text(json.dumps(snapshot))
+
+    @classmethod
+    def load(
+        cls,
+        path: Path | str = DEFAULT_POOL_PATH,
+        league_id: str | None = None,
+        ttl_minutes: float = FREE_AGENT_POOL_TTL_MINUTES,
+    ) -> "FreeAgentPool | None":
+        """
+        Load a snapshot if it exists, matches the league and is within the TTL.
+
+        Args:
+            path: Snapshot file path
+            league_id: League the pool must belong to
+            ttl_minutes: Maximum snapshot age
+
+        Returns:
+            FreeAgentPool saving back to the same path, or None if the snapshot
+            is missing, stale or unreadable
+        """
+        path = Path(path)
+        if not path.is_file():
+            return None
+
+        try:
+            snapshot = json.loads(path.read_text())
+            if snapshot.get("league_id") != league_id:
+                return None
+            fetched_at = float(snapshot["fetched_at"])
+            if time.time() - fetched_at > ttl_minutes * 60:
+                return None
+            players = [Player.model_validate(p) for p in snapshot["players"]]
+            next_start = int(snapshot["next_start"])
+            exhausted = bool(snapshot["exhausted"])
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable free agent snapshot {path}: {e}")
+            return None
+
+        return cls(players, fetched_at, next_start, exhausted, path, league_id)
+
+
+# Pool shared by every lookup in this process
+_pool: FreeAgentPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_free_agent_pool(
+    league_id: str | None = None,
+    persist: bool = FREE_AGENT_POOL_PERSIST,
+    path: Path | str = DEFAULT_POOL_PATH,
+) -> FreeAgentPool:
+    """
+    Get the run's free agent pool, creating it on first use.
+
+    Args:
+        league_id: League the pool belongs to (used for the on-disk snapshot)
+        persist: If True, start from a fresh on-disk snapshot and save back to it
+        path: Snapshot file path
+
+    Returns:
+        Shared FreeAgentPool
+    """
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            pool = FreeAgentPool.load(path, league_id) if persist else None
+            if pool is not None:
+                logger.info(f"Loaded {len(pool)} free agents from snapshot {path}")
+            else:
+                pool = FreeAgentPool(snapshot_path=path if persist else None, league_id=league_id)
+            _pool = pool
+        return _pool
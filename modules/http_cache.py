@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Content-addressed record/replay cache for Yahoo and NHL API responses.
+
+Each GET is keyed by a hash of its canonical URL (query parameters sorted) and
+stored as one JSON file under data/http_cache/. The cache sits under both API
+clients: a requests adapter mounted on the Yahoo session, and a wrapper around
+nhlpy's HttpClient.get.
+
+Modes (HTTP_CACHE_MODE):
+    off           No caching (default)
+    record        Always fetch live and save every successful response
+    replay        Serve only from disk; a miss raises HttpCacheMissError
+    read_through  Serve fresh entries from disk, otherwise fetch and save
+
+Usage:
+    HTTP_CACHE_MODE=record python fantasy_hockey_agent.py --dry-run
+    HTTP_CACHE_MODE=replay python fantasy_hockey_agent.py --dry-run
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "data" / "http_cache"
+
+CACHE_MODES = ("off", "record", "replay", "read_through")
+
+HTTP_CACHE_MODE = os.getenv("HTTP_CACHE_MODE", "off").lower()
+
+# Read-through entries older than this are re-fetched (record/replay ignore age)
+HTTP_CACHE_MAX_AGE_MINUTES = float(os.getenv("HTTP_CACHE_MAX_AGE_MINUTES", "60"))
+
+
+class HttpCacheMissError(Exception):
+    """Raised in replay mode when a request has no recorded response."""
+
+
+def _canonical_url(url: str, params: dict[str, Any] | None = None) -> str:
+    """Merge params into the URL's query string and sort it, so equal requests match."""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    query.extend((str(k), str(v)) for k, v in (params or {}).items())
+    return urlunsplit(parts._replace(query=urlencode(sorted(query))))
+
+
+class HttpCache:
+    """
+    On-disk response cache keyed by request content.
+
+    Responsibilities:
+    - Map (method, canonical URL) to a stable content hash
+    - Store and load responses (status, content type, body) as JSON files
+    - Decide per mode whether a request is served from disk or fetched
+    """
+
+    def __init__(
+        self,
+        mode: str = HTTP_CACHE_MODE,
+        cache_dir: Path | str = DEFAULT_CACHE_DIR,
+        max_age_minutes: float = HTTP_CACHE_MAX_AGE_MINUTES,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            mode: One of CACHE_MODES
+            cache_dir: Directory holding cached responses
+            max_age_minutes: Freshness limit for read-through mode
+
+        Raises:
+            ValueError: If mode is not a known cache mode
+        """
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown HTTP cache mode '{mode}' (expected one of {CACHE_MODES})")
+
+        self.mode = mode
+        self.cache_dir = Path(cache_dir)
+        self.max_age_minutes = max_age_minutes
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def key(self, method: str, url: str, params: dict[str, Any] | None = None) -> str:
+        """Get the content hash for a request."""
+        canonical = f"{method.upper()} {_canonical_url(url, params)}"
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def lookup(
+        self, method: str, url: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Get the stored response to serve for a request, if the mode allows one.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            params: Query parameters not already in the URL
+
+        Returns:
+            Entry with status_code, content_type, body and fetched_at, or None
+            if the request should be fetched live
+
+        Raises:
+            HttpCacheMissError: In replay mode, if no response was recorded
+        """
+        if self.mode in ("off", "record") or method.upper() != "GET":
+            return None
+
+        path = self._path(self.key(method, url, params))
+        entry = None
+        if path.is_file():
+            try:
+                entry = json.loads(path.read_text())
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+
+        if (
+            self.mode == "read_through"
+            and entry is not None
+            and time.time() - entry["fetched_at"] > self.max_age_minutes * 60
+        ):
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            if self.mode == "replay":
+                raise HttpCacheMissError(
+                    f"No recorded response for GET {_canonical_url(url, params)}"
+                )
+            return None
+
+        self.hits += 1
+        return entry
+
+    def store(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        status_code: int,
+        content_type: str | None,
+        body: bytes,
+    ) -> None:
+        """
+        Save a live response if the mode records and the request succeeded.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            params: Query parameters not already in the URL
+            status_code: Response status code
+            content_type: Response Content-Type header
+            body: Response body
+        """
+        if self.mode not in ("record", "read_through") or method.upper() != "GET":
+            return
+        if not 200 <= status_code < 300:
+            return
+
+        path = self._path(self.key(method, url, params))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "url": _canonical_url(url, params),
+            "status_code": status_code,
+            "content_type": content_type,
+            "body": body.decode("utf-8", errors="replace"),
+            "fetched_at": time.time(),
+        }
+
+        # Write to a temp file and rename, so concurrent readers never see partial files
+        with tempfile.NamedTemporaryFile("w", dir=path.parent, delete=False, suffix=".tmp") as f:
+            json.dump(entry, f)
+        os.replace(f.name, path)
+
+
+class CachingHTTPAdapter(HTTPAdapter):
+    """requests adapter that serves and records GET responses through an HttpCache."""
+
+    def __init__(self, *args, cache: HttpCache, **kwargs):
+        """
+        Initialize adapter.
+
+        Args:
+            cache: Response cache
+            *args, **kwargs: Passed on to the next adapter (e.g., pool sizes)
+        """
+        self.cache = cache
+        super().__init__(*args, **kwargs)
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        entry = self.cache.lookup(request.method, request.url)
+        if entry is not None:
+            response = requests.Response()
+            response.status_code = entry["status_code"]
+            response.headers = CaseInsensitiveDict({"Content-Type": entry["content_type"] or ""})
+            response._content = entry["body"].encode("utf-8")
+            response.encoding = "utf-8"
+            response.url = request.url
+            response.request = request
+            response.reason = "OK"
+            return response
+
+        response = super().send(request, **kwargs)
+        self.cache.store(
+            request.method,
+            request.url,
+            None,
+            response.status_code,
+            response.headers.get("Content-Type"),
+            response.content,
+        )
+        return response
+
+
+def install_nhl_cache(client: Any, cache: HttpCache) -> None:
+    """
+    Route an nhlpy NHLClient's requests through a cache.
+
+    Every nhlpy API object shares the client's HttpClient, so wrapping its get()
+    covers all endpoints.
+
+    Args:
+        client: nhlpy NHLClient
+        cache: Response cache
+    """
+    import httpx
+
+    http_client = client._http_client
+    live_get: Callable[..., httpx.Response] = http_client.get
+
+    def cached_get(endpoint, resource: str, query_params: dict | None = None) -> httpx.Response:
+        url = f"{endpoint.value}{resource}"
+        entry = cache.lookup("GET", url, query_params)
+        if entry is not None:
+            return httpx.Response(
+                entry["status_code"],
+                headers={"Content-Type": entry["content_type"] or "application/json"},
+                content=entry["body"].encode("utf-8"),
+                request=httpx.Request("GET", url, params=query_params),
+            )
+
+        response = live_get(endpoint, resource, query_params)
+        cache.store(
+            "GET",
+            url,
+            query_params,
+            response.status_code,
+            response.headers.get("Content-Type"),
+            response.content,
+        )
+        return response
+
+    http_client.get = cached_get
+
+
+# Cache shared by every client in this process
+_http_cache: HttpCache | None = None
+_http_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> HttpCache:
+    """Get the process-wide cache configured from HTTP_CACHE_MODE."""
+    global _http_cache
+
+    with _http_cache_lock:
+        if _http_cache is None:
+            _http_cache = HttpCache()
+            if _http_cache.enabled:
+                logger.info(f"HTTP cache: {_http_cache.mode} ({_http_cache.cache_dir})")
+        return _http_cache
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Run-scoped snapshot of every roster in the league.
+
+One request to Yahoo's league/{key}/teams/roster/players/stats collection
+returns league metadata and every team's roster with season stats. The
+snapshot is parsed from the raw JSON (yfpy's unpacking costs tens of
+milliseconds per player, and a league holds a few hundred) and cached for the
+rest of the run, so the user's roster, league context and opponent rosters
+all come from that single call.
+
+Usage:
+    from modules.league_snapshot import get_league_snapshot
+
+    snapshot = get_league_snapshot(yahoo_query)
+    my_roster = snapshot.get_roster()
+    opponents = snapshot.get_opponent_rosters()
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any
+
+from models.league import LeagueContext
+from models.player import Player, PlayerPosition, PlayerStatus
+from models.roster import LeagueSnapshot, Roster, RosterCounts
+from modules.player_utils import parse_position, parse_roster_slot, parse_status
+from modules.yahoo_raw_parser import parse_league_rosters
+from modules.yahoo_stats_fetcher import games_played_from_stats
+
+logger = logging.getLogger(__name__)
+
+
+def _to_roster_player(player: dict[str, Any]) -> Player:
+    """Convert a rostered player parsed by yahoo_raw_parser to a Player model."""
+    eligible_positions_raw = player["eligible_positions"]
+    position_value = player["primary_position"] or player["display_position"]
+    if not position_value and eligible_positions_raw:
+        position_value = eligible_positions_raw[0]
+
+    position = parse_position(position_value)
+    status = parse_status(player["status"])
+    player_id = player["player_id"]
+    games_played = games_played_from_stats(player["stats"], position == PlayerPosition.GOALIE)
+
+    return Player(
+        player_id=str(player_id) if player_id is not None else None,
+        name=player["name"] or "Unknown",
+        position=position,
+        eligible_positions=[parse_position(p) for p in eligible_positions_raw if parse_position(p)],
+        selected_position=parse_roster_slot(player["selected_position"]),
+        nhl_team=player["editorial_team_abbr"] or None,
+        fantasy_points=player["fantasy_points"],
+        games_played=games_played or 0,
+        status=status,
+        is_injured=status != PlayerStatus.HEALTHY,
+    )
+
+
+def build_league_snapshot(response_json: dict[str, Any]) -> LeagueSnapshot:
+    """
+    Build a LeagueSnapshot from a raw league/{key}/teams/roster/players/stats response.
+
+    Args:
+        response_json: Decoded response body (with the 'fantasy_content' root)
+
+    Returns:
+        LeagueSnapshot with one Roster per team, players sorted by fantasy points
+    """
+    parsed = parse_league_rosters(response_json)
+    league = parsed["league"]
+    retrieved_at = datetime.now().isoformat()
+
+    league_context = LeagueContext(
+        league_id=league["league_id"],
+        league_key=league["league_key"],
+        league_name=league["name"],
+        season=league["season"],
+        current_week=league["current_week"],
+        game_code=league["game_code"],
+    )
+
+    rosters = []
+    user_team_id = None
+    for team in parsed["teams"]:
+        team_id = str(team["team_id"]) if team["team_id"] is not None else None
+        if team["is_owned_by_current_login"]:
+            user_team_id = team_id
+
+        players = [_to_roster_player(player) for player in team["players"]]
+        players.sort(key=lambda p: p.fantasy_points, reverse=True)
+        rosters.append(
+            Roster(
+                team_id=team_id,
+                team_name=team["name"],
+                league_context=league_context,
+                retrieved_at=retrieved_at,
+                players=players,
+                roster_counts=RosterCounts.from_players(players),
+            )
+        )
+
+    return LeagueSnapshot(
+        league_context=league_context,
+        retrieved_at=retrieved_at,
+        user_team_id=user_team_id,
+        rosters=rosters,
+    )
+
+
+def fetch_league_snapshot(yahoo_query, league_key: str | None = None) -> LeagueSnapshot:
+    """
+    Fetch every team's roster, with stats and league metadata, in one request.
+
+    Args:
+        yahoo_query: Shared Yahoo query object
+        league_key: Yahoo league key (defaults to the query's league)
+
+    Returns:
+        LeagueSnapshot
+    """
+    league_key = league_key or yahoo_query.get_league_key()
+    url = (
+        f"https://fantasysports.yahooapis.com/fantasy/v2/league/{league_key}"
+        f"/teams/roster/players/stats"
+    )
+
+    start = time.perf_counter()
+    snapshot = build_league_snapshot(yahoo_query.get_response(url).json())
+    logger.info(
+        f"Fetched league snapshot: {len(snapshot.rosters)} rosters, "
+        f"{sum(len(r.players) for r in snapshot.rosters)} players "
+        f"in {(time.perf_counter() - start) * 1000:.0f}ms"
+    )
+    return snapshot
+
+
+# Snapshot shared by every lookup in this process
+_snapshot: LeagueSnapshot | None = None
+_snapshot_lock = threading.Lock()
+
+
+def get_league_snapshot(yahoo_query) -> LeagueSnapshot:
+    """
+    Get the run's league snapshot, fetching it on first use.
+
+    Args:
+        yahoo_query: Shared Yahoo query object
+
+    Returns:
+        Shared LeagueSnapshot
+    """
+    global _snapshot
+
+    with _snapshot_lock:
+        if _snapshot is None:
+            _snapshot = fetch_league_snapshot(yahoo_query)
+        return _snapshot
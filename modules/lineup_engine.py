@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Roster-slot-aware games-started calculator.
+
+A player only adds a game when a lineup slot is free for them that day. On
+crowded nights more rostered players play than the 6F/4D/1U/2G slots can hold,
+so raw team games overstate what a pickup contributes. This engine runs a
+maximum bipartite matching (players -> eligible slots) for every day in the
+window and counts matched players as games started.
+
+Swaps are evaluated incrementally from each day's cached matching: removing a
+matched player needs one augmenting search from the slot it frees, and adding
+a player needs one augmenting search from that player. Evaluating hundreds of
+drop/pickup swaps therefore costs two short searches per day each.
+"""
+
+from collections.abc import Callable
+
+from models.player import POSITION_BITS, Player, PlayerPosition
+from models.schedule import Schedule
+from modules.player_utils import get_player_team_abbr
+
+# League lineup: 6F, 4D, 1U, 2G
+DEFAULT_LINEUP_SLOTS: dict[PlayerPosition, int] = {
+    PlayerPosition.FORWARD: 6,
+    PlayerPosition.DEFENSE: 4,
+    PlayerPosition.UTILITY: 1,
+    PlayerPosition.GOALIE: 2,
+}
+
+
+class _DayLineup:
+    """Maximum matching of one day's playing players to lineup slots."""
+
+    __slots__ = ("owner", "slot_of")
+
+    def __init__(self, num_slots: int):
+        self.owner: list[int | None] = [None] * num_slots
+        self.slot_of: dict[int, int] = {}
+
+    def copy(self) -> "_DayLineup":
+        lineup = _DayLineup.__new__(_DayLineup)
+        lineup.owner = self.owner.copy()
+        lineup.slot_of = self.slot_of.copy()
+        return lineup
+
+    def assign(self, player: int, slots_of: Callable[[int], list[int]], visited: set[int]) -> bool:
+        """Find an augmenting path from an unmatched player (Kuhn's algorithm)."""
+        for slot in slots_of(player):
+            if slot in visited:
+                continue
+            visited.add(slot)
+            current = self.owner[slot]
+            if current is None or self.assign(current, slots_of, visited):
+                self.owner[slot] = player
+                self.slot_of[player] = slot
+                return True
+        return False
+
+    def fill(self, slot: int, players_for: Callable[[int], list[int]], visited: set[int]) -> bool:
+        """Find an augmenting path from a free slot to an unmatched player."""
+        for player in players_for(slot):
+            if player in visited:
+                continue
+            visited.add(player)
+            current_slot = self.slot_of.get(player)
+            if current_slot is None or self.fill(current_slot, players_for, visited):
+                self.owner[slot] = player
+                self.slot_of[player] = slot
+                return True
+        return False
+
+    def remove(self, player: int) -> int | None:
+        """Unmatch a player, returning the slot they held."""
+        slot = self.slot_of.pop(player, None)
+        if slot is not None:
+            self.owner[slot] = None
+        return slot
+
+
+class LineupEngine:
+    """
+    Counts games started for a roster under daily lineup slot limits.
+
+    Responsibilities:
+    - Match each day's playing players to eligible lineup slots
+    - Report games started for the current roster
+    - Re-evaluate games started after a drop/pickup swap incrementally
+    """
+
+    def __init__(
+        self,
+        roster_players: list[Player],
+        schedule: Schedule,
+        lineup_slots: dict[PlayerPosition, int] | None = None,
+    ):
+        """
+        Initialize engine and compute the current roster's daily lineups.
+
+        Args:
+            roster_players: All rostered Player models (players on IR never start)
+            schedule: Schedule model covering the window
+            lineup_slots: Slot type -> count (defaults to 6F/4D/1U/2G)
+        """
+        self.matrix = schedule.game_matrix()
+        self.num_days = len(self.matrix.dates)
+
+        self.slot_types: list[PlayerPosition] = [
+            slot_type
+            for slot_type, count in (lineup_slots or DEFAULT_LINEUP_SLOTS).items()
+            for _ in range(count)
+        ]
+        self._slot_bits: list[int] = [POSITION_BITS[slot_type] for slot_type in self.slot_types]
+
+        self.roster_players = roster_players
+        self._player_slots: list[list[int]] = []
+        self._player_rows: list[int | None] = []
+        for player in roster_players:
+            slots, row = self._player_profile(player)
+            self._player_slots.append(slots)
+            self._player_rows.append(None if player.is_on_ir() else row)
+
+        # Per day: players eligible for each slot, and the maximum matching
+        self._slot_candidates: list[list[list[int]]] = []
+        self._lineups: list[_DayLineup] = []
+        for day in range(self.num_days):
+            playing = self._playing(day)
+            self._slot_candidates.append(
+                [
+                    [player for player in playing if slot in self._player_slots[player]]
+                    for slot in range(len(self.slot_types))
+                ]
+            )
+
+            lineup = _DayLineup(len(self.slot_types))
+            for player in playing:
+                lineup.assign(player, self._player_slots.__getitem__, set())
+            self._lineups.append(lineup)
+
+        self.games_started: int = sum(len(lineup.slot_of) for lineup in self._lineups)
+        self._swap_cache: dict[tuple, int] = {}
+
+    def _player_profile(self, player: Player) -> tuple[list[int], int | None]:
+        """Get a player's eligible slot indexes and schedule row."""
+        slots = [i for i, bit in enumerate(self._slot_bits) if bit & player.slot_mask]
+        team = get_player_team_abbr(player)
+        return slots, self.matrix.row(team) if team else None
+
+    def _playing(self, day: int) -> list[int]:
+        """Get roster indexes of players whose team plays on a day."""
+        played = self.matrix.played
+        return [
+            player
+            for player, row in enumerate(self._player_rows)
+            if row is not None and played[row][day]
+        ]
+
+    def _roster_index(self, player: Player) -> int | None:
+        """Find a player on the roster by player_id, falling back to name."""
+        for i, roster_player in enumerate(self.roster_players):
+            if player.player_id and roster_player.player_id == player.player_id:
+                return i
+        name = player.name.lower()
+        for i, roster_player in enumerate(self.roster_players):
+            if roster_player.name.lower() == name:
+                return i
+        return None
+
+    def games_started_after_swap(
+        self, drop_player: Player, pickup_player: Player, first_pickup_day: int
+    ) -> int:
+        """
+        Count games started over the window after a drop/pickup swap.
+
+        The drop player stays in the lineup pool before first_pickup_day; the
+        pickup player joins from first_pickup_day onwards.
+
+        Args:
+            drop_player: Rostered player being dropped
+            pickup_player: Free agent being picked up
+            first_pickup_day: Day index the pickup player's games start counting
+
+        Returns:
+            Total games started across the window
+        """
+        drop_idx = self._roster_index(drop_player)
+        pickup_slots, pickup_row = self._player_profile(pickup_player)
+
+        # Pickups on the same team with the same eligibility are interchangeable
+        key = (drop_idx, pickup_row, tuple(pickup_slots), first_pickup_day)
+        if key in self._swap_cache:
+            return self._swap_cache[key]
+
+        pickup_idx = len(self.roster_players)
+        played = self.matrix.played
+
+        def slots_of(player: int) -> list[int]:
+            return pickup_slots if player == pickup_idx else self._player_slots[player]
+
+        started = sum(len(lineup.slot_of) for lineup in self._lineups[:first_pickup_day])
+        for day in range(first_pickup_day, self.num_days):
+            lineup = self._lineups[day]
+            pickup_plays = pickup_row is not None and played[pickup_row][day]
+            drop_started = drop_idx is not None and drop_idx in lineup.slot_of
+            if not pickup_plays and not drop_started:
+                started += len(lineup.slot_of)
+                continue
+
+            lineup = lineup.copy()
+            if drop_started:
+                # Marking the drop player visited keeps them out of the refill
+                freed_slot = lineup.remove(drop_idx)
+                lineup.fill(freed_slot, self._slot_candidates[day].__getitem__, {drop_idx})
+            if pickup_plays:
+                lineup.assign(pickup_idx, slots_of, set())
+            started += len(lineup.slot_of)
+
+        self._swap_cache[key] = started
+        return started
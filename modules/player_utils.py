@@ -1,7 +1,38 @@
 #!/usr/bin/env python3
 """Utilities for player analysis and comparison."""
 
-from models.player import Player, PlayerPosition
+from models.player import Player, PlayerPosition, PlayerStatus, RosterSlot, streaming_class_mask
+
+
+def parse_position(position_str: str | None) -> PlayerPosition | None:
+    """Parse position string to PlayerPosition enum."""
+    if not position_str:
+        return None
+    try:
+        return PlayerPosition(position_str)
+    except ValueError:
+        return None
+
+
+def parse_roster_slot(slot_str: str | None) -> RosterSlot | None:
+    """Parse roster slot string to RosterSlot enum."""
+    if not slot_str:
+        return None
+    try:
+        return RosterSlot(slot_str)
+    except ValueError:
+        return None
+
+
+def parse_status(status_str: str | None) -> PlayerStatus:
+    """Parse status string to PlayerStatus enum."""
+    if not status_str or status_str == "Healthy":
+        return PlayerStatus.HEALTHY
+    try:
+        return PlayerStatus(status_str)
+    except ValueError:
+        # Default to HEALTHY if status is unknown
+        return PlayerStatus.HEALTHY
 
 
 def get_player_team_abbr(player: Player) -> str | None:
@@ -49,8 +80,5 @@ def positions_are_compatible(
         >>> positions_are_compatible(PlayerPosition.GOALIE, PlayerPosition.GOALIE)
         True
     """
-    if not drop_position or not pickup_position:
-        return False
-
-    # Both must be goalies or both must be non-goalies
-    return (drop_position == PlayerPosition.GOALIE) == (pickup_position == PlayerPosition.GOALIE)
+    # Both must be goalies or both must be non-goalies (unknown positions have no class)
+    return bool(streaming_class_mask(drop_position) & streaming_class_mask(pickup_position))
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Pluggable strategies for fetching NHL schedule data.
+
+Each strategy fills the same date -> matchups mapping from a different NHL API
+endpoint and can estimate how many requests a window will cost:
+
+- DailyScheduleFetcher: one request per date
+- WeeklyScheduleFetcher: one request per 7-day block
+- TeamSeasonScheduleFetcher: one request per team per season
+
+Use select_fetch_strategy() to pick the cheapest strategy for a set of dates.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, ClassVar
+
+from modules.team_utils import NHL_TEAMS
+from modules.tool_logger import get_logger
+
+logger = get_logger(__name__)
+
+# Days covered by a single weekly schedule response
+DAYS_PER_WEEKLY_REQUEST = 7
+
+
+def _extract_matchups(games: list[dict[str, Any]]) -> list[tuple[str, str]]:
+    """
+    Extract (away_abbr, home_abbr) tuples from raw NHL API game dictionaries.
+
+    Args:
+        games: Raw game dictionaries
+
+    Returns:
+        List of (away_abbr, home_abbr) tuples, skipping games with missing teams
+    """
+    matchups = []
+    for game in games:
+        away_abbr = game.get("awayTeam", {}).get("abbrev", "")
+        home_abbr = game.get("homeTeam", {}).get("abbrev", "")
+
+        # Skip if team info is missing
+        if not away_abbr or not home_abbr:
+            continue
+
+        matchups.append((away_abbr, home_abbr))
+
+    return matchups
+
+
+def _run_concurrently(func: Callable[[Any], Any], items: list[Any], max_concurrency: int) -> list:
+    """
+    Apply func to every item on a bounded thread pool.
+
+    Args:
+        func: Function to apply
+        items: Items to process
+        max_concurrency: Maximum number of calls in flight at once
+
+    Returns:
+        Results in the same order as items
+    """
+    if not items:
+        return []
+
+    workers = max(1, min(max_concurrency, len(items)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items))
+
+
+def _season_for_date(date_str: str) -> str:
+    """
+    Get the NHL season identifier (e.g., '20252026') containing a date.
+
+    Seasons start in the fall, so dates from July onwards belong to the season
+    starting that year.
+    """
+    date_obj = datetime.strptime(date_str, "%Y-%m-%d")
+    start_year = date_obj.year if date_obj.month >= 7 else date_obj.year - 1
+    return f"{start_year}{start_year + 1}"
+
+
+class ScheduleFetchStrategy(ABC):
+    """Abstract base class for NHL schedule fetch strategies."""
+
+    name: ClassVar[str]
+
+    @abstractmethod
+    def estimate_requests(self, dates: list[str]) -> int:
+        """
+        Estimate how many API requests fetching these dates will take.
+
+        Args:
+            dates: Dates in YYYY-MM-DD format
+
+        Returns:
+            Number of API requests
+        """
+
+    @abstractmethod
+    def fetch(
+        self, client: Any, dates: list[str], max_concurrency: int
+    ) -> dict[str, list[tuple[str, str]]]:
+        """
+        Fetch matchups for the given dates.
+
+        Dates whose request failed are left out of the result, so callers can
+        tell them apart from dates with no games.
+
+        Args:
+            client: NHL API client
+            dates: Dates in YYYY-MM-DD format
+            max_concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            Dictionary mapping date -> list of (away_abbr, home_abbr) tuples
+        """
+
+
+class DailyScheduleFetcher(ScheduleFetchStrategy):
+    """Fetch one date per request using the daily schedule endpoint."""
+
+    name: ClassVar[str] = "daily"
+
+    def estimate_requests(self, dates: list[str]) -> int:
+        """One request per date."""
+        return len(dates)
+
+    def fetch(
+        self, client: Any, dates: list[str], max_concurrency: int
+    ) -> dict[str, list[tuple[str, str]]]:
+        """Fetch each date's schedule concurrently."""
+
+        def fetch_date(date_str: str) -> list[tuple[str, str]] | None:
+            try:
+                schedule_data = client.schedule.daily_schedule(date=date_str)
+            except Exception as e:
+                logger.warning(f"Error fetching schedule for {date_str}: {e}")
+                return None
+
+            if not schedule_data or "games" not in schedule_data:
+                return []
+
+            return _extract_matchups(schedule_data.get("games", []))
+
+        results = _run_concurrently(fetch_date, dates, max_concurrency)
+        return {
+            date_str: matchups
+            for date_str, matchups in zip(dates, results, strict=True)
+            if matchups is not None
+        }
+
+
+class WeeklyScheduleFetcher(ScheduleFetchStrategy):
+    """Fetch up to 7 consecutive dates per request using the weekly schedule endpoint."""
+
+    name: ClassVar[str] = "weekly"
+
+    def _group_dates(self, dates: list[str]) -> list[list[str]]:
+        """
+        Group sorted dates into blocks covered by a single weekly request.
+
+        Each block starts at its first date and spans the following 7 days.
+        """
+        blocks: list[list[str]] = []
+        block_end = None
+
+        for date_str in sorted(dates):
+            if block_end is None or date_str > block_end:
+                start = datetime.strptime(date_str, "%Y-%m-%d")
+                block_end = (start + timedelta(days=DAYS_PER_WEEKLY_REQUEST - 1)).strftime(
+                    "%Y-%m-%d"
+                )
+                blocks.append([])
+            blocks[-1].append(date_str)
+
+        return blocks
+
+    def estimate_requests(self, dates: list[str]) -> int:
+        """One request per 7-day block of dates."""
+        return len(self._group_dates(dates))
+
+    def fetch(
+        self, client: Any, dates: list[str], max_concurrency: int
+    ) -> dict[str, list[tuple[str, str]]]:
+        """Fetch each 7-day block concurrently and keep only the requested dates."""
+
+        def fetch_block(block: list[str]) -> dict[str, list[tuple[str, str]]]:
+            try:
+                week_data = client.schedule.weekly_schedule(date=block[0])
+            except Exception as e:
+                logger.warning(f"Error fetching weekly schedule starting {block[0]}: {e}")
+                return {}
+
+            days = {day.get("date"): day.get("games", []) for day in week_data.get("gameWeek", [])}
+            return {
+                date_str: _extract_matchups(days[date_str])
+                for date_str in block
+                if date_str in days
+            }
+
+        games_by_date = {}
+        for block_games in _run_concurrently(
+            fetch_block, self._group_dates(dates), max_concurrency
+        ):
+            games_by_date.update(block_games)
+
+        return {
+            date_str: games_by_date[date_str] for date_str in dates if date_str in games_by_date
+        }
+
+
+class TeamSeasonScheduleFetcher(ScheduleFetchStrategy):
+    """Fetch every team's full season schedule, one request per team per season."""
+
+    name: ClassVar[str] = "team_season"
+
+    def estimate_requests(self, dates: list[str]) -> int:
+        """One request per team for each season the dates span."""
+        seasons = {_season_for_date(date_str) for date_str in dates}
+        return len(NHL_TEAMS) * len(seasons)
+
+    def fetch(
+        self, client: Any, dates: list[str], max_concurrency: int
+    ) -> dict[str, list[tuple[str, str]]]:
+        """Fetch all team season schedules concurrently and de-duplicate shared games."""
+        requested = set(dates)
+        seasons = sorted({_season_for_date(date_str) for date_str in dates})
+        requests = [(team, season) for season in seasons for team in sorted(NHL_TEAMS)]
+
+        def fetch_team_season(request: tuple[str, str]) -> list[dict[str, Any]] | None:
+            team, season = request
+            try:
+                return client.schedule.team_season_schedule(team_abbr=team, season=season).get(
+                    "games", []
+                )
+            except Exception as e:
+                logger.warning(f"Error fetching {season} season schedule for {team}: {e}")
+                return None
+
+        results = _run_concurrently(fetch_team_season, requests, max_concurrency)
+        if any(games is None for games in results):
+            # A missing team would make its dates look incomplete, so report nothing
+            return {}
+
+        # Each game appears in both teams' schedules
+        games_by_id: dict[Any, dict[str, Any]] = {}
+        for team_games in results:
+            for game in team_games:
+                if game.get("gameDate") in requested:
+                    games_by_id.setdefault(game.get("id"), game)
+
+        ordered = sorted(
+            games_by_id.values(),
+            key=lambda g: (g.get("gameDate"), g.get("startTimeUTC", ""), g.get("id") or 0),
+        )
+        games_by_date: dict[str, list[dict[str, Any]]] = {date_str: [] for date_str in dates}
+        for game in ordered:
+            games_by_date[game["gameDate"]].append(game)
+
+        return {date_str: _extract_matchups(games) for date_str, games in games_by_date.items()}
+
+
+# Candidate strategies in order of preference when request counts tie
+FETCH_STRATEGIES: list[ScheduleFetchStrategy] = [
+    DailyScheduleFetcher(),
+    WeeklyScheduleFetcher(),
+    TeamSeasonScheduleFetcher(),
+]
+
+
+def select_fetch_strategy(dates: list[str]) -> ScheduleFetchStrategy:
+    """
+    Pick the strategy that needs the fewest API requests for the given dates.
+
+    Args:
+        dates: Dates in YYYY-MM-DD format
+
+    Returns:
+        Cheapest ScheduleFetchStrategy
+
+    Examples:
+        >>> select_fetch_strategy(["2025-10-18"]).name
+        'daily'
+        >>> select_fetch_strategy(["2025-10-18", "2025-10-19"]).name
+        'weekly'
+    """
+    return min(FETCH_STRATEGIES, key=lambda strategy: strategy.estimate_requests(dates))
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Persistent on-disk store for NHL season schedule data.
+
+The season schedule barely changes day to day, so games are cached in a small
+SQLite database under data/ and served back as date slices. Each date records
+when it was last fetched, which lets callers refresh only the dates that are
+missing or older than the configured maximum age.
+
+The store fills as windows are requested rather than loading the whole season
+up front: a run fetches only the dates it needs that are missing or stale, so
+over a season the store converges on the full schedule without a bulk load.
+
+Usage:
+    from modules.schedule_store import ScheduleStore
+
+    store = ScheduleStore()
+    stale = store.get_stale_dates(dates)
+    store.save_games({"2025-10-18": [("TOR", "MTL")]})
+    games = store.get_games("2025-10-18", "2025-10-26")
+"""
+
+import os
+import sqlite3
+import time
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from pathlib import Path
+
+DEFAULT_STORE_PATH = Path(__file__).parent.parent / "data" / "nhl_schedule.sqlite3"
+
+# Dates fetched longer ago than this are re-fetched on the next run
+SCHEDULE_STORE_MAX_AGE_HOURS = float(os.getenv("SCHEDULE_STORE_MAX_AGE_HOURS", "168"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    date TEXT NOT NULL,
+    ordinal INTEGER NOT NULL,
+    away TEXT NOT NULL,
+    home TEXT NOT NULL,
+    PRIMARY KEY (date, ordinal)
+);
+CREATE TABLE IF NOT EXISTS fetched_dates (
+    date TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL
+);
+"""
+
+
+class ScheduleStore:
+    """
+    SQLite-backed store of NHL games keyed by date.
+
+    Responsibilities:
+    - Persist games (away/home abbreviations) per date
+    - Track when each date was last fetched
+    - Report which dates in a window need (re)fetching
+    - Serve games for any date range without network access
+    """
+
+    def __init__(self, db_path: Path | str = DEFAULT_STORE_PATH):
+        """
+        Initialize store, creating the database file if needed.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection that commits on success and always closes."""
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            yield conn
+
+    def get_stale_dates(
+        self, dates: list[str], max_age_hours: float = SCHEDULE_STORE_MAX_AGE_HOURS
+    ) -> list[str]:
+        """
+        Get dates that have never been fetched or were fetched too long ago.
+
+        Args:
+            dates: Dates in YYYY-MM-DD format
+            max_age_hours: Maximum age before a date is considered stale
+
+        Returns:
+            Stale dates, in the same order as the input
+        """
+        if not dates:
+            return []
+
+        cutoff = time.time() - max_age_hours * 3600
+        placeholders = ",".join("?" * len(dates))
+
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT date FROM fetched_dates WHERE date IN ({placeholders}) AND fetched_at >= ?",
+                [*dates, cutoff],
+            ).fetchall()
+
+        fresh = {row[0] for row in rows}
+        return [date for date in dates if date not in fresh]
+
+    def get_stored_dates(self, dates: list[str]) -> set[str]:
+        """
+        Get dates that have been fetched at least once, however long ago.
+
+        Args:
+            dates: Dates in YYYY-MM-DD format
+
+        Returns:
+            Subset of dates whose games are in the store
+        """
+        if not dates:
+            return set()
+
+        placeholders = ",".join("?" * len(dates))
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT date FROM fetched_dates WHERE date IN ({placeholders})", dates
+            ).fetchall()
+
+        return {row[0] for row in rows}
+
+    def save_games(self, games_by_date: dict[str, list[tuple[str, str]]]) -> None:
+        """
+        Replace stored games for each given date and mark the dates as fetched.
+
+        Args:
+            games_by_date: Dictionary mapping date -> list of (away_abbr, home_abbr)
+        """
+        if not games_by_date:
+            return
+
+        fetched_at = time.time()
+        with self._connect() as conn:
+            for date, games in games_by_date.items():
+                conn.execute("DELETE FROM games WHERE date = ?", (date,))
+                conn.executemany(
+                    "INSERT INTO games (date, ordinal, away, home) VALUES (?, ?, ?, ?)",
+                    [(date, i, away, home) for i, (away, home) in enumerate(games)],
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO fetched_dates (date, fetched_at) VALUES (?, ?)",
+                    (date, fetched_at),
+                )
+
+    def get_games(self, start_date: str, end_date: str) -> list[tuple[str, str, str]]:
+        """
+        Get stored games within a date range.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format (inclusive)
+            end_date: End date in YYYY-MM-DD format (inclusive)
+
+        Returns:
+            List of (date, away_abbr, home_abbr) tuples ordered by date
+        """
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT date, away, home FROM games WHERE date BETWEEN ? AND ? "
+                "ORDER BY date, ordinal",
+                (start_date, end_date),
+            ).fetchall()
+
+    def clear(self) -> None:
+        """Remove all stored games and fetch history."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM games")
+            conn.execute("DELETE FROM fetched_dates")
@@ -143,11 +143,4 @@ def calculate_games_for_player(
         return []
 
     # Get games (optionally filtered by date range)
-    if start_date and end_date:
-        return team_schedule.games_in_period(start_date, end_date)
-    elif start_date:
-        return [g for g in team_schedule.games if g.date >= start_date]
-    elif end_date:
-        return [g for g in team_schedule.games if g.date <= end_date]
-    else:
-        return team_schedule.games
+    return team_schedule.games_in_period(start_date, end_date)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Compact Yahoo stat storage: fixed-length vectors indexed by stat_id.
+
+A player's season stats are one array('d') of NUM_STAT_IDS floats, with
+MISSING (NaN) for stats Yahoo didn't report. Reported values that aren't
+numbers ('-', '', None) parse to 0, as the old per-stat parsing did, so a
+skater's '-' games played still counts as 0 games. A batch of
+players is a StatMatrix: one contiguous row-major array, so a stat across
+every player is a single strided slice (matrix.column(stat_id)).
+"""
+
+import logging
+import math
+from array import array
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Yahoo NHL stat_ids fit well below this; larger ids are dropped (and logged)
+NUM_STAT_IDS = 64
+
+# Sentinel for a stat Yahoo didn't report
+MISSING = math.nan
+
+_EMPTY_VECTOR = array("d", [MISSING]) * NUM_STAT_IDS
+
+# Stat ids already logged as dropped, so each is reported once per run
+_dropped_stat_ids: set[str] = set()
+
+
+def parse_stat(value: Any) -> float:
+    """Parse a reported Yahoo stat value, treating None, '-' and other non-numbers as 0."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def is_missing(value: float) -> bool:
+    return value != value  # NaN is the only float not equal to itself
+
+
+def stat_vector(stats: Iterable[tuple[Any, Any]] = ()) -> array:
+    """
+    Build a stat vector from (stat_id, value) pairs.
+
+    Args:
+        stats: Raw Yahoo stat_id and value pairs (strings or numbers)
+
+    Returns:
+        array('d') of NUM_STAT_IDS values, MISSING where not given
+    """
+    vector = array("d", _EMPTY_VECTOR)
+    for stat_id, value in stats:
+        try:
+            index = int(stat_id)
+        except (TypeError, ValueError):
+            index = -1
+        if 0 <= index < NUM_STAT_IDS:
+            vector[index] = parse_stat(value)
+        elif str(stat_id) not in _dropped_stat_ids:
+            _dropped_stat_ids.add(str(stat_id))
+            logger.warning(
+                f"Dropping Yahoo stat_id {stat_id!r}: outside stat vectors (0-{NUM_STAT_IDS - 1})"
+            )
+    return vector
+
+
+def get_stat(vector: Sequence[float] | None, stat_id: int) -> float | None:
+    """Get one stat from a vector (or matrix row), or None if it is missing."""
+    if vector is None:
+        return None
+    value = vector[stat_id]
+    return None if is_missing(value) else value
+
+
+class StatMatrix:
+    """
+    Stat vectors for a batch of players in one contiguous row-major array.
+
+    Responsibilities:
+    - Store one NUM_STAT_IDS row per player key
+    - Give zero-copy access to a player's row
+    - Slice one stat across every player
+    """
+
+    __slots__ = ("data", "index", "keys")
+
+    def __init__(self, keys: Iterable[str] = ()):
+        """
+        Initialize an all-MISSING matrix.
+
+        Args:
+            keys: Player keys, one row each (duplicates share a row)
+        """
+        self.keys: list[str] = list(dict.fromkeys(keys))
+        self.index: dict[str, int] = {key: i for i, key in enumerate(self.keys)}
+        self.data = array("d", _EMPTY_VECTOR) * len(self.keys)
+
+    @classmethod
+    def from_vectors(cls, vectors: dict[str, Sequence[float]]) -> "StatMatrix":
+        """Build a matrix from player key -> stat vector."""
+        matrix = cls(vectors)
+        for key, vector in vectors.items():
+            matrix.set_row(key, vector)
+        return matrix
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.index
+
+    def set_row(self, key: str, vector: Sequence[float]) -> None:
+        start = self.index[key] * NUM_STAT_IDS
+        self.data[start : start + NUM_STAT_IDS] = array("d", vector)
+
+    def row(self, key: str) -> memoryview | None:
+        """Get a player's stats as a view into the matrix, or None if not in the batch."""
+        i = self.index.get(key)
+        if i is None:
+            return None
+        return memoryview(self.data)[i * NUM_STAT_IDS : (i + 1) * NUM_STAT_IDS]
+
+    def column(self, stat_id: int) -> array:
+        """Get one stat for every player, in row order."""
+        return self.data[stat_id::NUM_STAT_IDS]
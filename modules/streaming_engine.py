@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+All-pairs streaming timing engine built on the schedule's GameMatrix.
+
+Optimal drop/pickup timing depends only on the two players' team schedules, so
+the engine evaluates every (drop team, pickup team) combination once from
+cumulative game counts, then broadcasts the results to player pairs with
+position compatibility masking. Only pairs that actually gain games survive.
+"""
+
+from typing import Any
+
+from models.player import Player
+from models.schedule import Schedule
+from modules.player_utils import get_player_team_abbr
+
+
+class StreamingMatrix:
+    """
+    Evaluates streaming timing for drop x pickup pairs from cumulative game counts.
+
+    Responsibilities:
+    - Compute the best drop day for every (drop team, pickup team) pair
+    - Mask incompatible positions (goalie <-> skater)
+    - Build timing details for surviving pairs
+    """
+
+    def __init__(self, schedule: Schedule):
+        """
+        Initialize engine for a schedule window.
+
+        Args:
+            schedule: Schedule model covering the streaming window
+        """
+        self.schedule = schedule
+        self.matrix = schedule.game_matrix()
+
+        # Day indexes of each team's games, in date order
+        self._game_days: list[list[int]] = [
+            [day for day, played in enumerate(row) if played] for row in self.matrix.played
+        ]
+        self._grid: dict[tuple[str, str], tuple[int, int, int] | None] = {}
+
+    def _compute_row(self, drop_team: str, pickup_teams: list[str]) -> None:
+        """
+        Compute best timings for one drop team against many pickup teams.
+
+        Each grid entry is (best_total_games, drop_day, games_before_drop), where
+        drop_day is -1 for dropping immediately, or None when no timing beats
+        keeping the drop player.
+        """
+        matrix = self.matrix
+        drop_row = matrix.row(drop_team)
+
+        for pickup_team in pickup_teams:
+            pickup_row = matrix.row(pickup_team)
+            if drop_row is None or pickup_row is None:
+                self._grid[(drop_team, pickup_team)] = None
+                continue
+
+            drop_total = matrix.games_per_team[drop_row]
+            pickup_total = matrix.games_per_team[pickup_row]
+
+            # Players without games in the window can't be evaluated, and if the
+            # pickup player doesn't have more games, not worth streaming
+            if not drop_total or pickup_total <= drop_total:
+                self._grid[(drop_team, pickup_team)] = None
+                continue
+
+            pickup_cumulative = matrix.cumulative[pickup_row]
+            best: tuple[int, int, int] | None = None
+            best_total = drop_total
+
+            # Keep drop player through their k-th game, pickup plays every game after it
+            for games_before_drop, day in enumerate(self._game_days[drop_row], start=1):
+                total = games_before_drop + pickup_total - pickup_cumulative[day + 1]
+                if total > best_total:
+                    best_total = total
+                    best = (total, day, games_before_drop)
+
+            # Also consider dropping immediately (before first game)
+            if pickup_total > best_total:
+                best = (pickup_total, -1, 0)
+
+            self._grid[(drop_team, pickup_team)] = best
+
+    def compute_grid(self, drop_teams: list[str], pickup_teams: list[str]) -> None:
+        """
+        Compute best timings for every drop team x pickup team combination.
+
+        Args:
+            drop_teams: Normalized drop team abbreviations
+            pickup_teams: Normalized pickup team abbreviations
+        """
+        pickup_teams = list(dict.fromkeys(pickup_teams))
+        for drop_team in dict.fromkeys(drop_teams):
+            missing = [team for team in pickup_teams if (drop_team, team) not in self._grid]
+            if missing:
+                self._compute_row(drop_team, missing)
+
+    def best_timing(self, drop_team: str, pickup_team: str) -> dict[str, Any] | None:
+        """
+        Get the optimal drop/pickup timing for a pair of teams.
+
+        Args:
+            drop_team: Normalized team abbreviation of the player being dropped
+            pickup_team: Normalized team abbreviation of the player being picked up
+
+        Returns:
+            Dictionary with timing info or None if not beneficial
+        """
+        if (drop_team, pickup_team) not in self._grid:
+            self._compute_row(drop_team, [pickup_team])
+
+        best = self._grid[(drop_team, pickup_team)]
+        if best is None:
+            return None
+
+        total_games, drop_day, games_before_drop = best
+        matrix = self.matrix
+        drop_total = matrix.games_per_team[matrix.row(drop_team)]
+        pickup_games_remaining = total_games - games_before_drop
+
+        if drop_day < 0:
+            drop_date = self.schedule.start_date  # Drop immediately
+            after_date = None
+        else:
+            drop_date = matrix.dates[drop_day]
+            after_date = drop_date
+
+        pickup_schedule = self.schedule.get_team_schedule(pickup_team)
+        upcoming = (
+            pickup_schedule.games_after_date(after_date)
+            if after_date
+            else pickup_schedule.games_in_period(self.schedule.start_date, None)
+        )
+
+        return {
+            "drop_date": drop_date,
+            "drop_after_game_num": games_before_drop,
+            "pickup_games_remaining": pickup_games_remaining,
+            "total_games": total_games,
+            "improvement": total_games - drop_total,
+            "baseline_games": drop_total,
+            "next_pickup_game": upcoming[0] if upcoming else None,
+        }
+
+    def evaluate_pairs(
+        self, drop_players: list[Player], pickup_players: list[Player]
+    ) -> list[tuple[int, int]]:
+        """
+        Find all compatible drop x pickup pairs that gain games.
+
+        Args:
+            drop_players: Droppable Player models
+            pickup_players: Available pickup Player models
+
+        Returns:
+            List of (drop_index, pickup_index) pairs with positive improvement,
+            in drop-major, pickup-minor order
+        """
+        drop_teams = [get_player_team_abbr(p) for p in drop_players]
+        pickup_teams = [get_player_team_abbr(p) for p in pickup_players]
+        self.compute_grid(
+            [team for team in drop_teams if team], [team for team in pickup_teams if team]
+        )
+
+        # Group pickup candidates by streaming class once instead of per drop player;
+        # class masks are disjoint, so equal masks are exactly compatible positions
+        pickups_by_class: dict[int, list[int]] = {}
+        for j, player in enumerate(pickup_players):
+            if player.streaming_mask and pickup_teams[j]:
+                pickups_by_class.setdefault(player.streaming_mask, []).append(j)
+
+        survivors = []
+        for i, player in enumerate(drop_players):
+            drop_team = drop_teams[i]
+            if not drop_team or not player.streaming_mask:
+                continue
+
+            for j in pickups_by_class.get(player.streaming_mask, []):
+                if self._grid[(drop_team, pickup_teams[j])] is not None:
+                    survivors.append((i, j))
+
+        return survivors
+
+
+class TimingCache:
+    """
+    Run-scoped memo of streaming timing results keyed on matrix team rows.
+
+    StreamingMatrix already memoizes the raw (total, drop day, games before drop)
+    grid; this layer keeps the timing dictionaries built from it (dates, next
+    pickup game) and the team-dependent part of the reasoning text, so they are
+    built once per team pair and reused for every player pair that maps onto
+    it. The cache belongs to one engine, so its schedule window is fixed.
+
+    Timing and reasoning lookups are counted separately (hits/misses and
+    detail_hits/detail_misses).
+    """
+
+    def __init__(self, engine: StreamingMatrix):
+        """
+        Initialize cache for an engine's schedule window.
+
+        Args:
+            engine: StreamingMatrix used to compute timings on a miss
+        """
+        self.engine = engine
+        self.hits = 0
+        self.misses = 0
+        self.detail_hits = 0
+        self.detail_misses = 0
+        self._timings: dict[tuple[int | None, int | None], dict[str, Any] | None] = {}
+        self._pickup_details: dict[tuple[int | None, int | None], str] = {}
+
+    def _key(self, drop_team: str, pickup_team: str) -> tuple[int | None, int | None]:
+        matrix = self.engine.matrix
+        return matrix.row(drop_team), matrix.row(pickup_team)
+
+    def get_timing(self, drop_team: str, pickup_team: str) -> dict[str, Any] | None:
+        """
+        Get the optimal timing for a team pair, computing it on first use.
+
+        Args:
+            drop_team: Normalized team abbreviation of the player being dropped
+            pickup_team: Normalized team abbreviation of the player being picked up
+
+        Returns:
+            Dictionary with timing info or None if not beneficial
+        """
+        key = self._key(drop_team, pickup_team)
+        if key in self._timings:
+            self.hits += 1
+            return self._timings[key]
+
+        self.misses += 1
+        timing = self.engine.best_timing(drop_team, pickup_team)
+        self._timings[key] = timing
+        return timing
+
+    def get_pickup_details(self, drop_team: str, pickup_team: str, timing: dict[str, Any]) -> str:
+        """
+        Get the team-dependent reasoning text for a team pair.
+
+        Args:
+            drop_team: Normalized team abbreviation of the player being dropped
+            pickup_team: Normalized team abbreviation of the player being picked up
+            timing: Timing info for the pair from get_timing()
+
+        Returns:
+            Text describing games remaining, next game, and totals
+        """
+        key = self._key(drop_team, pickup_team)
+        if key in self._pickup_details:
+            self.detail_hits += 1
+            return self._pickup_details[key]
+
+        self.detail_misses += 1
+        next_game = timing["next_pickup_game"]
+        next_game_info = (
+            f" First game: {next_game.date} vs {next_game.opponent}" if next_game else ""
+        )
+
+        details = (
+            f"({timing['pickup_games_remaining']} games remaining).{next_game_info} "
+            f"Total: {timing['total_games']} games vs {timing['baseline_games']} games if kept."
+        )
+        self._pickup_details[key] = details
+        return details
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Multi-move streaming planner under weekly acquisition limits.
+
+Each droppable player holds a roster spot ("slot"). On any day a slot can
+switch its holder to a free agent, which costs one acquisition in that day's
+fantasy week. The planner finds the chains of switches across all slots that
+maximize total games without exceeding the weekly acquisition limit:
+
+1. Per slot, a dynamic program over days tracks (holder team, acquisitions used
+   per week) states. Free agents on the same team are interchangeable for game
+   counts, so states are per team rather than per player. Dominated states
+   (more acquisitions for no more games) are pruned before branching.
+2. Slots are combined with a knapsack over per-week acquisition usage, with a
+   branch-and-bound cut against the best feasible plan found so far.
+3. Concrete free agents are assigned best-first per team; if a plan needs more
+   players from a team than are available, the cheapest slot is banned from
+   that team and the plan is rebuilt.
+"""
+
+import os
+from collections.abc import Iterable
+
+from models.game_matrix import GameMatrix
+from models.player import Player
+from models.schedule import Schedule
+from models.streaming import StreamingMove, StreamingPlan
+from modules.player_utils import get_player_team_abbr
+from modules.tool_logger import get_logger
+
+logger = get_logger(__name__)
+
+# League limit on adds per fantasy week
+MAX_ACQUISITIONS_PER_WEEK = int(os.getenv("MAX_ACQUISITIONS_PER_WEEK", "4"))
+
+Usage = tuple[int, ...]
+# Switch history as a linked list: (day, team_row, previous) or None
+Link = tuple[int, int, "Link"] | None
+
+
+def _dominates(usage_a: Usage, usage_b: Usage) -> bool:
+    """Check whether usage_a uses no more acquisitions than usage_b in every week."""
+    return all(a <= b for a, b in zip(usage_a, usage_b, strict=True))
+
+
+def _undominated(entries: dict[Usage, tuple]) -> dict[Usage, tuple]:
+    """
+    Drop entries beaten by an entry with fewer acquisitions and at least as many games.
+
+    Args:
+        entries: Dictionary mapping usage -> tuple whose first element is games
+
+    Returns:
+        Entries that are not dominated, in order of total acquisitions
+    """
+    kept: dict[Usage, tuple] = {}
+    for usage in sorted(entries, key=sum):
+        games = entries[usage][0]
+        if any(
+            kept_entry[0] >= games and _dominates(kept_usage, usage)
+            for kept_usage, kept_entry in kept.items()
+        ):
+            continue
+        kept[usage] = entries[usage]
+    return kept
+
+
+def _plan_slot(
+    matrix: GameMatrix,
+    start_row: int,
+    pickup_rows: list[int],
+    max_per_week: int,
+) -> dict[Usage, tuple[int, Link]]:
+    """
+    Find the best switch chain for one roster slot at every acquisition usage.
+
+    Switching before day d means the old holder counts games on days < d and
+    the new holder on days >= d. A switch only lands on a day the new team
+    plays, or on the last day of a week (so the acquisition can count against
+    the earlier week): any other switch day is no better than waiting a day.
+
+    Args:
+        matrix: GameMatrix for the schedule window
+        start_row: Matrix row of the slot's current player
+        pickup_rows: Matrix rows of teams with compatible free agents
+        max_per_week: Weekly acquisition limit
+
+    Returns:
+        Dictionary mapping usage -> (games, switch history), undominated
+    """
+    num_days = len(matrix.dates)
+    week_of_day = matrix.week_of_day
+    played = matrix.played
+    zero: Usage = (0,) * matrix.num_weeks
+
+    states: dict[int, dict[Usage, tuple[int, Link]]] = {start_row: {zero: (0, None)}}
+
+    for day in range(num_days):
+        week = week_of_day[day]
+        week_ends = day + 1 < num_days and week_of_day[day + 1] != week
+
+        # Best state per usage to switch from (switching to the same team is never useful)
+        switch_from: dict[Usage, tuple[int, Link, int]] = {}
+        for row, table in states.items():
+            for usage, (games, link) in table.items():
+                if usage[week] < max_per_week and (
+                    usage not in switch_from or games > switch_from[usage][0]
+                ):
+                    switch_from[usage] = (games, link, row)
+
+        targets = [row for row in pickup_rows if played[row][day] or week_ends]
+        for usage, (games, link, from_row) in _undominated(switch_from).items():
+            new_usage = (*usage[:week], usage[week] + 1, *usage[week + 1 :])
+            for row in targets:
+                if row == from_row:
+                    continue
+                table = states.setdefault(row, {})
+                current = table.get(new_usage)
+                if current is None or games > current[0]:
+                    table[new_usage] = (games, (day, row, link))
+
+        # Holders play today's games
+        for row, table in states.items():
+            if played[row][day]:
+                for usage, (games, link) in table.items():
+                    table[usage] = (games + 1, link)
+
+    best: dict[Usage, tuple[int, Link]] = {}
+    for table in states.values():
+        for usage, entry in table.items():
+            if usage not in best or entry[0] > best[usage][0]:
+                best[usage] = entry
+
+    return _undominated(best)
+
+
+def _combine_slots(
+    slot_plans: list[dict[Usage, tuple[int, Link]]], max_per_week: int
+) -> tuple[int, tuple[Usage, ...]]:
+    """
+    Pick one usage per slot to maximize games under the weekly limit.
+
+    Args:
+        slot_plans: Per-slot results from _plan_slot
+        max_per_week: Weekly acquisition limit
+
+    Returns:
+        Tuple of (total games, chosen usage per slot)
+    """
+    if not slot_plans:
+        return 0, ()
+
+    zero: Usage = (0,) * len(next(iter(slot_plans[0])))
+
+    # Bounds for the slots not yet combined: best possible and no-move baseline
+    best_rest = [0] * (len(slot_plans) + 1)
+    baseline_rest = [0] * (len(slot_plans) + 1)
+    for i in range(len(slot_plans) - 1, -1, -1):
+        best_rest[i] = best_rest[i + 1] + max(entry[0] for entry in slot_plans[i].values())
+        baseline_rest[i] = baseline_rest[i + 1] + slot_plans[i][zero][0]
+
+    combined: dict[Usage, tuple[int, tuple[Usage, ...]]] = {zero: (0, ())}
+    for i, slot_plan in enumerate(slot_plans):
+        merged: dict[Usage, tuple[int, tuple[Usage, ...]]] = {}
+        for total_usage, (total_games, choices) in combined.items():
+            for usage, (games, _link) in slot_plan.items():
+                new_usage = tuple(a + b for a, b in zip(total_usage, usage, strict=True))
+                if max(new_usage) > max_per_week:
+                    continue
+                current = merged.get(new_usage)
+                if current is None or total_games + games > current[0]:
+                    merged[new_usage] = (total_games + games, (*choices, usage))
+
+        # Any partial plan can be finished by keeping the remaining slots as-is
+        incumbent = max(games for games, _ in merged.values()) + baseline_rest[i + 1]
+        combined = _undominated(
+            {
+                usage: entry
+                for usage, entry in merged.items()
+                if entry[0] + best_rest[i + 1] >= incumbent
+            }
+        )
+
+    # Most games, then fewest acquisitions
+    best_usage = max(combined, key=lambda usage: (combined[usage][0], -sum(usage)))
+    return combined[best_usage]
+
+
+def _unroll(link: Link) -> list[tuple[int, int]]:
+    """Convert a switch history into chronological (day, team_row) switches."""
+    switches = []
+    while link is not None:
+        day, row, link = link
+        switches.append((day, row))
+    return switches[::-1]
+
+
+def _build_summary(
+    moves: list[StreamingMove],
+    total_games: int,
+    baseline_games: int,
+    acquisitions_per_week: list[int],
+    max_per_week: int,
+) -> str:
+    """Create a human-readable summary of a streaming plan."""
+    if not moves:
+        return (
+            f"No streaming moves improve on keeping every droppable player "
+            f"({baseline_games} games)."
+        )
+
+    weeks = ", ".join(str(count) for count in acquisitions_per_week)
+    return (
+        f"{len(moves)} moves for +{total_games - baseline_games} games "
+        f"({total_games} vs {baseline_games} if kept). "
+        f"Acquisitions per week: {weeks} (limit {max_per_week})."
+    )
+
+
+def plan_streaming_moves(
+    droppable_players: list[Player],
+    available_players: list[Player],
+    schedule: Schedule,
+    max_acquisitions_per_week: int = MAX_ACQUISITIONS_PER_WEEK,
+) -> StreamingPlan:
+    """
+    Find the chain of drop/pickup moves that maximizes total games.
+
+    Args:
+        droppable_players: Droppable Player models, one roster slot each
+        available_players: Available free agent Player models
+        schedule: Schedule model covering the streaming window
+        max_acquisitions_per_week: Weekly acquisition limit
+
+    Returns:
+        StreamingPlan with moves in chronological order
+    """
+    matrix = schedule.game_matrix()
+
+    # One slot per droppable player with a known team and position
+    slots: list[tuple[Player, int, int]] = []
+    for player in droppable_players:
+        team = get_player_team_abbr(player)
+        row = matrix.row(team) if team else None
+        if player.streaming_mask and row is not None:
+            slots.append((player, player.streaming_mask, row))
+
+    # Free agents per (streaming class mask, team row), best first
+    free_agents: dict[tuple[int, int], list[Player]] = {}
+    for player in sorted(available_players, key=lambda p: p.fantasy_points or 0, reverse=True):
+        team = get_player_team_abbr(player)
+        row = matrix.row(team) if team else None
+        if player.streaming_mask and row is not None:
+            free_agents.setdefault((player.streaming_mask, row), []).append(player)
+
+    banned: list[set[int]] = [set() for _ in slots]
+
+    def slot_plan(i: int) -> dict[Usage, tuple[int, Link]]:
+        _player, position_class, row = slots[i]
+        pickup_rows = [
+            team_row
+            for (fa_class, team_row) in free_agents
+            if fa_class & position_class and team_row not in banned[i]
+        ]
+        return _plan_slot(matrix, row, sorted(pickup_rows), max_acquisitions_per_week)
+
+    slot_plans = [slot_plan(i) for i in range(len(slots))]
+    total_games, choices = _combine_slots(slot_plans, max_acquisitions_per_week)
+
+    # Each repair bans a (slot, team) pair the plan used, so this always terminates
+    repairs = 0
+    while shortage := _find_shortage(slots, slot_plans, choices, free_agents):
+        repairs += 1
+
+        # Ban the shorted team from whichever slot costs the fewest games
+        position_class, row = shortage
+        best_repair = None
+        for i, (_player, slot_class, _row) in enumerate(slots):
+            if not slot_class & position_class or not any(
+                switch_row == row for _day, switch_row in _unroll(slot_plans[i][choices[i]][1])
+            ):
+                continue
+
+            banned[i].add(row)
+            candidate_plans = [*slot_plans[:i], slot_plan(i), *slot_plans[i + 1 :]]
+            candidate = _combine_slots(candidate_plans, max_acquisitions_per_week)
+            banned[i].discard(row)
+
+            if best_repair is None or candidate[0] > best_repair[0]:
+                best_repair = (candidate[0], i, candidate_plans, candidate[1])
+
+        total_games, i, slot_plans, choices = best_repair
+        banned[i].add(row)
+
+    if repairs:
+        logger.info(f"Rebuilt streaming plan {repairs} times to fit free agent supply")
+
+    return _build_plan(
+        matrix, slots, slot_plans, choices, free_agents, total_games, max_acquisitions_per_week
+    )
+
+
+def _find_shortage(
+    slots: list[tuple[Player, int, int]],
+    slot_plans: list[dict[Usage, tuple[int, Link]]],
+    choices: Iterable[Usage],
+    free_agents: dict[tuple[int, int], list[Player]],
+) -> tuple[int, int] | None:
+    """
+    Find a (streaming class, team row) the plan needs more free agents from than exist.
+
+    Returns:
+        First short (streaming class mask, team row), or None if supply covers the plan
+    """
+    demand: dict[tuple[int, int], int] = {}
+    for (_player, position_class, _row), slot_plan, usage in zip(
+        slots, slot_plans, choices, strict=True
+    ):
+        for _day, row in _unroll(slot_plan[usage][1]):
+            key = (position_class, row)
+            demand[key] = demand.get(key, 0) + 1
+            if demand[key] > len(free_agents.get(key, [])):
+                return key
+    return None
+
+
+def _build_plan(
+    matrix: GameMatrix,
+    slots: list[tuple[Player, int, int]],
+    slot_plans: list[dict[Usage, tuple[int, Link]]],
+    choices: tuple[Usage, ...],
+    free_agents: dict[tuple[int, int], list[Player]],
+    total_games: int,
+    max_per_week: int,
+) -> StreamingPlan:
+    """Assign concrete free agents to the chosen switch chains and build the plan model."""
+    num_days = len(matrix.dates)
+    baseline_games = sum(matrix.games_per_team[row] for _player, _class, row in slots)
+
+    # Assign free agents in chronological order so earlier moves get the best players
+    switches = []
+    for slot_idx, usage in enumerate(choices):
+        chain = _unroll(slot_plans[slot_idx][usage][1])
+        for position, (day, row) in enumerate(chain):
+            next_day = chain[position + 1][0] if position + 1 < len(chain) else num_days
+            switches.append((day, slot_idx, row, next_day))
+    switches.sort(key=lambda switch: (switch[0], switch[1]))
+
+    remaining = {key: list(players) for key, players in free_agents.items()}
+    holders = [player for player, _class, _row in slots]
+    acquisitions_per_week = [0] * matrix.num_weeks
+    moves = []
+
+    for day, slot_idx, row, next_day in switches:
+        pickup_player = remaining[(slots[slot_idx][1], row)].pop(0)
+        week = matrix.week_of_day[day]
+        acquisitions_per_week[week] += 1
+
+        moves.append(
+            StreamingMove(
+                drop_player=holders[slot_idx],
+                pickup_player=pickup_player,
+                drop_date=matrix.dates[max(day - 1, 0)],
+                pickup_date=matrix.dates[day],
+                week=week + 1,
+                pickup_games=matrix.games_between(matrix.teams[row], day, next_day - 1),
+            )
+        )
+        holders[slot_idx] = pickup_player
+
+    return StreamingPlan(
+        moves=moves,
+        total_games=total_games,
+        baseline_games=baseline_games,
+        improvement=total_games - baseline_games,
+        acquisitions_per_week=acquisitions_per_week,
+        max_acquisitions_per_week=max_per_week,
+        summary=_build_summary(
+            moves, total_games, baseline_games, acquisitions_per_week, max_per_week
+        ),
+    )
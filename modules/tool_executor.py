@@ -7,6 +7,8 @@ from typing import Any, ClassVar
 
 from pydantic import BaseModel
 
+from modules.data_store import DataStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,21 +20,40 @@ class ToolExecutor:
     - Execute tool functions
     - Handle dry-run mode for side-effect tools
     - Serialize Pydantic models to dicts
+    - Store producer results and resolve data handles in tool inputs
     - Track execution time
     """
 
     SIDE_EFFECT_TOOLS: ClassVar[list[str]] = ["send_email", "save_recommendations"]
 
-    def __init__(self, tool_functions: dict[str, Callable], dry_run: bool = False):
+    # Tools whose results are stored and returned with a handle (tool name -> handle kind)
+    HANDLE_KINDS: ClassVar[dict[str, str]] = {
+        "get_current_roster": "roster",
+        "get_team_schedule": "schedule",
+        "get_players_from_teams": "players",
+        "assess_droppable_players": "droppable",
+    }
+
+    # Tools that accept handles in place of inline data
+    HANDLE_CONSUMERS: ClassVar[list[str]] = ["assess_droppable_players", "find_streaming_matches"]
+
+    def __init__(
+        self,
+        tool_functions: dict[str, Callable],
+        dry_run: bool = False,
+        data_store: DataStore | None = None,
+    ):
         """
         Initialize executor.
 
         Args:
             tool_functions: Mapping of tool name to tool function
             dry_run: If True, skip side-effect tools
+            data_store: Per-run object store (a new one is created if omitted)
         """
         self.tool_functions = tool_functions
         self.dry_run = dry_run
+        self.data_store = data_store or DataStore()
 
     def execute(self, tool_name: str, tool_input: dict[str, Any]) -> tuple[dict, float]:
         """
@@ -54,11 +75,21 @@ class ToolExecutor:
 
         try:
             start_time = time.time()
+
+            # Swap data handles (e.g., 'schedule#1') for the stored objects
+            if tool_name in self.HANDLE_CONSUMERS:
+                tool_input = {
+                    key: self.data_store.resolve(value) for key, value in tool_input.items()
+                }
+
             result = self.tool_functions[tool_name](**tool_input)
             execution_time_ms = (time.time() - start_time) * 1000
 
-            # Serialize Pydantic models
-            result = self._serialize_result(result)
+            # Store producer results; serialize Pydantic models
+            if tool_name in self.HANDLE_KINDS:
+                result = self.data_store.publish(self.HANDLE_KINDS[tool_name], result)
+            else:
+                result = self._serialize_result(result)
 
             logger.info(f"Tool '{tool_name}' executed in {execution_time_ms:.2f}ms")
             return result, execution_time_ms
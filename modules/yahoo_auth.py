@@ -15,15 +15,20 @@ from datetime import datetime
 from pathlib import Path
 
 from dotenv import load_dotenv
-from yfpy.query import YahooFantasySportsQuery
 
 # Handle imports for both direct execution and module import
 try:
+    from modules.http_cache import get_http_cache
     from modules.logger import AgentLogger
+    from modules.yahoo_session import YahooSessionQuery
+    from modules.yahoo_token_manager import YahooTokenManager, get_token_manager
 except ModuleNotFoundError:
     # Add parent directory to path when running as a script
     sys.path.insert(0, str(Path(__file__).parent.parent))
+    from modules.http_cache import get_http_cache
     from modules.logger import AgentLogger
+    from modules.yahoo_session import YahooSessionQuery
+    from modules.yahoo_token_manager import YahooTokenManager, get_token_manager
 
 load_dotenv()
 
@@ -36,7 +41,7 @@ def get_yahoo_query(
     consumer_key: str | None = None,
     consumer_secret: str | None = None,
     access_token_json: str | None = None,
-) -> YahooFantasySportsQuery:
+) -> YahooSessionQuery:
     """
     Initialize Yahoo Fantasy Sports Query with robust token handling.
 
@@ -47,7 +52,7 @@ def get_yahoo_query(
         access_token_json: JSON string containing all token data (defaults to env var)
 
     Returns:
-        Configured YahooFantasySportsQuery object
+        Configured YahooSessionQuery object
 
     Raises:
         ValueError: If required credentials are missing
@@ -70,20 +75,47 @@ def get_yahoo_query(
         logger.error(f"Missing required credentials: {', '.join(missing)}")
         raise ValueError(f"Missing required credentials: {', '.join(missing)}")
 
+    token_data = _load_env_token_data(access_token_json)
+    manager = get_token_manager(consumer_key, consumer_secret, token_data)
+    if manager.has_refresh_token():
+        # YahooSessionQuery refreshes through the manager if this token is stale
+        return _create_query_with_token(league_id, consumer_key, consumer_secret, manager.token)
+
+    logger.warning(
+        "No token data found - starting OAuth flow (requires interactive authentication)"
+    )
+    logger.info("To authenticate for CI/CD:")
+    logger.info("  1. Run locally: python fantasy_hockey_agent.py --dry-run")
+    logger.info("  2. Complete OAuth flow in browser")
+    logger.info("  3. Export tokens: python modules/yahoo_auth.py export")
+    logger.info("  4. Add YAHOO_ACCESS_TOKEN_JSON to GitHub secrets")
+
+    return YahooSessionQuery(
+        league_id=league_id,
+        game_code="nhl",
+        game_id=None,
+        yahoo_consumer_key=consumer_key,
+        yahoo_consumer_secret=consumer_secret,
+        env_file_location=Path("."),
+        save_token_data_to_env_file=True,
+    )
+
+
+def _load_env_token_data(access_token_json: str | None = None) -> dict | None:
+    """
+    Read token data from YAHOO_ACCESS_TOKEN_JSON or the individual token env vars.
+
+    Args:
+        access_token_json: JSON string containing all token data (defaults to env var)
+
+    Returns:
+        Token data dictionary, or None if no token is configured
+    """
     access_token_json = access_token_json or os.getenv("YAHOO_ACCESS_TOKEN_JSON")
 
     if access_token_json:
         try:
-            token_data = json.loads(access_token_json.strip())
-
-            if token_data.get("token_time"):
-                token_age_hours = (datetime.now().timestamp() - token_data["token_time"]) / 3600
-                if token_age_hours > 1:
-                    logger.info(
-                        f"Access token expired ({token_age_hours:.1f}h old, will auto-refresh)"
-                    )
-
-            return _create_query_with_token(league_id, consumer_key, consumer_secret, token_data)
+            return json.loads(access_token_json.strip())
         except json.JSONDecodeError as e:
             logger.error(f"Invalid YAHOO_ACCESS_TOKEN_JSON format: {e}")
             logger.error(f"JSON parse error at position {e.pos}")
@@ -98,39 +130,45 @@ def get_yahoo_query(
     token_type = os.getenv("YAHOO_TOKEN_TYPE", "bearer")
 
     if access_token and refresh_token:
-        token_data = {
+        return {
             "access_token": access_token,
             "refresh_token": refresh_token,
             "token_time": float(token_time) if token_time else None,
             "token_type": token_type,
         }
-        return _create_query_with_token(league_id, consumer_key, consumer_secret, token_data)
 
-    logger.warning(
-        "No token data found - starting OAuth flow (requires interactive authentication)"
-    )
-    logger.info("To authenticate for CI/CD:")
-    logger.info("  1. Run locally: python fantasy_hockey_agent.py --dry-run")
-    logger.info("  2. Complete OAuth flow in browser")
-    logger.info("  3. Export tokens: python modules/yahoo_auth.py export")
-    logger.info("  4. Add YAHOO_ACCESS_TOKEN_JSON to GitHub secrets")
+    return None
 
-    return YahooFantasySportsQuery(
-        league_id=league_id,
-        game_code="nhl",
-        game_id=None,
-        yahoo_consumer_key=consumer_key,
-        yahoo_consumer_secret=consumer_secret,
-        env_file_location=Path("."),
-        save_token_data_to_env_file=True,
-    )
+
+def start_token_refresh() -> YahooTokenManager | None:
+    """
+    Start refreshing the Yahoo token in the background.
+
+    Called at startup so the first refresh overlaps other startup work; the
+    shared query then picks up the ready token. Failures are logged, and the
+    query falls back to refreshing on first use.
+
+    Returns:
+        The running token manager, or None if no credentials or token are configured
+    """
+    consumer_key = os.getenv("YAHOO_CLIENT_ID")
+    consumer_secret = os.getenv("YAHOO_CLIENT_SECRET")
+    if not consumer_key or not consumer_secret or get_http_cache().mode == "replay":
+        return None
+
+    manager = get_token_manager(consumer_key, consumer_secret, _load_env_token_data())
+    if not manager.has_refresh_token():
+        return None
+
+    manager.start()
+    return manager
 
 
 def _create_query_with_token(
     league_id: str, consumer_key: str, consumer_secret: str, token_data: dict
-) -> YahooFantasySportsQuery:
+) -> YahooSessionQuery:
     """
-    Create YahooFantasySportsQuery with existing token data.
+    Create YahooSessionQuery with existing token data.
 
     Args:
         league_id: Yahoo Fantasy League ID
@@ -139,7 +177,7 @@ def _create_query_with_token(
         token_data: Dictionary containing token information
 
     Returns:
-        Configured YahooFantasySportsQuery object
+        Configured YahooSessionQuery object
     """
     try:
         full_token_data = {
@@ -149,7 +187,7 @@ def _create_query_with_token(
             "guid": None,
         }
 
-        return YahooFantasySportsQuery(
+        return YahooSessionQuery(
             league_id=league_id,
             game_code="nhl",
             game_id=None,
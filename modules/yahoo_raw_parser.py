@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Single-pass parser for raw Yahoo Fantasy player collection JSON.
+
+yfpy unpacks every response into a recursive object graph, and the tools then
+probe it with hasattr/isinstance chains. For player collections (200+ free
+agents per run) this parser walks the raw JSON once and returns flat dicts
+with just the fields the tools use.
+
+Enable it with YAHOO_RAW_PARSER=true. Run this module to benchmark it against
+the yfpy path, on recorded responses or a synthetic payload:
+
+    python modules/yahoo_raw_parser.py [response.json ...] [--players 250] [--rounds 1]
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+# Handle imports for both direct execution (the benchmark) and module import
+try:
+    from modules.stat_vectors import stat_vector
+except ModuleNotFoundError:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from modules.stat_vectors import stat_vector
+
+# Parse Yahoo player collections from raw JSON instead of yfpy objects
+YAHOO_RAW_PARSER = os.getenv("YAHOO_RAW_PARSER", "false").lower() in ("1", "true", "yes")
+
+
+def _to_float(value: Any) -> float:
+    """Parse a Yahoo numeric string, treating missing values ('-', '') as 0."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _merge_fields(items: list) -> dict[str, Any]:
+    """Merge Yahoo's list of single-key dicts (with [] padding) into one dict."""
+    merged: dict[str, Any] = {}
+    for item in items:
+        if isinstance(item, dict):
+            merged.update(item)
+    return merged
+
+
+def _eligible_positions(value: Any) -> list[str]:
+    """Get position strings from Yahoo's eligible_positions node."""
+    if isinstance(value, dict):
+        value = [value]
+    if not isinstance(value, list):
+        return [value] if isinstance(value, str) else []
+    return [item.get("position") if isinstance(item, dict) else item for item in value]
+
+
+def parse_player(player_node: list) -> dict[str, Any]:
+    """
+    Parse one raw Yahoo 'player' node.
+
+    Args:
+        player_node: Value of a 'player' key: a list of field lists and dicts
+
+    Returns:
+        Dictionary with player_key, player_id, name, editorial_team_abbr, primary_position,
+        display_position, eligible_positions, selected_position, status,
+        fantasy_points and stats (stat vector indexed by stat_id)
+    """
+    fields: dict[str, Any] = {}
+    for part in player_node:
+        if isinstance(part, list):
+            fields.update(_merge_fields(part))
+        elif isinstance(part, dict):
+            fields.update(part)
+
+    name = fields.get("name")
+    points = fields.get("player_points") or {}
+    stats = (fields.get("player_stats") or {}).get("stats") or []
+
+    selected = fields.get("selected_position")
+    if isinstance(selected, list):
+        selected = _merge_fields(selected)
+
+    return {
+        "player_key": fields.get("player_key"),
+        "player_id": fields.get("player_id"),
+        "name": name.get("full") if isinstance(name, dict) else name,
+        "editorial_team_abbr": fields.get("editorial_team_abbr", ""),
+        "primary_position": fields.get("primary_position", ""),
+        "display_position": fields.get("display_position", ""),
+        "eligible_positions": _eligible_positions(fields.get("eligible_positions")),
+        "selected_position": selected.get("position") if isinstance(selected, dict) else None,
+        "status": fields.get("status", ""),
+        "fantasy_points": _to_float(points.get("total")) if isinstance(points, dict) else 0.0,
+        "stats": stat_vector(
+            (stat["stat"]["stat_id"], stat["stat"].get("value"))
+            for stat in stats
+            if isinstance(stat, dict) and "stat" in stat
+        ),
+    }
+
+
+def parse_player_collection(players_node: Any) -> list[dict[str, Any]]:
+    """
+    Parse a raw Yahoo 'players' collection node.
+
+    Args:
+        players_node: Value of a 'players' key: {"0": {"player": [...]}, ..., "count": n},
+            or [] when the collection is empty
+
+    Returns:
+        Parsed players in collection order
+    """
+    if not isinstance(players_node, dict):
+        return []
+
+    count = int(players_node.get("count", 0))
+    return [parse_player(players_node[str(i)]["player"]) for i in range(count)]
+
+
+def parse_league_players(response_json: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Parse the players of a raw league/{key}/players response.
+
+    Args:
+        response_json: Decoded response body (with the 'fantasy_content' root)
+
+    Returns:
+        Parsed players in collection order
+    """
+    league = response_json.get("fantasy_content", {}).get("league", [])
+    return parse_player_collection(_merge_fields(league).get("players"))
+
+
+def parse_team(team_node: list) -> dict[str, Any]:
+    """
+    Parse one raw Yahoo 'team' node, with its roster if requested.
+
+    Args:
+        team_node: Value of a 'team' key: a list of field lists and dicts
+
+    Returns:
+        Dictionary with team_key, team_id, name, is_owned_by_current_login and
+        players (parsed as in parse_player; empty without a roster)
+    """
+    fields: dict[str, Any] = {}
+    for part in team_node:
+        if isinstance(part, list):
+            fields.update(_merge_fields(part))
+        elif isinstance(part, dict):
+            fields.update(part)
+
+    # Roster: {"coverage_type": ..., "0": {"players": {...}}, ...}
+    roster = fields.get("roster")
+    players_node = roster.get("0", {}).get("players") if isinstance(roster, dict) else None
+
+    return {
+        "team_key": fields.get("team_key"),
+        "team_id": fields.get("team_id"),
+        "name": fields.get("name"),
+        "is_owned_by_current_login": str(fields.get("is_owned_by_current_login", 0)) == "1",
+        "players": parse_player_collection(players_node),
+    }
+
+
+def parse_league_rosters(response_json: dict[str, Any]) -> dict[str, Any]:
+    """
+    Parse a raw league/{key}/teams/roster/players/stats response.
+
+    Args:
+        response_json: Decoded response body (with the 'fantasy_content' root)
+
+    Returns:
+        Dictionary with league (league_key, league_id, name, season,
+        current_week, game_code) and teams (parsed as in parse_team)
+    """
+    league = _merge_fields(response_json.get("fantasy_content", {}).get("league", []))
+
+    teams_node = league.get("teams")
+    teams = []
+    if isinstance(teams_node, dict):
+        teams = [
+            parse_team(teams_node[str(i)]["team"]) for i in range(int(teams_node.get("count", 0)))
+        ]
+
+    return {
+        "league": {
+            key: league.get(key)
+            for key in ("league_key", "league_id", "name", "season", "current_week", "game_code")
+        },
+        "teams": teams,
+    }
+
+
+def _synthetic_response(num_players: int, offset: int = 0) -> dict[str, Any]:
+    """Build a league players response shaped like Yahoo's, for benchmarking."""
+    teams = ["TOR", "EDM", "COL", "TB", "NJ", "LA", "SJ", "BOS", "MTL", "VGK"]
+    positions = [["C", "LW"], ["LW"], ["RW"], ["D"], ["G"]]
+    players = {}
+    for n in range(num_players):
+        i = offset + n
+        eligible = positions[i % len(positions)]
+        meta = [
+            {"player_key": f"453.p.{1000 + i}"},
+            {"player_id": str(1000 + i)},
+            {"name": {"full": f"Player {i}", "first": "Player", "last": str(i)}},
+            {"url": f"https://sports.yahoo.com/nhl/players/{1000 + i}"},
+            {"editorial_player_key": f"nhl.p.{1000 + i}"},
+            {"editorial_team_key": f"nhl.t.{i % len(teams)}"},
+            {"editorial_team_full_name": "Team"},
+            {"editorial_team_abbr": teams[i % len(teams)]},
+            {"uniform_number": str(i % 99)},
+            {"display_position": ",".join(eligible)},
+            {"headshot": {"url": "https://s.yimg.com/x.png", "size": "small"}},
+            {"image_url": "https://s.yimg.com/x.png"},
+            {"is_undroppable": "0"},
+            {"position_type": "G" if eligible == ["G"] else "P"},
+            {"primary_position": eligible[0]},
+            {"eligible_positions": [{"position": p} for p in [*eligible, "Util"]]},
+            [],
+            {"status": "DTD"} if i % 7 == 0 else [],
+        ]
+        stats = [{"stat": {"stat_id": str(s), "value": str((i * s) % 17)}} for s in range(0, 32)]
+        players[str(n)] = {
+            "player": [
+                meta,
+                {
+                    "player_stats": {
+                        "0": {"coverage_type": "season", "season": "2025"},
+                        "stats": stats,
+                    },
+                    "player_points": {
+                        "0": {"coverage_type": "season", "season": "2025"},
+                        "total": str(round(i * 0.37, 2)),
+                    },
+                },
+            ]
+        }
+    players["count"] = num_players
+
+    return {
+        "fantasy_content": {
+            "league": [
+                {"league_key": "453.l.12345", "league_id": "12345", "name": "Benchmark League"},
+                {"players": players},
+            ]
+        }
+    }
+
+
+def _benchmark(payloads: list[dict[str, Any]], rounds: int) -> None:
+    """Time the yfpy path and the raw path over the same payloads."""
+    import time
+    from collections import Counter
+
+    from yfpy.models import YahooFantasyObject
+    from yfpy.utils import reformat_json_list, unpack_data
+
+    from tools.get_players_from_teams import _raw_to_player_model, _to_player_model
+
+    def yfpy_path(payload: dict[str, Any]) -> list:
+        league = payload["fantasy_content"]["league"]
+        unpacked = unpack_data(reformat_json_list(league)["players"], YahooFantasyObject)
+        players = [item["player"] for item in unpacked] if isinstance(unpacked, list) else []
+        return [_to_player_model(player) for player in players]
+
+    def raw_path(payload: dict[str, Any]) -> list:
+        return [_raw_to_player_model(player) for player in parse_league_players(payload)]
+
+    num_players = sum(len(parse_league_players(payload)) for payload in payloads)
+    print(f"Benchmarking {len(payloads)} payload(s), {num_players} players, {rounds} rounds")
+
+    results = {}
+    for label, path in (("yfpy", yfpy_path), ("raw", raw_path)):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            results[label] = [model for payload in payloads for model in path(payload)]
+        elapsed_ms = (time.perf_counter() - start) * 1000 / rounds
+        print(f"  {label:<5} {elapsed_ms:8.2f} ms/round")
+
+    # yfpy flattens Yahoo's list of {"position": ...} dicts down to its first
+    # entry, so eligible_positions is expected to differ (raw keeps them all)
+    differing = Counter()
+    for yfpy_model, raw_model in zip(results["yfpy"], results["raw"], strict=True):
+        yfpy_fields = yfpy_model.model_dump() if yfpy_model else {}
+        raw_fields = raw_model.model_dump() if raw_model else {}
+        differing.update(
+            key
+            for key in yfpy_fields.keys() | raw_fields.keys()
+            if yfpy_fields.get(key) != raw_fields.get(key)
+        )
+    summary = ", ".join(f"{key} ({count})" for key, count in differing.most_common())
+    print(f"  Fields differing: {summary or 'none'}")
+
+
+def main():
+    """Benchmark the raw parser against yfpy on recorded or synthetic payloads."""
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Benchmark raw Yahoo player parsing vs yfpy")
+    parser.add_argument("files", nargs="*", help="Recorded league players JSON responses")
+    parser.add_argument("--players", type=int, default=250, help="Synthetic payload size")
+    parser.add_argument("--rounds", type=int, default=1, help="Timing rounds")
+    args = parser.parse_args()
+
+    if args.files:
+        payloads = [json.loads(Path(file).read_text()) for file in args.files]
+    else:
+        # Pages of 25, like the free agent fetch
+        payloads = [
+            _synthetic_response(min(25, args.players - start), start)
+            for start in range(0, args.players, 25)
+        ]
+
+    _benchmark(payloads, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
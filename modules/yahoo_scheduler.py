@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Central scheduler for Yahoo Fantasy API requests.
+
+Yahoo answers bursts with 999 "Request denied" (and sometimes 429). Every
+Yahoo request goes through one scheduler, mounted as a requests adapter on
+the shared session, which:
+
+- Paces requests with a token bucket (YAHOO_RATE_LIMIT per second, bursts of
+  YAHOO_RATE_BURST)
+- Caps requests in flight with an AIMD limit: halved on 999/429, grown by one
+  after a full window of successes, never above YAHOO_POOL_SIZE
+- Retries 999/429/5xx responses and connection errors with jittered
+  exponential back-off (the only retry layer: yfpy's own retries are disabled
+  on the shared query)
+- Records per-endpoint metrics (requests, retries, throttles, errors, latency)
+"""
+
+import logging
+import os
+import random
+import re
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Sustained Yahoo requests per second, and how many may go out back-to-back
+YAHOO_RATE_LIMIT = float(os.getenv("YAHOO_RATE_LIMIT", "4"))
+YAHOO_RATE_BURST = int(os.getenv("YAHOO_RATE_BURST", "8"))
+
+# Attempts after the first for throttled or failed requests
+YAHOO_MAX_RETRIES = int(os.getenv("YAHOO_MAX_RETRIES", "4"))
+
+# Back-off before retry n is uniform in [0, min(cap, base * 2**n)] seconds
+RETRY_BACKOFF_BASE = 1.0
+RETRY_BACKOFF_CAP = 30.0
+
+# Throttled responses within this many seconds of a decrease count as one event
+DECREASE_WINDOW = 1.0
+
+# Yahoo's rate-limit status, plus the standard one
+THROTTLE_STATUS_CODES = frozenset({429, 999})
+
+# Yahoo resource keys (453.l.12345, 453.p.6789, nhl) aren't part of the endpoint
+_RESOURCE_KEY = re.compile(r"^(\d+(\.\w+)*|nhl)$")
+
+
+def endpoint_name(url: str) -> str:
+    """
+    Reduce a Yahoo API URL to its endpoint, for metrics.
+
+    'https://.../fantasy/v2/league/453.l.1/players;status=FA;start=25/stats'
+    becomes 'league/players/stats'.
+    """
+    path = url.split("?", 1)[0].split("/fantasy/v2/", 1)[-1]
+    segments = (segment.split(";", 1)[0] for segment in path.split("/"))
+    return "/".join(s for s in segments if s and not _RESOURCE_KEY.match(s)) or path
+
+
+class YahooRequestScheduler:
+    """
+    Token-bucket, adaptive-concurrency scheduler for Yahoo requests.
+
+    Responsibilities:
+    - Pace request starts to a sustained rate with bounded bursts
+    - Adapt the in-flight limit to throttling (AIMD)
+    - Retry throttled and failed requests with jittered back-off
+    - Collect per-endpoint request metrics
+    """
+
+    def __init__(
+        self,
+        rate: float = YAHOO_RATE_LIMIT,
+        burst: int = YAHOO_RATE_BURST,
+        max_concurrency: int = 8,
+        max_retries: int = YAHOO_MAX_RETRIES,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            rate: Sustained requests per second
+            burst: Token bucket capacity
+            max_concurrency: Upper bound on requests in flight
+            max_retries: Retries per request after the first attempt
+            sleep: Sleep function (replaceable for tests and benchmarks)
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self._sleep = sleep
+
+        self._tokens = float(self.burst)
+        self._refilled_at = time.monotonic()
+        self._bucket_lock = threading.Lock()
+
+        self.concurrency_limit = self.max_concurrency
+        self._in_flight = 0
+        self._successes = 0
+        self._decreased_at = 0.0
+        self._slots = threading.Condition()
+
+        self._metrics: dict[str, dict[str, float]] = {}
+        self._metrics_lock = threading.Lock()
+
+    def _take_token(self) -> None:
+        """Block until the bucket has a token, then take it."""
+        while True:
+            with self._bucket_lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+                self._refilled_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+
+    def _acquire_slot(self) -> None:
+        with self._slots:
+            self._slots.wait_for(lambda: self._in_flight < self.concurrency_limit)
+            self._in_flight += 1
+
+    def _release_slot(self, throttled: bool) -> None:
+        with self._slots:
+            self._in_flight -= 1
+            now = time.monotonic()
+            if throttled and now - self._decreased_at >= DECREASE_WINDOW:
+                # Multiplicative decrease, once per burst of throttled responses
+                self.concurrency_limit = max(1, self.concurrency_limit // 2)
+                self._successes = 0
+                self._decreased_at = now
+                logger.warning(
+                    f"Yahoo throttled requests; concurrency limit now {self.concurrency_limit}"
+                )
+            elif not throttled:
+                # Additive increase after a full window of successes
+                self._successes += 1
+                if (
+                    self._successes >= self.concurrency_limit
+                    and self.concurrency_limit < self.max_concurrency
+                ):
+                    self.concurrency_limit += 1
+                    self._successes = 0
+            self._slots.notify_all()
+
+    def _record(self, endpoint: str, **counts: float) -> None:
+        with self._metrics_lock:
+            metrics = self._metrics.setdefault(
+                endpoint,
+                {
+                    "requests": 0,
+                    "responses": 0,
+                    "retries": 0,
+                    "throttled": 0,
+                    "errors": 0,
+                    "latency_s": 0.0,
+                },
+            )
+            for name, value in counts.items():
+                metrics[name] += value
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential back-off for a retry attempt."""
+        return random.uniform(0, min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 2**attempt))
+
+    def send(self, url: str, send: Callable[[], requests.Response]) -> requests.Response:
+        """
+        Send one Yahoo request under the rate and concurrency limits.
+
+        Args:
+            url: Request URL (used for per-endpoint metrics)
+            send: Performs the request once
+
+        Returns:
+            The first successful response, or the last response if every
+            attempt was throttled or failed with a 5xx status
+
+        Raises:
+            requests.ConnectionError: If every attempt failed to connect
+            requests.Timeout: If every attempt timed out
+        """
+        endpoint = endpoint_name(url)
+        attempt = 0
+
+        while True:
+            self._take_token()
+            self._acquire_slot()
+            started = time.monotonic()
+            throttled = False
+            try:
+                response = send()
+            except (requests.ConnectionError, requests.Timeout):
+                self._record(endpoint, requests=1, errors=1)
+                if attempt == self.max_retries:
+                    raise
+            else:
+                throttled = response.status_code in THROTTLE_STATUS_CODES
+                failed = throttled or response.status_code >= 500
+                self._record(
+                    endpoint,
+                    requests=1,
+                    responses=1,
+                    throttled=int(throttled),
+                    errors=int(failed and not throttled),
+                    latency_s=time.monotonic() - started,
+                )
+                if not failed or attempt == self.max_retries:
+                    return response
+                # Unread bodies hold their pooled connection until closed
+                response.close()
+            finally:
+                self._release_slot(throttled)
+
+            delay = self._backoff(attempt)
+            attempt += 1
+            self._record(endpoint, retries=1)
+            logger.debug(f"Retrying Yahoo {endpoint} in {delay:.1f}s (attempt {attempt + 1})")
+            self._sleep(delay)
+
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        """
+        Get per-endpoint metrics.
+
+        Returns:
+            Endpoint -> requests, retries, throttled, errors and avg_latency_ms
+        """
+        with self._metrics_lock:
+            return {
+                endpoint: {
+                    "requests": int(m["requests"]),
+                    "retries": int(m["retries"]),
+                    "throttled": int(m["throttled"]),
+                    "errors": int(m["errors"]),
+                    "avg_latency_ms": round(m["latency_s"] * 1000 / max(1, m["responses"]), 1),
+                }
+                for endpoint, m in sorted(self._metrics.items())
+            }
+
+    def log_metrics(self) -> None:
+        """Log a one-line summary per endpoint."""
+        for endpoint, m in self.metrics().items():
+            logger.info(
+                f"Yahoo {endpoint}: {m['requests']} requests, {m['retries']} retries, "
+                f"{m['throttled']} throttled, {m['errors']} errors, "
+                f"{m['avg_latency_ms']} ms avg"
+            )
+
+
+class ScheduledHTTPAdapter(HTTPAdapter):
+    """requests adapter that sends every request through a YahooRequestScheduler."""
+
+    def __init__(self, *args, scheduler: YahooRequestScheduler, **kwargs):
+        """
+        Initialize adapter.
+
+        Args:
+            scheduler: Request scheduler
+            *args, **kwargs: Passed on to the next adapter (e.g., pool sizes)
+        """
+        self.scheduler = scheduler
+        super().__init__(*args, **kwargs)
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        def send_once() -> requests.Response:
+            return super(ScheduledHTTPAdapter, self).send(request, **kwargs)
+
+        return self.scheduler.send(request.url, send_once)
+
+
+# Scheduler shared by every Yahoo request in this process
+_scheduler: YahooRequestScheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def get_yahoo_scheduler(max_concurrency: int = 8) -> YahooRequestScheduler:
+    """
+    Get the process-wide Yahoo request scheduler, creating it on first use.
+
+    Args:
+        max_concurrency: Upper bound on requests in flight (used on creation)
+
+    Returns:
+        Shared YahooRequestScheduler
+    """
+    global _scheduler
+
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = YahooRequestScheduler(max_concurrency=max_concurrency)
+        return _scheduler
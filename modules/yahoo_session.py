@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Yahoo query with a shared keep-alive connection pool.
+
+yfpy talks to Yahoo through the requests session of its OAuth2 client. This
+subclass mounts a pooled HTTPAdapter on that session every time it is
+(re)authenticated, and serializes authentication so a 401 seen by several
+threads at once triggers a single token refresh instead of a burst of them.
+
+Every request is paced and retried by the shared Yahoo request scheduler
+(see modules/yahoo_scheduler.py), so yfpy's own retries are turned off: its
+retry counters are instance fields that threads sharing the query would race
+on and never reset, and its retries would stack on the scheduler's.
+
+When HTTP_CACHE_MODE is set, the adapter also records or replays responses
+(see modules/http_cache.py); cache hits skip the scheduler. Replay skips
+OAuth entirely, so runs work offline.
+
+The subclass overrides yfpy internals (_authenticate, _yahoo_access_token_dict,
+the _retries/_backoff fields), so pyproject.toml pins yfpy to 17.x.
+"""
+
+import logging
+import os
+import threading
+from collections import deque
+from types import SimpleNamespace
+
+import requests
+from yfpy.query import YahooFantasySportsQuery
+
+from modules.http_cache import CachingHTTPAdapter, get_http_cache
+from modules.yahoo_scheduler import ScheduledHTTPAdapter, get_yahoo_scheduler
+from modules.yahoo_token_manager import current_token_manager
+
+logger = logging.getLogger(__name__)
+
+# Keep-alive connections kept open to Yahoo (upper bound on parallel requests)
+YAHOO_POOL_SIZE = int(os.getenv("YAHOO_POOL_SIZE", "8"))
+
+# Recent queries kept in yfpy's executed_queries (it never drops any, and the
+# shared query lives as long as the process)
+YAHOO_QUERY_HISTORY = int(os.getenv("YAHOO_QUERY_HISTORY", "20"))
+
+# Token fields yfpy passes to its OAuth2 client
+TOKEN_FIELDS = ("access_token", "refresh_token", "token_time", "token_type", "guid")
+
+
+class _CachedScheduledHTTPAdapter(CachingHTTPAdapter, ScheduledHTTPAdapter):
+    """Serves cache hits directly and schedules live requests."""
+
+
+class YahooSessionQuery(YahooFantasySportsQuery):
+    """
+    YahooFantasySportsQuery that reuses pooled HTTPS connections.
+
+    Responsibilities:
+    - Mount a keep-alive connection pool on the OAuth2 session
+    - Send requests through the shared request scheduler
+    - Route requests through the HTTP response cache when it is enabled
+    - Serialize (re)authentication across threads sharing the query
+    - Leave retries to the scheduler (yfpy retries disabled), resending once
+      after a 401 re-authentication
+    - Take the access token from the shared token manager, re-mounting the
+      session (once across threads) when the manager has refreshed it
+    - Keep only recent entries in yfpy's executed_queries
+    """
+
+    # Class-level so it exists before yfpy's __init__ calls _authenticate()
+    _auth_lock = threading.RLock()
+    _session_token_time: float | None = None
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initialize query with yfpy's retries disabled (see module docstring).
+
+        yfpy appends every response to executed_queries; it is replaced with a
+        deque of the last YAHOO_QUERY_HISTORY entries so the shared query
+        doesn't hold every response body for the life of the process.
+        """
+        super().__init__(*args, **{**kwargs, "retries": 0, "backoff": 0})
+        self.executed_queries = deque(self.executed_queries, maxlen=YAHOO_QUERY_HISTORY)
+
+    def _authenticate(self) -> None:
+        """Authenticate with Yahoo and mount the pooled adapter on the new session."""
+        cache = get_http_cache()
+        scheduler = get_yahoo_scheduler(max_concurrency=YAHOO_POOL_SIZE)
+
+        with self._auth_lock:
+            if cache.mode == "replay":
+                # Replayed responses need no token, so don't refresh one offline
+                self.oauth = SimpleNamespace(session=requests.Session())
+            else:
+                manager = current_token_manager()
+                if manager is not None:
+                    # A token valid past yfpy's expiry check means no refresh in super()
+                    token = manager.get_token()
+                    self._yahoo_access_token_dict.update(
+                        {key: token.get(key) for key in TOKEN_FIELDS if key in token}
+                    )
+                super()._authenticate()
+                if manager is not None:
+                    # Only mark the token as in use once the session is built with it
+                    self._session_token_time = token.get("token_time", manager.token_time)
+
+            pool_args = {"pool_connections": 1, "pool_maxsize": YAHOO_POOL_SIZE}
+            if cache.enabled:
+                adapter = _CachedScheduledHTTPAdapter(cache=cache, scheduler=scheduler, **pool_args)
+            else:
+                adapter = ScheduledHTTPAdapter(scheduler=scheduler, **pool_args)
+            self.oauth.session.mount("https://", adapter)
+            logger.debug(f"Mounted Yahoo connection pool (maxsize={YAHOO_POOL_SIZE})")
+
+    def _sync_session_token(self) -> None:
+        """Re-authenticate once if the token manager refreshed the token since the last mount."""
+        manager = current_token_manager()
+        if manager is None or self._session_token_time is None:
+            return
+        if manager.token_time == self._session_token_time:
+            return
+
+        with self._auth_lock:
+            # Threads that saw the same refresh wait here; only the first re-mounts
+            if manager.token_time != self._session_token_time:
+                self._authenticate()
+
+    def get_response(self, url: str) -> requests.Response:
+        """
+        Send a request, first switching to a token refreshed in the background.
+
+        Throttled and failed requests were already retried by the scheduler, so
+        the only retry here is a single resend after yfpy re-authenticates on a 401.
+        """
+        self._sync_session_token()
+
+        try:
+            return super().get_response(url)
+        except requests.HTTPError as e:
+            # yfpy re-authenticated on the 401; resend once with the new token
+            if e.response is None or e.response.status_code != 401:
+                raise
+            return super().get_response(url)
@@ -6,6 +6,14 @@ Fetches individual stat values from Yahoo Fantasy API to use as the source of tr
 for player statistics, particularly games played for PPG calculations.
 """
 
+import os
+from array import array
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+from modules.stat_vectors import StatMatrix, get_stat, is_missing, stat_vector
+from modules.yahoo_raw_parser import YAHOO_RAW_PARSER, parse_league_players
+
 try:
     from modules.logger import AgentLogger
 
@@ -23,63 +31,100 @@ STAT_ID_GAMES_PLAYED = 0  # For skaters
 STAT_ID_GAMES_STARTED = 18  # For goalies
 STAT_ID_GOALIE_GAMES = 30  # Alternative goalie games stat
 
+# Yahoo accepts at most 25 player keys per players;player_keys=... request
+PLAYER_KEYS_PER_REQUEST = 25
 
-def parse_stat_value(value) -> float:
-    """
-    Parse a stat value from Yahoo API into a float.
+# Maximum player-key chunks requested in parallel
+STATS_FETCH_CONCURRENCY = int(os.getenv("YAHOO_STATS_CONCURRENCY", "4"))
 
-    Yahoo API can return stats as int, float, string, or None.
+
+def get_player_stats_from_yahoo(player, is_goalie: bool) -> array | None:
+    """
+    Extract stat values from a Yahoo Fantasy player object.
 
     Args:
-        value: Raw stat value from Yahoo API
+        player: Yahoo Fantasy player object from yfpy
+        is_goalie: True if player is a goalie
 
     Returns:
-        Parsed float value, or 0 if None/invalid
+        Stat vector indexed by stat_id (MISSING where not reported), or None
+        if no stats are available
     """
-    if value is None:
-        return 0
+    if not hasattr(player, "player_stats") or not player.player_stats:
+        return None
 
-    try:
-        return float(value)
-    except (ValueError, TypeError):
-        logger.warning(f"Could not parse stat value: {value}")
-        return 0
+    # Yahoo API structure: player.player_stats.stats is a list of stat objects
+    # Each stat object has: stat_id, value
+    stats_list = getattr(player.player_stats, "stats", None)
+    if isinstance(stats_list, list):
+        pairs = [
+            (stat.stat_id, stat.value)
+            for stat in stats_list
+            if hasattr(stat, "stat_id") and hasattr(stat, "value")
+        ]
+    elif isinstance(stats_list, dict):
+        pairs = list(stats_list.items())
+    else:
+        pairs = []
+
+    return stat_vector(pairs) if pairs else None
 
 
-def get_player_stats_from_yahoo(player, is_goalie: bool) -> dict[str, float] | None:
+def games_played_from_stats(stats: Sequence[float] | None, is_goalie: bool) -> int | None:
     """
-    Extract stat values from a Yahoo Fantasy player object.
+    Get games played/started from a stat vector.
+
+    For skaters: uses stat_id 0 (Games Played)
+    For goalies: uses stat_id 18 (Games Started), fallback to stat_id 30 (Goalie Games)
 
     Args:
-        player: Yahoo Fantasy player object from yfpy
+        stats: Stat vector or StatMatrix row indexed by stat_id
         is_goalie: True if player is a goalie
 
     Returns:
-        Dictionary with stat_id -> value mappings, or None if no stats available
-        Example: {0: 10.0, 1: 5.0, 2: 8.0} for games_played, goals, assists
+        Games played/started as integer, or None if not available (a skater's
+        '-' games played is reported, so it counts as 0)
     """
-    if not hasattr(player, "player_stats") or not player.player_stats:
+    if stats is None:
         return None
 
-    stats_dict = {}
+    if is_goalie:
+        # Games started (stat_id 18), then goalie games (stat_id 30)
+        for stat_id in (STAT_ID_GAMES_STARTED, STAT_ID_GOALIE_GAMES):
+            games = get_stat(stats, stat_id)
+            if games is not None and games > 0:
+                return int(games)
+        return None
 
-    # Yahoo API structure: player.player_stats.stats is a list of stat objects
-    # Each stat object has: stat_id, value
-    if hasattr(player.player_stats, "stats") and player.player_stats.stats:
-        stats_list = player.player_stats.stats
+    # For skaters, use stat_id 0 (Games Played)
+    games = get_stat(stats, STAT_ID_GAMES_PLAYED)
+    return int(games) if games is not None else None
+
+
+def games_played_from_matrix(matrix: StatMatrix, is_goalie: Sequence[bool]) -> list[int | None]:
+    """
+    Get games played/started for every player in a batch.
+
+    Same rules as games_played_from_stats, applied column-wise.
+
+    Args:
+        matrix: Batch stats
+        is_goalie: Per matrix row (matrix.keys order), True if the player is a goalie
 
-        # Handle both list and dict formats
-        if isinstance(stats_list, list):
-            for stat in stats_list:
-                if hasattr(stat, "stat_id") and hasattr(stat, "value"):
-                    stat_id = int(stat.stat_id)
-                    value = parse_stat_value(stat.value)
-                    stats_dict[stat_id] = value
-        elif isinstance(stats_list, dict):
-            for stat_id, value in stats_list.items():
-                stats_dict[int(stat_id)] = parse_stat_value(value)
+    Returns:
+        Games played/started per row, None where not available
+    """
+    played = matrix.column(STAT_ID_GAMES_PLAYED)
+    started = matrix.column(STAT_ID_GAMES_STARTED)
+    goalie_games = matrix.column(STAT_ID_GOALIE_GAMES)
 
-    return stats_dict if stats_dict else None
+    games: list[int | None] = []
+    for gp, gs, gg, goalie in zip(played, started, goalie_games, is_goalie, strict=True):
+        if goalie:
+            games.append(int(gs) if gs > 0 else int(gg) if gg > 0 else None)
+        else:
+            games.append(None if is_missing(gp) else int(gp))
+    return games
 
 
 def get_games_played_from_yahoo(player, is_goalie: bool) -> int | None:
@@ -97,24 +142,87 @@ def get_games_played_from_yahoo(player, is_goalie: bool) -> int | None:
     Returns:
         Games played/started as integer, or None if not available
     """
-    stats = get_player_stats_from_yahoo(player, is_goalie)
+    return games_played_from_stats(get_player_stats_from_yahoo(player, is_goalie), is_goalie)
 
-    if not stats:
-        return None
 
-    if is_goalie:
-        # Try games started first (stat_id 18)
-        games = stats.get(STAT_ID_GAMES_STARTED)
-        if games is not None and games > 0:
-            return int(games)
+def _fetch_stats_chunk(yahoo_query, league_key: str, player_keys: list[str]) -> dict:
+    """
+    Fetch season stats for up to PLAYER_KEYS_PER_REQUEST players in one request.
 
-        # Fallback to goalie games (stat_id 30)
-        games = stats.get(STAT_ID_GOALIE_GAMES)
-        if games is not None and games > 0:
-            return int(games)
+    Returns:
+        Dictionary mapping player_key -> stat vector
+    """
+    url = (
+        f"https://fantasysports.yahooapis.com/fantasy/v2/league/{league_key}/players;"
+        f"player_keys={','.join(player_keys)};out=stats"
+    )
+
+    if YAHOO_RAW_PARSER:
+        players = parse_league_players(yahoo_query.get_response(url).json())
+        return {player["player_key"]: player["stats"] for player in players}
+
+    players = yahoo_query.query(url, ["league", "players"])
+    if not isinstance(players, list):
+        players = [players]
+    return {
+        str(player.player_key): get_player_stats_from_yahoo(player, is_goalie=False)
+        or stat_vector()
+        for player in players
+    }
+
+
+def fetch_player_stats_batch(
+    yahoo_query,
+    player_keys: list[str],
+    league_key: str | None = None,
+    concurrency: int = STATS_FETCH_CONCURRENCY,
+) -> StatMatrix:
+    """
+    Fetch season stats for many players with as few requests as possible.
 
-        return None
-    else:
-        # For skaters, use stat_id 0 (Games Played)
-        games = stats.get(STAT_ID_GAMES_PLAYED)
-        return int(games) if games is not None else None
+    Keys are de-duplicated and split into chunks of PLAYER_KEYS_PER_REQUEST,
+    and the chunks are requested concurrently. A failed chunk is logged and
+    its players' rows are left MISSING.
+
+    Use this only when stats aren't already in the response that lists the
+    players. Free agent pages (players;status=FA/stats), the league snapshot
+    and get_team_roster_player_stats return stats inline, so looking them up
+    again here would only add requests. Today the caller is get_current_roster
+    when it falls back to a roster endpoint without stats.
+
+    Args:
+        yahoo_query: Shared Yahoo query object
+        player_keys: Yahoo player keys (e.g., '453.p.6743')
+        league_key: Yahoo league key (defaults to the query's league)
+        concurrency: Maximum chunks requested in parallel
+
+    Returns:
+        StatMatrix with one row per unique player key
+    """
+    matrix = StatMatrix(player_keys)
+    if not matrix.keys:
+        return matrix
+
+    league_key = league_key or yahoo_query.get_league_key()
+    chunks = [
+        matrix.keys[i : i + PLAYER_KEYS_PER_REQUEST]
+        for i in range(0, len(matrix.keys), PLAYER_KEYS_PER_REQUEST)
+    ]
+
+    def fetch(chunk: list[str]) -> dict:
+        try:
+            return _fetch_stats_chunk(yahoo_query, league_key, chunk)
+        except Exception as e:
+            logger.warning(f"Failed to fetch stats for {len(chunk)} players: {e}")
+            return {}
+
+    fetched = 0
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(chunks)))) as executor:
+        for chunk_stats in executor.map(fetch, chunks):
+            for key, vector in chunk_stats.items():
+                if key in matrix:
+                    matrix.set_row(key, vector)
+                    fetched += 1
+
+    logger.info(f"Fetched stats for {fetched}/{len(matrix)} players in {len(chunks)} request(s)")
+    return matrix
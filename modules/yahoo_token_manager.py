@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Yahoo OAuth token manager with a local token cache and ahead-of-expiry refresh.
+
+Yahoo access tokens live for an hour, so the token in YAHOO_ACCESS_TOKEN_JSON
+is stale on almost every cron run. The manager:
+
+- Seeds itself from the environment token or the cache file
+  (data/yahoo_token.json), whichever is newer
+- Refreshes once, under a lock, when the token is within
+  YAHOO_TOKEN_REFRESH_MARGIN_MINUTES of expiry, so concurrent tools never race
+- Writes every refreshed token back to the cache file (owner-only permissions)
+- Optionally keeps the token fresh from a background thread, started at
+  startup so the first refresh overlaps other work
+
+The shared YahooSessionQuery takes its token from the manager, so yfpy finds
+a valid token and skips its own synchronous refresh.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOKEN_CACHE_PATH = Path(__file__).parent.parent / "data" / "yahoo_token.json"
+
+# Yahoo access tokens expire an hour after they are issued
+TOKEN_LIFETIME_SECONDS = 3600
+
+# Refresh this long before expiry (yfpy itself refreshes 1 minute before)
+YAHOO_TOKEN_REFRESH_MARGIN_MINUTES = float(os.getenv("YAHOO_TOKEN_REFRESH_MARGIN_MINUTES", "10"))
+
+# Wait before retrying a failed background refresh
+BACKGROUND_RETRY_SECONDS = 60
+
+# Yahoo OAuth2 token endpoint, and the out-of-band redirect URI the token was issued for
+TOKEN_URL = "https://api.login.yahoo.com/oauth2/get_token"
+CALLBACK_URI = "oob"
+
+
+class YahooTokenManager:
+    """
+    Keeps a Yahoo OAuth2 access token fresh.
+
+    Responsibilities:
+    - Pick the newest token from the environment and the cache file
+    - Refresh ahead of expiry, once across threads
+    - Persist refreshed tokens to the cache file
+    - Refresh in the background while a run is in progress
+    """
+
+    def __init__(
+        self,
+        consumer_key: str,
+        consumer_secret: str,
+        token_data: dict[str, Any] | None = None,
+        cache_path: Path | str | None = DEFAULT_TOKEN_CACHE_PATH,
+        refresh_margin_minutes: float = YAHOO_TOKEN_REFRESH_MARGIN_MINUTES,
+        post: Callable[..., requests.Response] = requests.post,
+    ):
+        """
+        Initialize manager.
+
+        Args:
+            consumer_key: Yahoo OAuth consumer key
+            consumer_secret: Yahoo OAuth consumer secret
+            token_data: Token from the environment (access_token, refresh_token,
+                token_time, token_type)
+            cache_path: Token cache file, or None to keep tokens in memory only
+            refresh_margin_minutes: Refresh when the token expires within this
+            post: HTTP POST function (replaceable for tests)
+        """
+        self.consumer_key = consumer_key
+        self.consumer_secret = consumer_secret
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.refresh_margin_seconds = refresh_margin_minutes * 60
+        self._post = post
+
+        self._token: dict[str, Any] = dict(token_data or {})
+        cached = self._load_cache()
+        if cached and (cached.get("token_time") or 0) > (self._token.get("token_time") or 0):
+            self._token = {**self._token, **cached}
+            logger.info(f"Using cached Yahoo token ({self.expires_in() / 60:.0f} min left)")
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def token_time(self) -> float:
+        """Unix time the current access token was issued (0 if unknown)."""
+        return float(self._token.get("token_time") or 0)
+
+    @property
+    def token(self) -> dict[str, Any]:
+        """Current token data, without refreshing."""
+        return dict(self._token)
+
+    def expires_in(self) -> float:
+        """Seconds until the current access token expires (negative if expired)."""
+        return self.token_time + TOKEN_LIFETIME_SECONDS - time.time()
+
+    def has_refresh_token(self) -> bool:
+        return bool(self._token.get("refresh_token"))
+
+    def needs_refresh(self) -> bool:
+        return not self._token.get("access_token") or (
+            self.expires_in() < self.refresh_margin_seconds
+        )
+
+    def _load_cache(self) -> dict[str, Any] | None:
+        if not self.cache_path or not self.cache_path.is_file():
+            return None
+        try:
+            cached = json.loads(self.cache_path.read_text())
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable Yahoo token cache {self.cache_path}: {e}")
+            return None
+        if cached.get("consumer_key") not in (None, self.consumer_key):
+            return None
+        return cached
+
+    def _save_cache(self) -> None:
+        if not self.cache_path:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Create owner-only before writing, since the file holds credentials
+        fd = os.open(self.cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({**self._token, "consumer_key": self.consumer_key}, f)
+
+    def refresh(self) -> dict[str, Any]:
+        """
+        Exchange the refresh token for a new access token and cache it.
+
+        Returns:
+            New token data
+
+        Raises:
+            RuntimeError: If there is no refresh token or Yahoo rejects it
+        """
+        refresh_token = self._token.get("refresh_token")
+        if not refresh_token:
+            raise RuntimeError("No Yahoo refresh token available; re-authenticate locally")
+
+        token_time = time.time()
+        response = self._post(
+            TOKEN_URL,
+            data={
+                "grant_type": "refresh_token",
+                "refresh_token": refresh_token,
+                "redirect_uri": CALLBACK_URI,
+            },
+            auth=(self.consumer_key, self.consumer_secret),
+            timeout=30,
+        )
+        if response.status_code != 200:
+            raise RuntimeError(
+                f"Yahoo token refresh failed ({response.status_code}): {response.text[:200]}"
+            )
+
+        payload = response.json()
+        self._token = {
+            **self._token,
+            "access_token": payload["access_token"],
+            "refresh_token": payload.get("refresh_token", refresh_token),
+            "token_type": payload.get("token_type", "bearer"),
+            "token_time": token_time,
+        }
+        if payload.get("xoauth_yahoo_guid"):
+            self._token["guid"] = payload["xoauth_yahoo_guid"]
+
+        self._save_cache()
+        logger.info("Refreshed Yahoo access token")
+        return dict(self._token)
+
+    def get_token(self) -> dict[str, Any]:
+        """
+        Get a token valid for at least the refresh margin, refreshing if needed.
+
+        Safe to call from multiple threads: only the first caller to find the
+        token stale refreshes it, the others wait and reuse the result.
+
+        Returns:
+            Token data (access_token, refresh_token, token_time, token_type, ...)
+        """
+        with self._lock:
+            if self.needs_refresh():
+                return self.refresh()
+            return dict(self._token)
+
+    def _refresh_loop(self) -> None:
+        delay = 0.0
+        while not self._stop.wait(delay):
+            try:
+                self.get_token()
+                delay = max(0.0, self.expires_in() - self.refresh_margin_seconds)
+            except Exception as e:
+                logger.warning(f"Background Yahoo token refresh failed: {e}")
+                delay = BACKGROUND_RETRY_SECONDS
+
+    def start(self) -> None:
+        """Start refreshing in a background thread (a no-op if already running)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._refresh_loop, name="yahoo-token-refresh", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background refresh thread."""
+        self._stop.set()
+
+
+# Manager shared by every Yahoo query in this process
+_token_manager: YahooTokenManager | None = None
+_token_manager_lock = threading.Lock()
+
+
+def get_token_manager(
+    consumer_key: str, consumer_secret: str, token_data: dict[str, Any] | None = None
+) -> YahooTokenManager:
+    """
+    Get the process-wide token manager, creating it on first use.
+
+    Args:
+        consumer_key: Yahoo OAuth consumer key
+        consumer_secret: Yahoo OAuth consumer secret
+        token_data: Token from the environment (used on creation)
+
+    Returns:
+        Shared YahooTokenManager
+    """
+    global _token_manager
+
+    with _token_manager_lock:
+        if _token_manager is None:
+            _token_manager = YahooTokenManager(consumer_key, consumer_secret, token_data)
+        return _token_manager
+
+
+def current_token_manager() -> YahooTokenManager | None:
+    """Get the process-wide token manager if one has been created."""
+    return _token_manager
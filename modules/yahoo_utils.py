@@ -2,10 +2,12 @@
 """Shared utilities for Yahoo Fantasy API tools."""
 
 import os
+import threading
 from pathlib import Path
 
 from dotenv import load_dotenv
-from yfpy.query import YahooFantasySportsQuery
+
+from modules.yahoo_session import YahooSessionQuery
 
 load_dotenv()
 
@@ -14,15 +16,19 @@ YAHOO_CLIENT_SECRET = os.getenv("YAHOO_CLIENT_SECRET")
 LEAGUE_ID = os.getenv("LEAGUE_ID")
 TEAM_ID = os.getenv("TEAM_ID")
 
+# Process-wide query shared by all tools and the prefetch phase
+_yahoo_query: YahooSessionQuery | None = None
+_yahoo_query_lock = threading.Lock()
+
 
-def initialize_yahoo_query():
-    """Initialize Yahoo Fantasy Sports Query object."""
+def _create_yahoo_query() -> YahooSessionQuery:
+    """Create a new authenticated Yahoo Fantasy Sports Query object."""
     try:
         from modules.yahoo_auth import get_yahoo_query
 
         return get_yahoo_query()
     except ImportError:
-        return YahooFantasySportsQuery(
+        return YahooSessionQuery(
             league_id=LEAGUE_ID,
             game_code="nhl",
             game_id=None,
@@ -33,6 +39,23 @@ def initialize_yahoo_query():
         )
 
 
+def initialize_yahoo_query() -> YahooSessionQuery:
+    """
+    Get the shared Yahoo Fantasy Sports Query object.
+
+    The query authenticates once per process and keeps a pool of keep-alive
+    connections, so every tool call after the first reuses both. Safe to call
+    from multiple threads.
+    """
+    global _yahoo_query
+
+    if _yahoo_query is None:
+        with _yahoo_query_lock:
+            if _yahoo_query is None:
+                _yahoo_query = _create_yahoo_query()
+    return _yahoo_query
+
+
 def extract_player_name(player) -> str:
     """Extract player name from Yahoo API player object."""
     if hasattr(player, "name"):
@@ -0,0 +1,203 @@
+"""
+Regression tests for streaming timing in find_streaming_matches.
+
+The single-pass, team x day grid implementation must pick the same timing as
+the original O(G^2) pairwise loop, which is kept below as the reference.
+"""
+
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models.game import Game
+from models.player import Player
+from models.schedule import Schedule, TeamSchedule
+from modules.streaming_engine import StreamingMatrix, TimingCache
+from tools.find_streaming_matches import _calculate_streaming_opportunity
+
+TEAMS = ["BOS", "EDM", "MTL", "NJD", "SEA", "TBL", "TOR", "VGK"]
+
+# Keys the original implementation returned
+TIMING_KEYS = (
+    "drop_date",
+    "drop_after_game_num",
+    "pickup_games_remaining",
+    "total_games",
+    "improvement",
+    "next_pickup_game",
+)
+
+
+def _pairwise_opportunity(drop_team: str, pickup_team: str, schedule: Schedule) -> dict | None:
+    """Original pairwise implementation, kept as the reference."""
+    drop_schedule = schedule.get_team_schedule(drop_team)
+    pickup_schedule = schedule.get_team_schedule(pickup_team)
+    drop_games = drop_schedule.games if drop_schedule else []
+    pickup_games = pickup_schedule.games if pickup_schedule else []
+
+    if not drop_games or not pickup_games:
+        return None
+
+    drop_total = len(drop_games)
+    pickup_total = len(pickup_games)
+
+    if pickup_total <= drop_total:
+        return None
+
+    best_timing = None
+    best_total_games = drop_total
+
+    for i, game in enumerate(drop_games):
+        drop_date = game.date
+        games_played_before_drop = i + 1
+
+        pickup_games_after_drop = [g for g in pickup_games if g.date > drop_date]
+        games_after_pickup = len(pickup_games_after_drop)
+
+        total_games = games_played_before_drop + games_after_pickup
+
+        if total_games > best_total_games:
+            best_total_games = total_games
+            best_timing = {
+                "drop_date": drop_date,
+                "drop_after_game_num": games_played_before_drop,
+                "pickup_games_remaining": games_after_pickup,
+                "total_games": total_games,
+                "improvement": total_games - drop_total,
+                "next_pickup_game": pickup_games_after_drop[0] if pickup_games_after_drop else None,
+            }
+
+    pickup_games_all = len(pickup_games)
+    if pickup_games_all > best_total_games:
+        best_total_games = pickup_games_all
+        best_timing = {
+            "drop_date": schedule.start_date,
+            "drop_after_game_num": 0,
+            "pickup_games_remaining": pickup_games_all,
+            "total_games": pickup_games_all,
+            "improvement": pickup_games_all - drop_total,
+            "next_pickup_game": pickup_games[0] if pickup_games else None,
+        }
+
+    return best_timing if best_timing else None
+
+
+def _build_schedule(start_date: str, games_by_day: list[list[tuple[str, str]]]) -> Schedule:
+    """Build a Schedule from (away, home) matchups for consecutive days."""
+    start = datetime.strptime(start_date, "%Y-%m-%d")
+    dates = [(start + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(len(games_by_day))]
+
+    games: dict[str, list[Game]] = {team: [] for team in TEAMS}
+    for date, matchups in zip(dates, games_by_day, strict=True):
+        for away, home in matchups:
+            games[away].append(Game(date=date, opponent=home, is_home=False))
+            games[home].append(Game(date=date, opponent=away, is_home=True))
+
+    return Schedule(
+        weeks=1,
+        start_date=dates[0],
+        end_date=dates[-1],
+        teams=[
+            TeamSchedule(
+                abbr=team, total=len(team_games), by_week=[len(team_games)], games=team_games
+            )
+            for team, team_games in games.items()
+            if team_games
+        ],
+    )
+
+
+def _random_schedule(rng: random.Random) -> Schedule:
+    """Random window of 1-21 days with random matchups (some teams may not play)."""
+    games_by_day = []
+    for _ in range(rng.randint(1, 21)):
+        playing = rng.sample(TEAMS, 2 * rng.randint(0, len(TEAMS) // 2))
+        games_by_day.append(list(zip(playing[::2], playing[1::2], strict=True)))
+
+    start = datetime(2025, 10, 6) + timedelta(days=rng.randint(0, 150))
+    return _build_schedule(start.strftime("%Y-%m-%d"), games_by_day)
+
+
+def _assert_matches_pairwise(schedule: Schedule) -> None:
+    timing_cache = TimingCache(StreamingMatrix(schedule))
+
+    for drop_team in TEAMS:
+        for pickup_team in TEAMS:
+            expected = _pairwise_opportunity(drop_team, pickup_team, schedule)
+            actual = _calculate_streaming_opportunity(
+                Player(name="Drop", nhl_team=drop_team),
+                Player(name="Pickup", nhl_team=pickup_team),
+                timing_cache,
+            )
+
+            if expected is None:
+                assert actual is None, (drop_team, pickup_team)
+            else:
+                assert actual is not None, (drop_team, pickup_team)
+                assert {key: actual[key] for key in TIMING_KEYS} == expected, (
+                    drop_team,
+                    pickup_team,
+                )
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_matches_pairwise_on_random_schedules(seed):
+    _assert_matches_pairwise(_random_schedule(random.Random(seed)))
+
+
+def test_ties_keep_earliest_drop():
+    # Dropping BOS after game 1 or game 2 both total 4 games; the first one wins
+    schedule = _build_schedule(
+        "2025-11-03",
+        [
+            [("BOS", "MTL")],
+            [("BOS", "MTL"), ("EDM", "TOR")],
+            [("EDM", "TOR")],
+            [("EDM", "TOR")],
+        ],
+    )
+    _assert_matches_pairwise(schedule)
+
+    timing = _calculate_streaming_opportunity(
+        Player(name="Drop", nhl_team="BOS"),
+        Player(name="Pickup", nhl_team="EDM"),
+        TimingCache(StreamingMatrix(schedule)),
+    )
+    assert timing["drop_after_game_num"] == 1
+    assert timing["total_games"] == 4
+
+
+def test_tie_with_immediate_drop_keeps_drop_player_games():
+    # Keeping BOS for its only game, then EDM's last one, ties dropping immediately
+    schedule = _build_schedule(
+        "2025-11-03",
+        [[("BOS", "MTL"), ("EDM", "TOR")], [("EDM", "TOR")]],
+    )
+    _assert_matches_pairwise(schedule)
+
+    timing = _calculate_streaming_opportunity(
+        Player(name="Drop", nhl_team="BOS"),
+        Player(name="Pickup", nhl_team="EDM"),
+        TimingCache(StreamingMatrix(schedule)),
+    )
+    assert timing["drop_after_game_num"] == 1
+    assert timing["total_games"] == 2
+
+
+def test_empty_windows():
+    # No games at all, and a window where only some teams play
+    _assert_matches_pairwise(_build_schedule("2025-12-24", [[], [], []]))
+    _assert_matches_pairwise(_build_schedule("2025-12-24", [[], [("SEA", "VGK")], []]))
+
+    timing_cache = TimingCache(StreamingMatrix(_build_schedule("2025-12-24", [[]])))
+    assert (
+        _calculate_streaming_opportunity(
+            Player(name="Drop", nhl_team="BOS"), Player(name="Pickup", nhl_team="EDM"), timing_cache
+        )
+        is None
+    )
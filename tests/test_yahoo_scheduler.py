@@ -0,0 +1,52 @@
+"""Tests for the Yahoo request scheduler."""
+
+import sys
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.yahoo_scheduler import YahooRequestScheduler
+
+URL = "https://fantasysports.yahooapis.com/fantasy/v2/league/453.l.1/players"
+
+
+class _TrackedResponse(requests.Response):
+    """Response that records whether it was closed."""
+
+    def __init__(self, status_code: int):
+        super().__init__()
+        self.status_code = status_code
+        self._content = b"{}"
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def _scheduler(max_retries: int = 4) -> YahooRequestScheduler:
+    return YahooRequestScheduler(
+        rate=1000, burst=100, max_retries=max_retries, sleep=lambda _: None
+    )
+
+
+def test_discarded_responses_are_closed_before_retry():
+    responses = [_TrackedResponse(999), _TrackedResponse(503), _TrackedResponse(200)]
+    sent = iter(responses)
+
+    result = _scheduler().send(URL, lambda: next(sent))
+
+    assert result is responses[-1]
+    assert [r.closed for r in responses] == [True, True, False]
+
+
+def test_last_failed_response_is_returned_open():
+    responses = [_TrackedResponse(503), _TrackedResponse(503)]
+    sent = iter(responses)
+
+    result = _scheduler(max_retries=1).send(URL, lambda: next(sent))
+
+    assert result is responses[-1]
+    assert responses[0].closed
+    assert not result.closed
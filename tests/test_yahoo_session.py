@@ -0,0 +1,88 @@
+"""Tests for the shared, pooled Yahoo query."""
+
+import itertools
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import requests
+from yfpy.query import YahooFantasySportsQuery
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import modules.yahoo_session as yahoo_session
+from modules.yahoo_session import YAHOO_QUERY_HISTORY, YahooSessionQuery
+
+
+def _offline_query() -> YahooSessionQuery:
+    return YahooSessionQuery(
+        league_id="12345",
+        game_code="nhl",
+        yahoo_consumer_key="key",
+        yahoo_consumer_secret="secret",
+        env_var_fallback=False,
+        offline=True,
+    )
+
+
+class _FakeSession:
+    """Session answering every GET with a minimal league response."""
+
+    def get(self, url, params=None):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"fantasy_content": {"league": {"league_key": "453.l.12345"}}}'
+        response.url = url
+        return response
+
+
+def test_executed_queries_are_bounded():
+    query = _offline_query()
+    query.offline = False
+    query.oauth = SimpleNamespace(session=_FakeSession())
+
+    for i in range(YAHOO_QUERY_HISTORY + 15):
+        query.query(f"https://fantasysports.yahooapis.com/fantasy/v2/league/{i}", ["league"])
+
+    assert len(query.executed_queries) == YAHOO_QUERY_HISTORY
+    assert query.executed_queries[-1]["url"].endswith(f"/league/{YAHOO_QUERY_HISTORY + 14}")
+
+
+def test_token_change_remounts_once_across_threads(monkeypatch):
+    manager = SimpleNamespace(
+        token_time=2.0, get_token=lambda: {"access_token": "new", "token_time": 2.0}
+    )
+
+    # Every thread looks up the manager (and sees the stale token) before any re-mounts
+    threads_ready = threading.Barrier(8)
+    lookups = itertools.count()
+
+    def current_token_manager():
+        if next(lookups) < threads_ready.parties:
+            threads_ready.wait()
+        return manager
+
+    monkeypatch.setattr(yahoo_session, "current_token_manager", current_token_manager)
+
+    authentications = []
+
+    def fake_authenticate(self):
+        authentications.append(threading.get_ident())
+        time.sleep(0.05)  # Slow OAuth session setup, while the other threads queue up
+        self.oauth = SimpleNamespace(session=requests.Session())
+
+    monkeypatch.setattr(YahooFantasySportsQuery, "_authenticate", fake_authenticate)
+
+    query = _offline_query()
+    query._session_token_time = 1.0
+
+    threads = [threading.Thread(target=query._sync_session_token) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(authentications) == 1
+    assert query._session_token_time == 2.0
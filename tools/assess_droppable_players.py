@@ -95,12 +95,12 @@ class AssessDroppablePlayers(BaseTool):
             "type": "object",
             "properties": {
                 "roster": {
-                    "type": "object",
-                    "description": "Current roster model from get_current_roster tool",
+                    "type": ["object", "string"],
+                    "description": "Current roster model from get_current_roster tool, or its handle (e.g., 'roster#1')",
                 },
                 "schedule": {
-                    "type": "object",
-                    "description": "Schedule model from get_team_schedule tool (used to calculate games played)",
+                    "type": ["object", "string"],
+                    "description": "Schedule model from get_team_schedule tool (used to calculate games played), or its handle (e.g., 'schedule#1')",
                 },
             },
             "required": ["roster", "schedule"],
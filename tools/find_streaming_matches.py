@@ -6,7 +6,9 @@ This tool takes pre-assessed droppable players and available free agents,
 then calculates the exact drop/pickup timing that maximizes total games.
 """
 
+import heapq
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any, ClassVar
 
@@ -16,10 +18,13 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from pydantic import TypeAdapter
 
 from models.player import Player
+from models.roster import Roster
 from models.schedule import Schedule
 from models.streaming import StreamingOpportunity, StreamingRecommendation
-from modules.player_utils import positions_are_compatible
-from modules.schedule_utils import calculate_games_for_player
+from modules.lineup_engine import LineupEngine
+from modules.player_utils import get_player_team_abbr
+from modules.streaming_engine import StreamingMatrix, TimingCache
+from modules.streaming_planner import MAX_ACQUISITIONS_PER_WEEK, plan_streaming_moves
 from tools.base_tool import BaseTool
 
 try:
@@ -36,85 +41,36 @@ except ImportError:
 def _calculate_streaming_opportunity(
     drop_candidate: Player,
     pickup_candidate: Player,
-    schedule: Schedule,
-    schedule_start: str,
-    schedule_end: str,
+    timing_cache: TimingCache,
 ) -> dict | None:
     """
     Calculate the optimal drop/pickup timing for a pair of players.
 
+    Timing depends only on the two teams' schedules, so it is computed once per
+    team pair and served from the run's timing cache afterwards.
+
     Args:
         drop_candidate: Player currently on roster
         pickup_candidate: Available free agent
-        schedule: Schedule model
-        schedule_start: Start date of schedule period
-        schedule_end: End date of schedule period
+        timing_cache: TimingCache for the schedule window
 
     Returns:
         Dictionary with timing info or None if not beneficial
     """
-    # Get games for both players over entire period
-    drop_games = calculate_games_for_player(drop_candidate, schedule)
-    pickup_games = calculate_games_for_player(pickup_candidate, schedule)
-
-    if not drop_games or not pickup_games:
-        return None
-
-    drop_total = len(drop_games)
-    pickup_total = len(pickup_games)
+    drop_team = get_player_team_abbr(drop_candidate)
+    pickup_team = get_player_team_abbr(pickup_candidate)
 
-    # If pickup player doesn't have more games, not worth streaming
-    if pickup_total <= drop_total:
+    if not drop_team or not pickup_team:
         return None
 
-    # Find optimal drop timing
-    # Strategy: Keep drop candidate as long as beneficial, then switch
-    best_timing = None
-    best_total_games = drop_total  # Baseline: keep drop candidate entire time
-
-    # Try each possible drop date (after each drop candidate's game)
-    for i, game in enumerate(drop_games):
-        drop_date = game.date
-        games_played_before_drop = i + 1  # Games 0 to i (inclusive)
-
-        # Count pickup candidate's games AFTER drop date
-        pickup_games_after_drop = [g for g in pickup_games if g.date > drop_date]
-        games_after_pickup = len(pickup_games_after_drop)
-
-        total_games = games_played_before_drop + games_after_pickup
-
-        if total_games > best_total_games:
-            best_total_games = total_games
-            best_timing = {
-                "drop_date": drop_date,
-                "drop_after_game_num": games_played_before_drop,
-                "pickup_games_remaining": games_after_pickup,
-                "total_games": total_games,
-                "improvement": total_games - drop_total,
-                "next_pickup_game": pickup_games_after_drop[0] if pickup_games_after_drop else None,
-            }
-
-    # Also consider dropping immediately (before first game)
-    pickup_games_all = len(pickup_games)
-    if pickup_games_all > best_total_games:
-        best_total_games = pickup_games_all
-        best_timing = {
-            "drop_date": schedule_start,  # Drop immediately
-            "drop_after_game_num": 0,
-            "pickup_games_remaining": pickup_games_all,
-            "total_games": pickup_games_all,
-            "improvement": pickup_games_all - drop_total,
-            "next_pickup_game": pickup_games[0] if pickup_games else None,
-        }
-
-    return best_timing if best_timing else None
+    return timing_cache.get_timing(drop_team, pickup_team)
 
 
 def _build_opportunity_recommendation(
     drop_player: Player,
     pickup_player: Player,
     timing: dict,
-    schedule: Schedule,
+    timing_cache: TimingCache,
 ) -> StreamingOpportunity:
     """
     Build a formatted recommendation from streaming opportunity data.
@@ -123,14 +79,13 @@ def _build_opportunity_recommendation(
         drop_player: Player being dropped
         pickup_player: Player being picked up
         timing: Timing information from _calculate_streaming_opportunity
-        schedule: Schedule model for baseline calculation
+        timing_cache: TimingCache shared with _calculate_streaming_opportunity
 
     Returns:
         StreamingOpportunity model
     """
-    # Get baseline (keeping drop player)
-    drop_games = calculate_games_for_player(drop_player, schedule)
-    baseline_games = len(drop_games)
+    # Baseline (keeping drop player) was computed alongside the timing
+    baseline_games = timing["baseline_games"]
 
     # Build reasoning
     if timing["drop_after_game_num"] == 0:
@@ -138,18 +93,14 @@ def _build_opportunity_recommendation(
     else:
         drop_timing = f"Drop {drop_player.name} on {timing['drop_date']} (after {timing['drop_after_game_num']} games played)"
 
-    next_game_info = ""
-    next_game_date = None
-    if timing["next_pickup_game"]:
-        next_game = timing["next_pickup_game"]
-        next_game_date = next_game.date
-        next_game_info = f" First game: {next_game.date} vs {next_game.opponent}"
-
-    reasoning = (
-        f"{drop_timing}, pick up {pickup_player.name} "
-        f"({timing['pickup_games_remaining']} games remaining).{next_game_info} "
-        f"Total: {timing['total_games']} games vs {baseline_games} games if kept."
+    next_game = timing["next_pickup_game"]
+    next_game_date = next_game.date if next_game else None
+
+    # Games remaining, next game, and totals only depend on the two teams
+    pickup_details = timing_cache.get_pickup_details(
+        get_player_team_abbr(drop_player), get_player_team_abbr(pickup_player), timing
     )
+    reasoning = f"{drop_timing}, pick up {pickup_player.name} {pickup_details}"
 
     return StreamingOpportunity(
         drop_player=drop_player,
@@ -165,46 +116,76 @@ def _build_opportunity_recommendation(
     )
 
 
-def _find_all_streaming_opportunities(
+def _find_top_streaming_opportunities(
     drop_candidates: list[Player],
     pickup_candidates: list[Player],
-    schedule: Schedule,
-    schedule_start: str,
-    schedule_end: str,
+    timing_cache: TimingCache,
+    max_matches: int,
 ) -> list[StreamingOpportunity]:
     """
-    Calculate all streaming opportunities between drop and pickup candidates.
+    Find the best streaming opportunities between drop and pickup candidates.
+
+    Only (drop index, pickup index, timing) tuples are kept during the scan, in
+    a heap bounded to max_matches. StreamingOpportunity models and reasoning
+    strings are built for the final top matches only.
 
     Args:
         drop_candidates: List of droppable Player models
         pickup_candidates: List of available pickup Player models
-        schedule: Schedule model
-        schedule_start: Start date of schedule period
-        schedule_end: End date of schedule period
+        timing_cache: TimingCache for the schedule window
+        max_matches: Maximum number of opportunities to return
 
     Returns:
-        List of StreamingOpportunity models
+        Top StreamingOpportunity models sorted by improvement, then total games
     """
-    opportunities = []
-
-    for drop_player in drop_candidates:
-        for pickup_player in pickup_candidates:
-            # Check position compatibility
-            if not positions_are_compatible(drop_player.position, pickup_player.position):
-                continue
 
-            # Calculate streaming timing
+    def beneficial_pairs() -> Iterator[tuple[int, int, dict]]:
+        # Evaluate every team pair at once; only compatible, improving pairs survive
+        for drop_idx, pickup_idx in timing_cache.engine.evaluate_pairs(
+            drop_candidates, pickup_candidates
+        ):
             timing = _calculate_streaming_opportunity(
-                drop_player, pickup_player, schedule, schedule_start, schedule_end
+                drop_candidates[drop_idx], pickup_candidates[pickup_idx], timing_cache
             )
-
             if timing and timing["improvement"] > 0:
-                recommendation = _build_opportunity_recommendation(
-                    drop_player, pickup_player, timing, schedule
-                )
-                opportunities.append(recommendation)
+                yield drop_idx, pickup_idx, timing
+
+    # nlargest keeps scan order for ties, matching a stable sort + slice
+    top_pairs = heapq.nlargest(
+        max_matches,
+        beneficial_pairs(),
+        key=lambda pair: (pair[2]["improvement"], pair[2]["total_games"]),
+    )
+
+    return [
+        _build_opportunity_recommendation(
+            drop_candidates[drop_idx], pickup_candidates[pickup_idx], timing, timing_cache
+        )
+        for drop_idx, pickup_idx, timing in top_pairs
+    ]
+
+
+def _add_games_started(
+    opportunities: list[StreamingOpportunity], lineup_engine: LineupEngine
+) -> None:
+    """
+    Fill in roster games started before and after each opportunity.
 
-    return opportunities
+    Args:
+        opportunities: StreamingOpportunity models to update in place
+        lineup_engine: LineupEngine for the current roster and schedule window
+    """
+    date_index = lineup_engine.matrix.date_index
+
+    for opportunity in opportunities:
+        # Pickup games count from the day after the drop, or immediately
+        first_pickup_day = (
+            date_index[opportunity.drop_date] + 1 if opportunity.drop_after_games else 0
+        )
+        opportunity.games_started_before = lineup_engine.games_started
+        opportunity.games_started_after = lineup_engine.games_started_after_swap(
+            opportunity.drop_player, opportunity.pickup_player, first_pickup_day
+        )
 
 
 def _create_summary_message(
@@ -243,29 +224,38 @@ class FindStreamingMatches(BaseTool):
 
     TOOL_DEFINITION: ClassVar[dict[str, Any]] = {
         "name": "find_streaming_matches",
-        "description": "Calculate optimal drop/pickup timing to maximize games played. For each droppable player and available free agent, determines exact date to drop/pickup and total games gained. Returns recommendations sorted by improvement. Example output: 'Drop Vatrano on Oct 15 after 3 games, pickup Lafreniere with 4 games remaining = +3 games total'. Note: When passing players, only core fields are used (player_id, name, position, eligible_positions, nhl_team, fantasy_points, status). quality_assessment is optional and ignored by this tool.",
+        "description": "Calculate optimal drop/pickup timing to maximize games played. For each droppable player and available free agent, determines exact date to drop/pickup and total games gained. Returns recommendations sorted by improvement, plus a multi-move plan that chains drops/pickups across the window within the weekly acquisition limit. Example output: 'Drop Vatrano on Oct 15 after 3 games, pickup Lafreniere with 4 games remaining = +3 games total'. Note: When passing players, only core fields are used (player_id, name, position, eligible_positions, nhl_team, fantasy_points, status). quality_assessment is optional and ignored by this tool.",
         "input_schema": {
             "type": "object",
             "properties": {
                 "droppable_players": {
-                    "type": "array",
-                    "description": "List of droppable Player models from assess_droppable_players tool. Core fields are used (player_id, name, position, eligible_positions, nhl_team, fantasy_points); quality_assessment, if present, is ignored.",
+                    "type": ["array", "string"],
+                    "description": "List of droppable Player models from assess_droppable_players tool, or its handle (e.g., 'droppable#1'). Core fields are used (player_id, name, position, eligible_positions, nhl_team, fantasy_points); quality_assessment, if present, is ignored.",
                     "items": {"type": "object"},
                 },
                 "available_players": {
-                    "type": "array",
-                    "description": "List of available free agent Player models from get_players_from_teams tool. Only include core player fields.",
+                    "type": ["array", "string"],
+                    "description": "List of available free agent Player models from get_players_from_teams tool. Only include core player fields. Prefer passing its handle (e.g., 'players#1') or a list of handles to combine several results.",
                     "items": {"type": "object"},
                 },
                 "schedule": {
-                    "type": "object",
-                    "description": "Schedule model from get_team_schedule tool",
+                    "type": ["object", "string"],
+                    "description": "Schedule model from get_team_schedule tool, or its handle (e.g., 'schedule#1')",
                 },
                 "max_matches": {
                     "type": "integer",
                     "description": "Maximum number of streaming recommendations to return (default 10)",
                     "default": 10,
                 },
+                "roster": {
+                    "type": ["object", "string"],
+                    "description": "Optional Roster model from get_current_roster (or its handle, e.g., 'roster#1'). When provided, each opportunity also reports roster games started before/after the move under daily 6F/4D/1U/2G lineup limits.",
+                },
+                "max_acquisitions_per_week": {
+                    "type": "integer",
+                    "description": "Weekly acquisition limit for the multi-move streaming plan (default 4, 0 to skip planning)",
+                    "default": 4,
+                },
             },
             "required": ["droppable_players", "available_players", "schedule"],
         },
@@ -278,6 +268,8 @@ class FindStreamingMatches(BaseTool):
         available_players: list[Player],
         schedule: Schedule,
         max_matches: int = 10,
+        max_acquisitions_per_week: int = MAX_ACQUISITIONS_PER_WEEK,
+        roster: Roster | None = None,
     ) -> StreamingRecommendation:
         """
         Calculate optimal streaming matches to maximize games played.
@@ -290,6 +282,9 @@ class FindStreamingMatches(BaseTool):
             available_players: List of Player models (or list of dicts)
             schedule: Schedule model (or dict)
             max_matches: Maximum number of recommendations to return
+            max_acquisitions_per_week: Weekly acquisition limit for the multi-move
+                plan (0 skips planning)
+            roster: Optional Roster model (or dict) for games-started counts
 
         Returns:
             StreamingRecommendation model with opportunities and analysis
@@ -301,6 +296,8 @@ class FindStreamingMatches(BaseTool):
         droppable_players = TypeAdapter(list[Player]).validate_python(droppable_players)
         available_players = TypeAdapter(list[Player]).validate_python(available_players)
         schedule = TypeAdapter(Schedule).validate_python(schedule)
+        if roster is not None:
+            roster = TypeAdapter(Roster).validate_python(roster)
 
         schedule_start = schedule.start_date
         schedule_end = schedule.end_date
@@ -310,25 +307,40 @@ class FindStreamingMatches(BaseTool):
             f"({len(droppable_players)} droppable, {len(available_players)} available)"
         )
 
-        # Find all streaming opportunities
-        opportunities = _find_all_streaming_opportunities(
+        # Timing only depends on the team pair, so share it across player pairs
+        timing_cache = TimingCache(StreamingMatrix(schedule))
+
+        # Find the best streaming opportunities, sorted by improvement (descending)
+        opportunities = _find_top_streaming_opportunities(
             droppable_players,
             available_players,
-            schedule,
-            schedule_start,
-            schedule_end,
+            timing_cache,
+            max_matches,
         )
 
-        # Sort by improvement (descending) and limit results
-        opportunities.sort(key=lambda x: (x.improvement, x.total_games), reverse=True)
-        opportunities = opportunities[:max_matches]
+        # Count games that actually fit in the daily lineup
+        if roster is not None:
+            _add_games_started(opportunities, LineupEngine(roster.players, schedule))
+
+        # Chain moves across the window under the weekly acquisition limit
+        plan = None
+        if max_acquisitions_per_week > 0:
+            plan = plan_streaming_moves(
+                droppable_players, available_players, schedule, max_acquisitions_per_week
+            )
+            logger.info(f"Streaming plan: {plan.summary}")
 
         # Create summary message
         summary = _create_summary_message(
             opportunities, len(droppable_players), len(available_players)
         )
 
-        logger.info(f"Found {len(opportunities)} streaming opportunities")
+        logger.info(
+            f"Found {len(opportunities)} streaming opportunities "
+            f"(timing cache: {timing_cache.hits} hits, {timing_cache.misses} misses; "
+            f"reasoning cache: {timing_cache.detail_hits} hits, "
+            f"{timing_cache.detail_misses} misses)"
+        )
 
         # Return validated StreamingRecommendation model
         return StreamingRecommendation(
@@ -337,6 +349,9 @@ class FindStreamingMatches(BaseTool):
             droppable_players_analyzed=len(droppable_players),
             pickup_candidates_analyzed=len(available_players),
             summary=summary,
+            timing_cache_hits=timing_cache.hits,
+            timing_cache_misses=timing_cache.misses,
+            plan=plan,
         )
 
 
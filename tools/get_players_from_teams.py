@@ -1,14 +1,21 @@
 #!/usr/bin/env python3
 """Tool to get available free agents from specific NHL teams."""
 
+import os
 import sys
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, ClassVar
 
 # Add project root to path for imports when running standalone
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from models.player import Player, PlayerPosition, PlayerStatus
+from models.player import Player, PlayerStatus
+from modules.free_agent_pool import get_free_agent_pool
+from modules.player_utils import parse_position, parse_status
+from modules.tool_logger import get_logger
+from modules.yahoo_raw_parser import YAHOO_RAW_PARSER, parse_league_players
 from modules.yahoo_utils import (
     LEAGUE_ID,
     YAHOO_CLIENT_ID,
@@ -18,6 +25,30 @@ from modules.yahoo_utils import (
 )
 from tools.base_tool import BaseTool
 
+logger = get_logger(__name__)
+
+# Yahoo returns at most 25 players per page
+FREE_AGENT_PAGE_SIZE = 25
+
+# Default number of ranked free agents scanned at most (Yahoo's actual rank)
+FREE_AGENT_FETCH_LIMIT = int(os.getenv("FREE_AGENT_FETCH_LIMIT", "200"))
+
+# Maximum free agent pages requested in parallel
+FREE_AGENT_FETCH_CONCURRENCY = int(os.getenv("FREE_AGENT_FETCH_CONCURRENCY", "4"))
+
+
+class FreeAgentList(list):
+    """
+    Players returned by get_players_from_teams.
+
+    A plain list of Player models, plus `incomplete`: why the free agent scan
+    stopped before it could cover every team (None when it completed).
+    """
+
+    def __init__(self, players=(), incomplete: str | None = None):
+        super().__init__(players)
+        self.incomplete = incomplete
+
 
 def _nhl_to_yahoo_abbr(abbr: str) -> str:
     """
@@ -43,24 +74,186 @@ def _nhl_to_yahoo_abbr(abbr: str) -> str:
     return reverse_map.get(abbr, abbr)
 
 
-def _parse_position(position_str: str | None) -> PlayerPosition | None:
-    """Parse position string to PlayerPosition enum."""
-    if not position_str:
+def _fetch_free_agent_page(yahoo_query, league_key: str, start: int) -> list:
+    """
+    Fetch one page of free agents sorted by actual rank.
+
+    Throttling and transient failures are retried by the Yahoo request
+    scheduler; anything left is raised rather than ending the scan early.
+
+    Returns:
+        Players on the page (yfpy objects, or raw player dicts when
+        YAHOO_RAW_PARSER is enabled); empty past the end of the list
+    """
+    url = (
+        f"https://fantasysports.yahooapis.com/fantasy/v2/league/{league_key}/players;"
+        f"status=FA;sort=AR;start={start};count={FREE_AGENT_PAGE_SIZE}/stats"
+    )
+    if YAHOO_RAW_PARSER:
+        return parse_league_players(yahoo_query.get_response(url).json())
+    players_batch = yahoo_query.query(url, ["league", "players"])
+    if not players_batch:
+        return []
+    return players_batch if isinstance(players_batch, list) else [players_batch]
+
+
+def _iter_free_agent_pages(
+    yahoo_query,
+    league_key: str,
+    start: int,
+    end: int,
+    concurrency: int = FREE_AGENT_FETCH_CONCURRENCY,
+) -> Generator[tuple[int, list, bool]]:
+    """
+    Stream free agent pages in rank order, requesting pages concurrently.
+
+    Pages are requested in waves of up to `concurrency` offsets and yielded in
+    offset order. The stream ends at the first short page, or once `end` is
+    reached; closing the generator stops further requests. A failed page
+    raises after the pages before it have been yielded.
+
+    Args:
+        yahoo_query: Shared Yahoo query object
+        league_key: Yahoo league key
+        start: Rank offset of the first page
+        end: Rank offset to stop before
+        concurrency: Maximum pages requested in parallel
+
+    Yields:
+        (next_start, players, is_last) for each page, players being Yahoo player
+        objects and is_last marking a short page (the end of the list)
+    """
+    wave_size = max(1, concurrency)
+
+    with ThreadPoolExecutor(max_workers=wave_size) as executor:
+        for wave_start in range(start, end, wave_size * FREE_AGENT_PAGE_SIZE):
+            wave_end = min(wave_start + wave_size * FREE_AGENT_PAGE_SIZE, end)
+            wave = range(wave_start, wave_end, FREE_AGENT_PAGE_SIZE)
+            pages = executor.map(
+                lambda offset: _fetch_free_agent_page(yahoo_query, league_key, offset), wave
+            )
+
+            for offset, page in zip(wave, pages, strict=True):
+                is_last = len(page) < FREE_AGENT_PAGE_SIZE
+                yield offset + FREE_AGENT_PAGE_SIZE, page, is_last
+                if is_last:
+                    return
+
+
+def _to_player_model(player) -> Player | None:
+    """
+    Convert a Yahoo free agent object to a Player model.
+
+    Returns:
+        Player model, or None if the player has no team
+    """
+    # Get team abbreviation (in Yahoo format)
+    yahoo_team_abbr = player.editorial_team_abbr if hasattr(player, "editorial_team_abbr") else None
+    if not yahoo_team_abbr:
         return None
-    try:
-        return PlayerPosition(position_str)
-    except ValueError:
+
+    player_name = extract_player_name(player)
+
+    # Parse position
+    position_value = None
+    if hasattr(player, "primary_position"):
+        position_value = player.primary_position
+    elif hasattr(player, "display_position"):
+        position_value = player.display_position
+
+    # Parse eligible positions
+    eligible_positions_raw = []
+    if hasattr(player, "eligible_positions") and player.eligible_positions:
+        pos = player.eligible_positions
+        eligible_positions_raw = pos if isinstance(pos, list) else [pos]
+        if not position_value and eligible_positions_raw:
+            position_value = eligible_positions_raw[0]
+
+    # Convert to enums
+    position_enum = parse_position(position_value)
+    eligible_positions = [parse_position(p) for p in eligible_positions_raw if parse_position(p)]
+
+    # Parse fantasy points
+    fantasy_points = 0.0
+    if (
+        hasattr(player, "player_points")
+        and player.player_points
+        and hasattr(player.player_points, "total")
+        and player.player_points.total
+    ):
+        fantasy_points = float(player.player_points.total)
+
+    # Parse status
+    status_str = player.status if hasattr(player, "status") else None
+    status = parse_status(status_str)
+    is_injured = status != PlayerStatus.HEALTHY
+
+    return Player(
+        player_id=str(player.player_id) if hasattr(player, "player_id") else None,
+        name=player_name,
+        position=position_enum,
+        eligible_positions=eligible_positions,
+        selected_position=None,  # Free agents don't have a roster slot
+        nhl_team=yahoo_team_abbr,  # Store Yahoo format (what API returns)
+        fantasy_points=fantasy_points,
+        status=status,
+        is_injured=is_injured,
+    )
+
+
+def _raw_to_player_model(player: dict[str, Any]) -> Player | None:
+    """
+    Convert a free agent parsed by yahoo_raw_parser to a Player model.
+
+    Mirrors _to_player_model field for field.
+
+    Returns:
+        Player model, or None if the player has no team
+    """
+    yahoo_team_abbr = player["editorial_team_abbr"]
+    if not yahoo_team_abbr:
         return None
 
+    eligible_positions_raw = player["eligible_positions"]
+    position_value = player["primary_position"]
+    if not position_value and eligible_positions_raw:
+        position_value = eligible_positions_raw[0]
+
+    status = parse_status(player["status"])
+    player_id = player["player_id"]
+
+    return Player(
+        player_id=str(player_id) if player_id is not None else None,
+        name=player["name"] or "Unknown",
+        position=parse_position(position_value),
+        eligible_positions=[parse_position(p) for p in eligible_positions_raw if parse_position(p)],
+        selected_position=None,  # Free agents don't have a roster slot
+        nhl_team=yahoo_team_abbr,  # Store Yahoo format (what API returns)
+        fantasy_points=player["fantasy_points"],
+        status=status,
+        is_injured=status != PlayerStatus.HEALTHY,
+    )
+
+
+def _stream_free_agents(start: int, end: int) -> Generator[tuple[int, list[Player], bool]]:
+    """
+    Stream ranked free agent pages parsed into Player models.
+
+    Args:
+        start: Rank offset of the first page
+        end: Rank offset to stop before
+
+    Yields:
+        (next_start, players, is_last) for each page; players without a team
+        are skipped, so is_last (not the player count) marks the end of the list
+    """
+    yahoo_query = initialize_yahoo_query()
+    league_key = yahoo_query.get_league_key()
 
-def _parse_status(status_str: str | None) -> PlayerStatus:
-    """Parse status string to PlayerStatus enum."""
-    if not status_str or status_str == "" or status_str == "Healthy":
-        return PlayerStatus.HEALTHY
-    try:
-        return PlayerStatus(status_str)
-    except ValueError:
-        return PlayerStatus.HEALTHY
+    to_player_model = _raw_to_player_model if YAHOO_RAW_PARSER else _to_player_model
+    for next_start, page, is_last in _iter_free_agent_pages(yahoo_query, league_key, start, end):
+        players = (to_player_model(player) for player in page)
+        yield next_start, [player for player in players if player], is_last
 
 
 class GetPlayersFromTeams(BaseTool):
@@ -68,7 +261,7 @@ class GetPlayersFromTeams(BaseTool):
 
     TOOL_DEFINITION: ClassVar[dict[str, Any]] = {
         "name": "get_players_from_teams",
-        "description": "Fetch top available free agents from specific NHL teams. Returns top N players per team sorted by fantasy points. Use this after get_team_schedule to target players on teams with favorable schedules. Example: get_players_from_teams(teams=['TOR', 'EDM', 'BOS'], limit_per_team=5) returns top 5 FAs from each team.",
+        "description": "Fetch top available free agents from specific NHL teams. Returns top N players per team sorted by fantasy points. Use this after get_team_schedule to target players on teams with favorable schedules. Example: get_players_from_teams(teams=['TOR', 'EDM', 'BOS'], limit_per_team=5) returns top 5 FAs from each team. If the result has an 'incomplete' note, some free agent pages could not be fetched and teams may be missing players.",
         "input_schema": {
             "type": "object",
             "properties": {
@@ -82,148 +275,79 @@ class GetPlayersFromTeams(BaseTool):
                     "description": "Number of top players to fetch per team sorted by fantasy points (default 5)",
                     "default": 5,
                 },
+                "position": {
+                    "type": "string",
+                    "enum": ["C", "LW", "RW", "D", "G"],
+                    "description": "Optional position filter (e.g., 'D' for defensemen eligible players only)",
+                },
+                "max_fetch": {
+                    "type": "integer",
+                    "description": "Maximum number of ranked free agents to scan (default 200). Raise it for deep leagues where the top 200 doesn't cover every team.",
+                },
             },
             "required": ["teams"],
         },
     }
 
     @classmethod
-    def run(cls, teams: list[str], limit_per_team: int = 5) -> list[Player]:
+    def run(
+        cls,
+        teams: list[str],
+        limit_per_team: int = 5,
+        position: str | None = None,
+        max_fetch: int | None = None,
+    ) -> FreeAgentList:
         """
         Get available free agents from specific NHL teams.
 
+        Ranked free agent pages stream into the run's pool (seeded from a fresh
+        on-disk snapshot when FREE_AGENT_POOL_PERSIST is enabled) only until
+        every requested team has limit_per_team players, so narrow requests
+        stop early and repeated calls reuse what was already fetched. If a page
+        still fails after the request scheduler's retries, the players already
+        in the pool are returned and the result is flagged incomplete.
+
         Args:
             teams: List of NHL team abbreviations (e.g., ['TOR', 'EDM', 'BOS'])
             limit_per_team: Number of top players per team (default 5)
+            position: Optional position filter (e.g., 'D')
+            max_fetch: Maximum ranked free agents to scan (defaults to
+                FREE_AGENT_FETCH_LIMIT env var, or 200)
 
         Returns:
-            List of Player models sorted by fantasy points (descending)
-
-        Raises:
-            Exception: If API fetch fails
+            FreeAgentList of Player models sorted by fantasy points (descending)
         """
-        yahoo_query = initialize_yahoo_query()
-        league_key = yahoo_query.get_league_key()
-
-        # Convert NHL API team abbreviations to Yahoo format for filtering
-        # Create a mapping to track which teams we're looking for
-        yahoo_teams = set()
-        team_mapping = {}  # Maps Yahoo format -> NHL API format for results
-        for team in teams:
-            yahoo_abbr = _nhl_to_yahoo_abbr(team)
-            yahoo_teams.add(yahoo_abbr)
-            team_mapping[yahoo_abbr] = team
-
-        # Fetch all available players
-        # Yahoo API doesn't support filtering by team in the request,
-        # so we fetch in batches and filter client-side
-        all_players = []
-        batch_size = 25
-        current_start = 0
-        max_total_fetch = 200  # Reasonable upper bound to avoid infinite loops
-
-        # Fetch players in batches
-        while len(all_players) < max_total_fetch:
-            url = (
-                f"https://fantasysports.yahooapis.com/fantasy/v2/league/{league_key}/players;"
-                f"status=FA;sort=AR;start={current_start};count={batch_size}/stats"
-            )
-
-            try:
-                players_batch = yahoo_query.query(url, ["league", "players"])
-
-                if isinstance(players_batch, list):
-                    all_players.extend(players_batch)
-                    if len(players_batch) < batch_size:
-                        break
-                else:
-                    all_players.append(players_batch)
-                    break
-
-                current_start += batch_size
-            except Exception:
-                break
-
-        # Convert to Player models and filter by team
-        players_by_team: dict[str, list[Player]] = {team: [] for team in teams}
-
-        for player in all_players:
-            # Get team abbreviation (in Yahoo format)
-            yahoo_team_abbr = (
-                player.editorial_team_abbr if hasattr(player, "editorial_team_abbr") else None
+        # Yahoo API doesn't support filtering by team in the request, so ranked
+        # pages are scanned into the pool and indexed by (Yahoo format) team
+        pool = get_free_agent_pool(league_id=LEAGUE_ID)
+        position_enum = parse_position(position)
+        yahoo_teams = [_nhl_to_yahoo_abbr(team) for team in teams]
+
+        incomplete = None
+        try:
+            pool.fetch_until(
+                _stream_free_agents,
+                lambda: all(
+                    pool.count(team=team, position=position_enum) >= limit_per_team
+                    for team in yahoo_teams
+                ),
+                max_fetch or FREE_AGENT_FETCH_LIMIT,
             )
-            if not yahoo_team_abbr or yahoo_team_abbr not in yahoo_teams:
-                continue
-
-            # Get the NHL API format team abbreviation for organizing results
-            nhl_team_abbr = team_mapping[yahoo_team_abbr]
-
-            player_name = extract_player_name(player)
-
-            # Parse position
-            position_value = None
-            if hasattr(player, "primary_position"):
-                position_value = player.primary_position
-            elif hasattr(player, "display_position"):
-                position_value = player.display_position
-
-            # Parse eligible positions
-            eligible_positions_raw = []
-            if hasattr(player, "eligible_positions") and player.eligible_positions:
-                pos = player.eligible_positions
-                eligible_positions_raw = pos if isinstance(pos, list) else [pos]
-                if not position_value and eligible_positions_raw:
-                    position_value = eligible_positions_raw[0]
-
-            # Convert to enums
-            position_enum = _parse_position(position_value)
-            eligible_positions = [
-                _parse_position(p) for p in eligible_positions_raw if _parse_position(p)
-            ]
-
-            # Parse fantasy points
-            fantasy_points = 0.0
-            if (
-                hasattr(player, "player_points")
-                and player.player_points
-                and hasattr(player.player_points, "total")
-                and player.player_points.total
-            ):
-                fantasy_points = float(player.player_points.total)
-
-            # Parse status
-            status_str = player.status if hasattr(player, "status") else None
-            status = _parse_status(status_str)
-            is_injured = status != PlayerStatus.HEALTHY
-
-            # Create Player model
-            player_model = Player(
-                player_id=str(player.player_id) if hasattr(player, "player_id") else None,
-                name=player_name,
-                position=position_enum,
-                eligible_positions=eligible_positions,
-                selected_position=None,  # Free agents don't have a roster slot
-                nhl_team=yahoo_team_abbr,  # Store Yahoo format (what API returns)
-                fantasy_points=fantasy_points,
-                status=status,
-                is_injured=is_injured,
-            )
-
-            players_by_team[nhl_team_abbr].append(player_model)
+        except Exception as e:
+            # Serve the pages already in the pool rather than failing the whole tool
+            incomplete = f"Free agent scan stopped at rank {pool.next_start}: {e}"
+            logger.warning(incomplete)
 
-        # Get top N per team and combine
         result_players = []
-        for team in teams:
-            team_players = players_by_team[team]
-            # Sort by fantasy points descending
-            team_players.sort(key=lambda p: p.fantasy_points, reverse=True)
-            # Take top N
-            result_players.extend(team_players[:limit_per_team])
+        for team in yahoo_teams:
+            result_players.extend(
+                pool.get_players(team=team, position=position_enum, limit=limit_per_team)
+            )
 
         # Sort final list by fantasy points
         result_players.sort(key=lambda p: p.fantasy_points, reverse=True)
 
-        return result_players
+        return FreeAgentList(result_players, incomplete)
 
 
 def display_players_by_team(players: list[Player]):
@@ -10,9 +10,16 @@ from typing import Any, ClassVar
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from models.league import LeagueContext
-from models.player import Player, PlayerPosition, PlayerStatus, RosterSlot
+from models.player import Player, PlayerPosition, PlayerStatus
 from models.roster import Roster, RosterCounts
-from modules.yahoo_stats_fetcher import get_games_played_from_yahoo
+from modules.league_snapshot import get_league_snapshot
+from modules.player_utils import parse_position, parse_roster_slot, parse_status
+from modules.tool_logger import get_logger
+from modules.yahoo_stats_fetcher import (
+    fetch_player_stats_batch,
+    games_played_from_matrix,
+    get_games_played_from_yahoo,
+)
 from modules.yahoo_utils import (
     LEAGUE_ID,
     TEAM_ID,
@@ -26,36 +33,7 @@ from modules.yahoo_utils import (
 )
 from tools.base_tool import BaseTool
 
-
-def _parse_position(position_str: str | None) -> PlayerPosition | None:
-    """Parse position string to PlayerPosition enum."""
-    if not position_str:
-        return None
-    try:
-        return PlayerPosition(position_str)
-    except ValueError:
-        return None
-
-
-def _parse_roster_slot(slot_str: str | None) -> RosterSlot | None:
-    """Parse roster slot string to RosterSlot enum."""
-    if not slot_str:
-        return None
-    try:
-        return RosterSlot(slot_str)
-    except ValueError:
-        return None
-
-
-def _parse_status(status_str: str | None) -> PlayerStatus:
-    """Parse status string to PlayerStatus enum."""
-    if not status_str or status_str == "" or status_str == "Healthy":
-        return PlayerStatus.HEALTHY
-    try:
-        return PlayerStatus(status_str)
-    except ValueError:
-        # Default to HEALTHY if status is unknown
-        return PlayerStatus.HEALTHY
+logger = get_logger(__name__)
 
 
 def _convert_roster_to_players(roster: list) -> list[Player]:
@@ -68,21 +46,21 @@ def _convert_roster_to_players(roster: list) -> list[Player]:
         fantasy_points = extract_player_fantasy_points(player)
 
         # Parse position
-        position = _parse_position(position_info["position"])
+        position = parse_position(position_info["position"])
 
         # Parse eligible positions
         eligible_positions = []
         for pos_str in position_info.get("eligible_positions", []):
-            pos = _parse_position(pos_str)
+            pos = parse_position(pos_str)
             if pos:
                 eligible_positions.append(pos)
 
         # Parse selected position (roster slot)
-        selected_position = _parse_roster_slot(position_info.get("selected_position"))
+        selected_position = parse_roster_slot(position_info.get("selected_position"))
 
         # Parse status
         status_str = player.status if hasattr(player, "status") else None
-        status = _parse_status(status_str)
+        status = parse_status(status_str)
         is_injured = status != PlayerStatus.HEALTHY
 
         # Extract games played from Yahoo player stats
@@ -107,24 +85,21 @@ def _convert_roster_to_players(roster: list) -> list[Player]:
     return players
 
 
-def _calculate_roster_counts(players: list[Player]) -> RosterCounts:
-    """Calculate roster statistics by position and status."""
-    forward_positions = [
-        PlayerPosition.CENTER,
-        PlayerPosition.LEFT_WING,
-        PlayerPosition.RIGHT_WING,
-        PlayerPosition.FORWARD,
-    ]
-
-    return RosterCounts(
-        total=len(players),
-        forwards=len([p for p in players if p.position in forward_positions]),
-        defense=len([p for p in players if p.position == PlayerPosition.DEFENSE]),
-        goalies=len([p for p in players if p.position == PlayerPosition.GOALIE]),
-        active=len([p for p in players if p.is_active()]),
-        bench=len([p for p in players if p.selected_position == RosterSlot.BENCH]),
-        injured_reserve=len([p for p in players if p.is_on_ir()]),
-    )
+def _backfill_games_played(yahoo_query, roster: list, players: list[Player]) -> None:
+    """Fill in games played from one batched stats fetch (for rosters fetched without stats)."""
+    models_by_key = {
+        str(player.player_key): player_model
+        for player, player_model in zip(roster, players, strict=True)
+        if getattr(player, "player_key", None)
+    }
+    matrix = fetch_player_stats_batch(yahoo_query, list(models_by_key))
+
+    is_goalie = [models_by_key[key].is_goalie() for key in matrix.keys]
+    for key, games_played in zip(
+        matrix.keys, games_played_from_matrix(matrix, is_goalie), strict=True
+    ):
+        if games_played:
+            models_by_key[key].games_played = games_played
 
 
 def _convert_league_context(league_info: dict) -> LeagueContext:
@@ -163,6 +138,10 @@ class GetCurrentRoster(BaseTool):
         """
         Get the current roster for a team.
 
+        The roster comes from the run's league snapshot (every team's roster
+        and the league metadata in one request). If the snapshot can't be
+        fetched, the team's roster is requested on its own.
+
         Args:
             team_id: Yahoo team ID (defaults to user's team)
 
@@ -176,16 +155,27 @@ class GetCurrentRoster(BaseTool):
 
         if team_id is None:
             team_id = int(TEAM_ID) if TEAM_ID else None
-            if not team_id:
-                teams = yahoo_query.get_league_teams()
-                if teams and len(teams) > 0:
-                    team_id = teams[0].team_id
+
+        try:
+            roster = get_league_snapshot(yahoo_query).get_roster(team_id)
+            if roster is not None:
+                return roster
+            logger.warning(f"Team {team_id} not in league snapshot, fetching its roster")
+        except Exception as e:
+            logger.warning(f"League snapshot unavailable ({e}), fetching roster directly")
+
+        if not team_id:
+            teams = yahoo_query.get_league_teams()
+            if teams and len(teams) > 0:
+                team_id = teams[0].team_id
 
         # Try multiple API endpoints (Yahoo API can be inconsistent)
         roster = None
+        has_stats = True
         try:
             roster = yahoo_query.get_team_roster_player_stats(team_id)
         except Exception:
+            has_stats = False
             try:
                 roster = yahoo_query.get_team_roster_player_info_by_week(team_id)
             except Exception:
@@ -195,12 +185,14 @@ class GetCurrentRoster(BaseTool):
         league_info = get_league_context_info(yahoo_query)
         league_context = _convert_league_context(league_info)
         players = _convert_roster_to_players(roster)
+        if not has_stats:
+            _backfill_games_played(yahoo_query, roster, players)
 
         # Sort by fantasy points (descending)
         players.sort(key=lambda p: p.fantasy_points, reverse=True)
 
         # Calculate roster statistics
-        roster_counts = _calculate_roster_counts(players)
+        roster_counts = RosterCounts.from_players(players)
 
         # Return validated Roster model
         return Roster(
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Tool to get NHL team game schedules for next 2 weeks."""
 
+import os
 import sys
 from collections import defaultdict
 from datetime import datetime
@@ -12,7 +13,11 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from models.game import Game
 from models.schedule import Schedule, TeamSchedule, WeekInfo
+from modules.http_cache import get_http_cache, install_nhl_cache
+from modules.schedule_fetchers import ScheduleFetchStrategy, select_fetch_strategy
+from modules.schedule_store import ScheduleStore
 from modules.schedule_utils import get_date_range_from_boundaries, get_fantasy_week_boundaries
+from modules.team_utils import NHL_TEAMS
 from modules.tool_logger import get_logger
 from tools.base_tool import BaseTool
 
@@ -25,41 +30,8 @@ try:
 except ImportError:
     NHL_API_AVAILABLE = False
 
-# NHL team abbreviation to full name mapping
-NHL_TEAMS = {
-    "ANA": "Anaheim Ducks",
-    "BOS": "Boston Bruins",
-    "BUF": "Buffalo Sabres",
-    "CAR": "Carolina Hurricanes",
-    "CBJ": "Columbus Blue Jackets",
-    "CGY": "Calgary Flames",
-    "CHI": "Chicago Blackhawks",
-    "COL": "Colorado Avalanche",
-    "DAL": "Dallas Stars",
-    "DET": "Detroit Red Wings",
-    "EDM": "Edmonton Oilers",
-    "FLA": "Florida Panthers",
-    "LAK": "Los Angeles Kings",
-    "MIN": "Minnesota Wild",
-    "MTL": "Montreal Canadiens",
-    "NJD": "New Jersey Devils",
-    "NSH": "Nashville Predators",
-    "NYI": "New York Islanders",
-    "NYR": "New York Rangers",
-    "OTT": "Ottawa Senators",
-    "PHI": "Philadelphia Flyers",
-    "PIT": "Pittsburgh Penguins",
-    "SEA": "Seattle Kraken",
-    "SJS": "San Jose Sharks",
-    "STL": "St. Louis Blues",
-    "TBL": "Tampa Bay Lightning",
-    "TOR": "Toronto Maple Leafs",
-    "UTA": "Utah Hockey Club",
-    "VAN": "Vancouver Canucks",
-    "VGK": "Vegas Golden Knights",
-    "WPG": "Winnipeg Jets",
-    "WSH": "Washington Capitals",
-}
+# Maximum number of schedule requests in flight at once
+SCHEDULE_FETCH_CONCURRENCY = int(os.getenv("NHL_SCHEDULE_CONCURRENCY", "8"))
 
 
 class GetTeamSchedule(BaseTool):
@@ -68,7 +40,7 @@ class GetTeamSchedule(BaseTool):
     # Tool definition for Claude Agent SDK
     TOOL_DEFINITION: ClassVar[dict[str, Any]] = {
         "name": "get_team_schedule",
-        "description": "Get the number of games each NHL team plays starting from TODAY through the end of the next N-1 fantasy weeks (Monday-Sunday). Returns a token-optimized structure with team abbreviations, game counts by week, and game details (date, opponent, home/away). Essential for weekly fantasy matchups as teams with more games = more points. Week 1 = rest of current week (today -> Sunday), Week 2+ = full weeks. Format: {weeks: int, teams: [{abbr: str, total: int, by_week: [int], games: [{date: str, opp: str, h: bool}]}]}",
+        "description": "Get the number of games each NHL team plays starting from TODAY through the end of the next N-1 fantasy weeks (Monday-Sunday). Returns a token-optimized structure with team abbreviations, game counts by week, and game details (date, opponent, home/away). Dates in missing_dates could not be fetched, so their games are unknown. Essential for weekly fantasy matchups as teams with more games = more points. Week 1 = rest of current week (today -> Sunday), Week 2+ = full weeks. Format: {weeks: int, teams: [{abbr: str, total: int, by_week: [int], games: [{date: str, opp: str, h: bool}]}]}",
         "input_schema": {
             "type": "object",
             "properties": {
@@ -83,29 +55,40 @@ class GetTeamSchedule(BaseTool):
     }
 
     @classmethod
-    def run(cls, weeks: int = 2) -> Schedule:
+    def run(
+        cls,
+        weeks: int = 2,
+        max_concurrency: int | None = None,
+        use_store: bool = True,
+        fetch_strategy: ScheduleFetchStrategy | None = None,
+    ) -> Schedule:
         """
         Get number of games each NHL team plays starting from today through specified fantasy weeks.
 
+        Games are served from the on-disk schedule store; only dates that are
+        missing or stale are fetched from the NHL API, concurrently, using
+        whichever fetch strategy needs the fewest requests. If nhl-api-py is
+        missing or a fetch fails, previously stored games are used instead, and
+        dates with no stored games are reported in Schedule.missing_dates
+        rather than counted as days without games.
+
         Args:
             weeks: Number of fantasy weeks to include (default 2)
                    Week 1 = rest of current week (today -> Sunday)
                    Week 2+ = full fantasy weeks (Monday -> Sunday)
+            max_concurrency: Maximum concurrent NHL API requests
+                   (defaults to NHL_SCHEDULE_CONCURRENCY env var, or 8)
+            use_store: If True, read and update the persistent schedule store
+            fetch_strategy: Strategy used to fetch missing dates
+                   (defaults to the cheapest one for the dates being fetched)
 
         Returns:
             Schedule object with validated TeamSchedule models, starting from today's date
 
         Raises:
-            Exception: If NHL API is not available or fetch fails
+            ImportError: If nhl-api-py is not installed and nothing is stored
+            RuntimeError: If no date in the window could be fetched or served
         """
-        if not NHL_API_AVAILABLE:
-            raise ImportError(
-                "nhl-api-py library is not installed. Install with: pip install nhl-api-py"
-            )
-
-        # Initialize NHL API client
-        client = NHLClient()
-
         # Get fantasy week boundaries (Monday-Sunday)
         start_date, end_date, week_boundaries = get_fantasy_week_boundaries(weeks)
         dates = get_date_range_from_boundaries(start_date, end_date)
@@ -126,57 +109,88 @@ class GetTeamSchedule(BaseTool):
             lambda: {"total_games": 0, "games_by_week": [0] * weeks, "games": []}
         )
 
-        logger.info(
-            f"Fetching NHL schedules from {start_date.strftime('%Y-%m-%d')} (today) to {end_date.strftime('%Y-%m-%d')} (fantasy weeks: Monday-Sunday)"
-        )
+        start_str = start_date.strftime("%Y-%m-%d")
+        end_str = end_date.strftime("%Y-%m-%d")
 
-        # Fetch schedule for each date
-        for date_str in dates:
-            try:
-                # Determine which fantasy week this date belongs to
-                date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-                week_num = 0
-                for i, (week_start, week_end) in enumerate(week_boundaries):
-                    if week_start <= date_obj <= week_end:
-                        week_num = i + 1
-                        break
-
-                # Get daily schedule
-                schedule_data = client.schedule.daily_schedule(date=date_str)
-
-                if not schedule_data or "games" not in schedule_data:
-                    continue
-
-                # Process each game
-                for game in schedule_data.get("games", []):
-                    # Extract team information
-                    away_team = game.get("awayTeam", {})
-                    home_team = game.get("homeTeam", {})
-
-                    away_abbr = away_team.get("abbrev", "")
-                    home_abbr = home_team.get("abbrev", "")
-
-                    # Skip if team info is missing
-                    if not away_abbr or not home_abbr:
-                        continue
-
-                    # Add game for away team
-                    team_games[away_abbr]["total_games"] += 1
-                    team_games[away_abbr]["games_by_week"][week_num - 1] += 1
-                    team_games[away_abbr]["games"].append(
-                        Game(date=date_str, opponent=home_abbr, is_home=False)
-                    )
-
-                    # Add game for home team
-                    team_games[home_abbr]["total_games"] += 1
-                    team_games[home_abbr]["games_by_week"][week_num - 1] += 1
-                    team_games[home_abbr]["games"].append(
-                        Game(date=date_str, opponent=away_abbr, is_home=True)
-                    )
+        store = ScheduleStore() if use_store else None
+        fetch_dates = store.get_stale_dates(dates) if store else dates
+
+        games_by_date = {}
+        if fetch_dates and not NHL_API_AVAILABLE:
+            logger.warning(
+                "nhl-api-py library is not installed; serving stored schedule only. "
+                "Install with: pip install nhl-api-py"
+            )
+        elif fetch_dates:
+            strategy = fetch_strategy or select_fetch_strategy(fetch_dates)
+            logger.info(
+                f"Fetching NHL schedules for {len(fetch_dates)} of {len(dates)} dates from {start_str} (today) to {end_str} (fantasy weeks: Monday-Sunday) "
+                f"using {strategy.name} strategy ({strategy.estimate_requests(fetch_dates)} requests)"
+            )
 
+            try:
+                # Initialize NHL API client
+                client = NHLClient()
+                http_cache = get_http_cache()
+                if http_cache.enabled:
+                    install_nhl_cache(client, http_cache)
+                games_by_date = strategy.fetch(
+                    client, fetch_dates, max_concurrency or SCHEDULE_FETCH_CONCURRENCY
+                )
             except Exception as e:
-                logger.warning(f"Error fetching schedule for {date_str}: {e}")
-                continue
+                logger.warning(f"Error fetching NHL schedules, serving stored schedule: {e}")
+        else:
+            logger.info(f"Serving NHL schedules from {start_str} to {end_str} from schedule store")
+
+        if store:
+            store.save_games(games_by_date)
+            game_rows = store.get_games(start_str, end_str)
+            known_dates = store.get_stored_dates(dates)
+        else:
+            game_rows = [
+                (date_str, away_abbr, home_abbr)
+                for date_str in dates
+                for away_abbr, home_abbr in games_by_date.get(date_str, [])
+            ]
+            known_dates = set(games_by_date)
+
+        # Dates never fetched successfully have unknown games, not zero games
+        missing_dates = [date_str for date_str in dates if date_str not in known_dates]
+        if len(missing_dates) == len(dates):
+            if not NHL_API_AVAILABLE:
+                raise ImportError(
+                    "nhl-api-py library is not installed. Install with: pip install nhl-api-py"
+                )
+            raise RuntimeError(f"Could not fetch NHL schedules from {start_str} to {end_str}")
+        if missing_dates:
+            logger.warning(
+                f"No NHL schedule available for {len(missing_dates)} dates: "
+                f"{', '.join(missing_dates)}"
+            )
+
+        # Merge results in date order
+        for date_str, away_abbr, home_abbr in game_rows:
+            # Determine which fantasy week this date belongs to
+            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
+            week_num = 0
+            for i, (week_start, week_end) in enumerate(week_boundaries):
+                if week_start <= date_obj <= week_end:
+                    week_num = i + 1
+                    break
+
+            # Add game for away team
+            team_games[away_abbr]["total_games"] += 1
+            team_games[away_abbr]["games_by_week"][week_num - 1] += 1
+            team_games[away_abbr]["games"].append(
+                Game(date=date_str, opponent=home_abbr, is_home=False)
+            )
+
+            # Add game for home team
+            team_games[home_abbr]["total_games"] += 1
+            team_games[home_abbr]["games_by_week"][week_num - 1] += 1
+            team_games[home_abbr]["games"].append(
+                Game(date=date_str, opponent=away_abbr, is_home=True)
+            )
 
         # Convert to TeamSchedule models
         teams = []
@@ -202,10 +216,11 @@ class GetTeamSchedule(BaseTool):
         # Return validated Schedule model
         return Schedule(
             weeks=weeks,
-            start_date=start_date.strftime("%Y-%m-%d"),
-            end_date=end_date.strftime("%Y-%m-%d"),
+            start_date=start_str,
+            end_date=end_str,
             week_info=week_info_list,
             teams=teams,
+            missing_dates=missing_dates,
         )
 
 